@@ -1,11 +1,24 @@
 from .galoisField import GaloisField
+from .primeField import PrimeField
+from .coefficientDomain import CoefficientDomain, RationalDomain, IntegerDomain, RealDomain, ComplexDomain, GaloisFieldDomain, coefficientDomain
 from .polynomial import Polynomial
+from .polynomialBuilder import PolynomialBuilder
 from .rational import rational
 from .rationalFunction import RationalFunction
 from .ideal import Ideal
 from .monomial import Monomial
-from .monomialOrders import leadingCoefficient, leadingMonomial, lexOrder, gradedLexOrder
+from .packedMonomial import PackedMonomial, VariableLayout
+from .polynomialRing import PolynomialRing
+from .monomialOrders import leadingCoefficient, leadingMonomial, monomialSortKey, MonomialOrder, LexOrder, GradedLexOrder, GradedRevLexOrder, WeightedOrder, MatrixOrder, BlockOrder, EliminationOrder, lexOrder, gradedLexOrder, gradedRevLexOrder
 from .varieties import rationalImplicitization, polynomialImplicitization, plotVariety_2D, plotVariety_3D
 from .solver import findRoots, solveSystem, characteristicEquations
 from .polynomialMethods import ZERO, zero, one, defineVariable, elementarySymetricPolynomial, embed, powerSumPolynomial, polynomialGCD, polynomialLCM, derivative, squareFreePart, findIrreduciblePolynomial
-from .groebnerBasis import getGroebnerBasis, polynomialReduce, syzygy
\ No newline at end of file
+from .groebnerBasis import getGroebnerBasis, polynomialReduce, syzygy, BuchbergerEngine
+from .modularGroebner import modularGroebnerBasis
+from .f4 import F4Engine, MacaulayMatrix
+from .signatureGroebner import SignatureEngine
+from .fglm import fglm, isZeroDimensional, multiplicationMatrices, standardMonomials
+from .groebnerWalk import groebnerWalk, orderMatrix
+from .hilbert import HilbertDrivenEngine, hilbertNumerator, monomialHilbertNumerator, hilbertFunction, homogenize, dehomogenize, isHomogeneous
+from .parallelGroebner import ParallelBuchbergerEngine, serializePolynomial, deserializePolynomial
+from .groebnerTrace import GroebnerTrace, TracingBuchbergerEngine, traceGroebnerBasis
@@ -0,0 +1,477 @@
+import heapq
+from itertools import islice
+from math import gcd
+from typing import Callable
+from tqdm import tqdm
+from .polynomial import Polynomial, Monomial
+from .rational import rational
+from .coefficientDomain import CoefficientDomain, IntegerDomain
+from .monomialOrders import lexOrder, leadingMonomial, leadingCoefficient, monomialSortKey
+from .polynomialAccumulator import PolynomialAccumulator
+
+INTEGERS = IntegerDomain()
+
+
+def primitivePart(f: Polynomial) -> Polynomial:
+    """
+    Returns
+    -------
+    The polynomial f over rational or int multiplied by a positive rational to a polynomial over the integers (IntegerDomain) with coprime coefficients.
+
+    Raises
+    ------
+    ValueError: If f is not over rational or int.
+    """
+    if f.field not in (int, rational):
+        raise ValueError("Fraction-free arithmetic needs polynomials over rational or int.")
+    if not f.coefficients:
+        return Polynomial({}, INTEGERS)
+    integers, _ = f.domain.integerCoefficients(list(f.coefficients.values()))
+    content = gcd(*integers)
+    if content != 1:
+        integers = [c // content for c in integers]
+    return Polynomial(dict(zip(f.coefficients, integers)), INTEGERS)
+
+
+def fromIntegers(f: Polynomial, domain: CoefficientDomain) -> Polynomial:
+    """
+    Returns
+    -------
+    The polynomial f over the integers mapped to the given domain.
+    """
+    fromInt = domain.fromInt
+    return Polynomial({monomial: fromInt(coefficient) for monomial, coefficient in f.coefficients.items()}, domain)
+
+
+def polynomialReduce(f: Polynomial, G: list[Polynomial], permutation: list[str], order: Callable
+= lexOrder, fractionFree: bool = False, trace: list = None) -> tuple[list[Polynomial], Polynomial]:
+    """
+    Division algorithm of f by G = [g1, g2, ..., gs] using monomial order given by permutation. The dividend is kept in a PolynomialAccumulator, so each reduction step costs time proportional to the length of the reducer.
+
+    If fractionFree is True, f and G must be over int, for example primitive parts, and no coefficient is inverted. Instead of subtracting c / a * m * g, where a is the leading coefficient of g, the dividend is multiplied by a / gcd(a, c) and c / gcd(a, c) * m * g is subtracted, so all coefficients stay integers.
+
+    If trace is a list, every reduction step is appended to it as (monomial, i): the term of the monomial was reduced by G[i].
+
+    Returns
+    -------
+    ([q1, q2, ..., qs], r) : q are quotients and r is not divisble by all leading terms of G. If fractionFree is True, M * f = q1 * g1 + ... + qs * gs + r for a positive integer M.
+
+    Raises
+    ------
+    ValueError: If fractionFree is True and the polynomials are not over int.
+    """
+    if fractionFree:
+        return _fractionFreeReduce(f, G, permutation, order, trace)
+    domain = f.domain
+    p = PolynomialAccumulator(f, permutation, order)
+    r = {}
+    quotients = [{} for _ in range(len(G))]
+    G_sorted_terms = [g.sortedTerms(permutation, order) for g in G]
+    divisors = [i for i, terms in enumerate(G_sorted_terms) if terms]
+    G_monomials_list = [terms[0][0] if terms else None for terms in G_sorted_terms]
+    G_leading_inverses = [g.coefficientInverse(terms[0][1]) if terms else None for g, terms in zip(G, G_sorted_terms)]
+    G_masks = [monomial.divisibilityMask if monomial is not None else None for monomial in G_monomials_list]
+
+    while True:
+        term = p.popLeadingTerm()
+        if term is None:
+            break
+        p_monomial, p_coefficient = term
+        p_mask = p_monomial.divisibilityMask
+        somethingDivided = False
+
+        for i in divisors:
+            if G_masks[i] & ~p_mask or not G_monomials_list[i].divides(p_monomial):
+                continue
+            power = p_monomial / G_monomials_list[i]
+            coefficient = p_coefficient * G_leading_inverses[i]
+            quotients[i][power] = coefficient
+            p.subtractMultiple(coefficient, power, islice(G_sorted_terms[i], 1, None))
+            if trace is not None:
+                trace.append((p_monomial, i))
+            somethingDivided = True
+            break
+
+        if not somethingDivided:
+            r[p_monomial] = p_coefficient
+
+    return [Polynomial(q, domain) for q in quotients], Polynomial(r, domain)
+
+
+def _fractionFreeReduce(f: Polynomial, G: list[Polynomial], permutation: list[str], order: Callable
+= lexOrder, trace: list = None) -> tuple[list[Polynomial], Polynomial]:
+    """
+    Fraction-free division algorithm of polynomialReduce. The dividend is multiplied in place, while quotient and remainder terms remember the multiplier at the time they were found and are brought to the final multiplier at the end.
+    """
+    if f.field != int or any(g.field != int for g in G if g.coefficients):
+        raise ValueError("Fraction-free reduction needs polynomials over int, see primitivePart.")
+    p = PolynomialAccumulator(f, permutation, order)
+    multiplier = 1
+    r = {}
+    quotients = [{} for _ in range(len(G))]
+    G_sorted_terms = [g.sortedTerms(permutation, order) for g in G]
+    divisors = [i for i, terms in enumerate(G_sorted_terms) if terms]
+    G_monomials_list = [terms[0][0] if terms else None for terms in G_sorted_terms]
+    G_leading_coefficients = [terms[0][1] if terms else None for terms in G_sorted_terms]
+    G_masks = [monomial.divisibilityMask if monomial is not None else None for monomial in G_monomials_list]
+
+    while True:
+        term = p.popLeadingTerm()
+        if term is None:
+            break
+        p_monomial, p_coefficient = term
+        p_mask = p_monomial.divisibilityMask
+        somethingDivided = False
+
+        for i in divisors:
+            if G_masks[i] & ~p_mask or not G_monomials_list[i].divides(p_monomial):
+                continue
+            power = p_monomial / G_monomials_list[i]
+            a = G_leading_coefficients[i]
+            d = gcd(a, p_coefficient)
+            if a < 0:
+                d = -d
+            a //= d
+            coefficient = p_coefficient // d
+            if a != 1:
+                p.scale(a)
+                multiplier *= a
+            quotients[i][power] = (coefficient, multiplier)
+            p.subtractMultiple(coefficient, power, islice(G_sorted_terms[i], 1, None))
+            if trace is not None:
+                trace.append((p_monomial, i))
+            somethingDivided = True
+            break
+
+        if not somethingDivided:
+            r[p_monomial] = (p_coefficient, multiplier)
+
+    def scaled(terms: dict) -> Polynomial:
+        return Polynomial({monomial: c * (multiplier // m) for monomial, (c, m) in terms.items()}, INTEGERS)
+
+    return [scaled(q) for q in quotients], scaled(r)
+
+
+def syzygy(f: Polynomial, g: Polynomial, permutation: list[str], order: Callable
+ = lexOrder, fractionFree: bool = False) -> Polynomial:
+    """
+    Returns
+    -------
+    S(f, g) = lcm(LT(f), LT(g)) / LT(f) * f - lcm(LT(f), LT(g)) / LT(g) * g
+
+    lcm is least common multiple of monomials, leading terms are calcualted based on monomial order given by permutation. If fractionFree is True, f and g must be over int and S(f, g) is multiplied by LC(f) * LC(g) / gcd(LC(f), LC(g)), so no coefficient is inverted.
+    """
+    f_monomial, f_coefficient = f.leadingTerm(permutation, order)
+    g_monomial, g_coefficient = g.leadingTerm(permutation, order)
+    m = Monomial.leastCommonMultiple(f_monomial, g_monomial)
+    if fractionFree:
+        d = gcd(f_coefficient, g_coefficient)
+        return f.multiplyByTerm(m / f_monomial, g_coefficient // d) - g.multiplyByTerm(m / g_monomial, f_coefficient // d)
+    a = Polynomial({m / f_monomial: f.coefficientInverse(f_coefficient)}, f.domain)
+    b = Polynomial({m / g_monomial: g.coefficientInverse(g_coefficient)}, g.domain)
+    return a * f - b * g
+
+
+PAIR_STRATEGIES = ('normal', 'sugar')
+
+
+class BuchbergerEngine:
+    """
+    Buchberger's algorithm with a queue of critical pairs. Every pair is considered once, pairs are discarded by Buchberger's product and chain criteria with the bookkeeping of Gebauer and Moeller, and every new basis element is added as soon as it is found. The state is kept between calls, so polynomials can be added to a computed basis and run continues from there.
+
+    Pairs are selected by strategy:
+    - 'normal' takes the pair with the smallest lcm of leading monomials in the monomial order.
+    - 'sugar' takes the pair with the smallest sugar, the degree the S-polynomial would have if the input were homogenized, ties are broken by the normal strategy.
+
+    If fractionFree is True, polynomials over rational or int are kept as primitive integer polynomials, see primitivePart, and basis() maps them back to the field of the first added polynomial.
+
+    Attributes
+    ----------
+    polynomials : all basis elements found so far, including ones made redundant by later elements.
+    active : indices of polynomials forming the current basis G, whose leading monomials are not divisible by each other.
+    pairs : heap of pending critical pairs (key, i, j, lcm, sugar).
+    statistics : numbers of 'pairs' considered, S-polynomial 'reductions', 'zeroReductions', pairs removed by 'productCriterion' and by 'chainCriterion'.
+    """
+    def __init__(self, permutation: list[str], order: Callable = lexOrder, strategy: str = 'normal', fractionFree: bool = False):
+        if strategy not in PAIR_STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy}, expected one of {', '.join(PAIR_STRATEGIES)}")
+        self.permutation = permutation
+        self.order = order
+        self.strategy = strategy
+        self.fractionFree = fractionFree
+        self.sortKey = monomialSortKey(permutation, order)
+        self.domain = None
+        self.polynomials = []
+        self.leadingMonomials = []
+        self.sugars = []
+        self.active = []
+        self.pairs = []
+        self.statistics = {'pairs': 0, 'reductions': 0, 'zeroReductions': 0, 'productCriterion': 0, 'chainCriterion': 0}
+
+
+    def pairKey(self, lcm: Monomial, sugar: int) -> tuple:
+        """
+        Returns
+        -------
+        The key of a pair in the queue, the smallest key is selected first.
+        """
+        if self.strategy == 'sugar':
+            return (sugar, self.sortKey(lcm))
+        return (self.sortKey(lcm),)
+
+
+    def addPolynomials(self, F: list[Polynomial]) -> None:
+        """
+        Adds polynomials to the basis without reducing them, zero polynomials are skipped. Their sugar is their total degree.
+        """
+        for f in F:
+            if self.domain is None:
+                self.domain = f.domain
+            if self.fractionFree:
+                f = primitivePart(f)
+            if not f.isZeroPolynomial():
+                self.update(f, f.totalDegree())
+
+
+    def addBasis(self, G: list[Polynomial]) -> None:
+        """
+        Adds the elements of a reduced Groebner basis G to the active basis without creating pairs among them, only pairs with polynomials added later are considered.
+
+        Raises
+        ------
+        ValueError: If the engine already holds polynomials.
+        """
+        if self.polynomials:
+            raise ValueError("A Groebner basis can only be added to an empty engine.")
+        for g in G:
+            if self.domain is None:
+                self.domain = g.domain
+            if self.fractionFree:
+                g = primitivePart(g)
+            if g.isZeroPolynomial():
+                continue
+            self.active.append(len(self.polynomials))
+            self.polynomials.append(g)
+            self.leadingMonomials.append(g.leadingTerm(self.permutation, self.order)[0])
+            self.sugars.append(g.totalDegree())
+
+
+    def update(self, h: Polynomial, sugar: int) -> None:
+        """
+        Adds a nonzero polynomial h to the basis and updates the pairs by the Gebauer-Moeller criteria:
+        1. Of the new pairs (g, h) with the same lcm or with lcm divisible by the lcm of another new pair only one is kept.
+        2. New pairs with relatively prime leading monomials are dropped by the product criterion.
+        3. Old pairs (g1, g2) with LM(h) | lcm(g1, g2) are dropped unless lcm(g1, h) or lcm(g2, h) equals lcm(g1, g2).
+        4. Basis elements with leading monomial divisible by LM(h) leave the active basis.
+        """
+        permutation = self.permutation
+        order = self.order
+        t = len(self.polynomials)
+        m = h.leadingTerm(permutation, order)[0]
+        self.polynomials.append(h)
+        self.leadingMonomials.append(m)
+        self.sugars.append(sugar)
+        leadingMonomials = self.leadingMonomials
+        statistics = self.statistics
+
+        candidates = []
+        for i in self.active:
+            lcm = Monomial.leastCommonMultiple(leadingMonomials[i], m)
+            candidates.append((i, lcm, lcm == leadingMonomials[i] * m))
+
+        kept = []
+        for index, (i, lcm, coprime) in enumerate(candidates):
+            if coprime:
+                kept.append((i, lcm, coprime))
+            elif any(other.divides(lcm) for _, other, _ in candidates[index + 1:]) or any(other.divides(lcm) for _, other, _ in kept):
+                statistics['chainCriterion'] += 1
+            else:
+                kept.append((i, lcm, coprime))
+
+        pairs = []
+        for key, i, j, lcm, pairSugar in self.pairs:
+            if m.divides(lcm) and Monomial.leastCommonMultiple(leadingMonomials[i], m) != lcm and Monomial.leastCommonMultiple(leadingMonomials[j], m) != lcm:
+                statistics['chainCriterion'] += 1
+            else:
+                pairs.append((key, i, j, lcm, pairSugar))
+
+        degree = m.degree()
+        for i, lcm, coprime in kept:
+            if coprime:
+                statistics['productCriterion'] += 1
+                continue
+            lcmDegree = lcm.degree()
+            pairSugar = max(self.sugars[i] + lcmDegree - leadingMonomials[i].degree(), sugar + lcmDegree - degree)
+            pairs.append((self.pairKey(lcm, pairSugar), i, t, lcm, pairSugar))
+        heapq.heapify(pairs)
+        self.pairs = pairs
+
+        self.active = [i for i in self.active if not m.divides(leadingMonomials[i])] + [t]
+
+
+    def selectPairs(self) -> list[tuple]:
+        """
+        Returns
+        -------
+        The pending pairs with lcm of the smallest total degree, they are removed from the queue.
+        """
+        degree = min(pair[3].degree() for pair in self.pairs)
+        selected = [pair for pair in self.pairs if pair[3].degree() == degree]
+        self.pairs = [pair for pair in self.pairs if pair[3].degree() != degree]
+        heapq.heapify(self.pairs)
+        return selected
+
+
+    def step(self, trace: list = None) -> Polynomial:
+        """
+        Reduces the S-polynomial of the selected pair by the active basis and adds a nonzero remainder to the basis. If trace is a list, the reduction steps are appended to it as (monomial, k): the term of the monomial was reduced by polynomials[k].
+
+        Returns
+        -------
+        The new basis element or None if the S-polynomial reduced to zero or there are no pairs left.
+        """
+        if not self.pairs:
+            return None
+        _, i, j, _, sugar = heapq.heappop(self.pairs)
+        permutation = self.permutation
+        order = self.order
+        fractionFree = self.fractionFree
+        statistics = self.statistics
+        statistics['pairs'] += 1
+        statistics['reductions'] += 1
+        active = self.active
+        G = [self.polynomials[k] for k in active]
+        steps = [] if trace is not None else None
+        _, r = polynomialReduce(syzygy(self.polynomials[i], self.polynomials[j], permutation, order, fractionFree), G, permutation, order, fractionFree, steps)
+        if trace is not None:
+            trace.extend((monomial, active[k]) for monomial, k in steps)
+        if r.isZeroPolynomial():
+            statistics['zeroReductions'] += 1
+            return None
+        if fractionFree:
+            r = primitivePart(r)
+        self.update(r, sugar)
+        return r
+
+
+    def run(self) -> None:
+        """
+        Processes pairs until the queue is empty, then the active basis is a Groebner basis.
+        """
+        progress = tqdm(total=len(self.pairs))
+        while self.pairs:
+            before = len(self.pairs)
+            self.step()
+            progress.total += max(0, len(self.pairs) - before + 1)
+            progress.update(1)
+        progress.close()
+
+
+    def basis(self) -> list[Polynomial]:
+        """
+        Returns
+        -------
+        The active basis, mapped back to the original field if fractionFree is True.
+        """
+        G = [self.polynomials[i] for i in self.active]
+        if self.fractionFree and self.domain is not None:
+            return [fromIntegers(g, self.domain) for g in G]
+        return G
+
+
+def extendToGroebnerBasis(Basis: list[Polynomial], permutation = list[str], order: Callable
+ = lexOrder, fractionFree: bool = False, strategy: str = 'normal', statistics: dict = None) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    Extends a given basis to a Groebner basis using Buchberger's algorithm with the pair queue of BuchbergerEngine and given pair selection strategy. Monomial order is determined by permuation. If fractionFree is True, the basis must be over rational or int and all basis elements and remainders are kept as primitive integer polynomials, see primitivePart. They are mapped back to the field of the basis at the end. If statistics is a dict, it is updated with the statistics of the engine.
+    """
+    engine = BuchbergerEngine(permutation, order, strategy, fractionFree)
+    engine.addPolynomials(Basis)
+    engine.run()
+    if statistics is not None:
+        statistics.update(engine.statistics)
+    return engine.basis()
+
+
+def lcmCriterion(alpha: Monomial, beta: Monomial) -> bool:
+    """
+    Returns
+    -------
+    True if monomials are relativly prime that is their prdouct is equal to their least common multiple, False otherwise. 
+    """
+    return Monomial.leastCommonMultiple(alpha, beta) == alpha * beta
+
+
+def chainCriterion(i: int, j: int, G: list[Polynomial], permutation: list[str], order: Callable
+ = lexOrder, pending: set = None) -> bool:
+    """
+    Returns
+    -------
+    True if the pair (i, j) , i < j can be skipped by Buchberger's chain criterion, that is there is k not equal to i and j such LT(G[k]) | lcm(LT(G[i]), LT(G[j])), and pairs (i, k), (j, k) have been already checked in Buchberger's algorithm. pending is the set of pairs (a, b), a < b, which are not checked yet, if it is None all other pairs are assumed to be checked. False otherwise. 
+    """
+    pending = pending or set()
+    m = Monomial.leastCommonMultiple(leadingMonomial(G[i], permutation, order), leadingMonomial(G[j], permutation, order))
+    for k in range(len(G)):
+        if k == i or k == j or (min(i, k), max(i, k)) in pending or (min(j, k), max(j, k)) in pending:
+            continue
+        if leadingMonomial(G[k], permutation, order).divides(m):
+            return True
+    return False
+
+
+def isInLeadingTermsIdeal(f: Polynomial, G: list[Polynomial], permutation = list[str], order: Callable
+ = lexOrder) -> bool:
+    """
+    Returns
+    -------
+    True if f is in the ideal generated by leading terms of G, False otherwise.
+    """
+    f_monomial = leadingMonomial(f, permutation, order)
+    for g in G:
+        if leadingMonomial(g, permutation, order).divides(f_monomial):
+            return True
+    return False
+
+
+
+def reduceGroebnerBasis(G: list[Polynomial], permutation: list[str], order: Callable
+ = lexOrder, normalizeCoefficients: bool = True, fractionFree: bool = False) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    Reduces a Groebner basis to a minimal Groebner basis, that is:
+    1. For each g in G, g is not divisible by leading terms of other polynomials in G.
+    2. For each g in G, g is reduced by other polynomials in G.
+    3. If normalizeCoefficients is True, each polynomial is divided by it's leading coefficient.
+
+    The interreduction is a single pass over the polynomials in increasing order of leading monomials. A polynomial whose leading monomial is divisible by a smaller kept one is dropped, the others are reduced only by the kept polynomials before them, which are already reduced. Their leading terms are not divisible by any other leading monomial, so only tails are reduced, and every monomial of a tail is smaller than the leading monomial, so it can only be divisible by the leading monomials of smaller polynomials. The polynomials keep the order of G.
+
+    If fractionFree is True, G must be over rational or int and the reduction is done on primitive integer polynomials, which are divided by their leading coefficients only at the end. Without normalizeCoefficients they are returned as primitive integer polynomials mapped to the field of G.
+    """
+    if fractionFree:
+        domain = G[0].domain if G else INTEGERS
+        G = [primitivePart(g) for g in G]
+    G = [g for g in G if not g.isZeroPolynomial()]
+    sortKey = monomialSortKey(permutation, order)
+    leadingMonomials = [g.leadingTerm(permutation, order)[0] for g in G]
+    indices = sorted(range(len(G)), key = lambda i: sortKey(leadingMonomials[i]))
+
+    kept = []
+    for i in indices:
+        if not any(leadingMonomials[k].divides(leadingMonomials[i]) for k in kept):
+            kept.append(i)
+
+    reduced = {}
+    for i in kept:
+        _, r = polynomialReduce(G[i], list(reduced.values()), permutation, order, fractionFree)
+        reduced[i] = primitivePart(r) if fractionFree else r
+    H = [reduced[i] for i in sorted(reduced)]
+
+    if fractionFree:
+        H = [fromIntegers(h, domain) for h in H]
+    if normalizeCoefficients:
+        for i, h in enumerate(H):
+            H[i] *= h.coefficientInverse(leadingCoefficient(h, permutation, order))
+
+    return H
@@ -0,0 +1,555 @@
+from math import lcm, isfinite
+from .rational import rational
+from .galoisField import GaloisField
+
+
+class CoefficientDomain:
+    """
+    Arithmetic of the coefficients of a polynomial. Every Polynomial references its domain once and its arithmetic dispatches through it, so coefficients are never inspected by type. Elements are represented by plain Python objects with arithmetic operators, add, sub, mul, neg may return unreduced representatives and normalize brings a dictionary of coefficients to canonical form. field identifies the domain in Polynomial.field, for example rational for RationalDomain. Derived classes implement at least zero, one, convert, inv and isZero.
+    """
+    __slots__ = ()
+    field = None
+    prime = None
+    signed = True
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
+
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} does not support attribute deletion")
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def __repr__(self):
+        return self.__str__()
+
+
+    def zero(self):
+        raise NotImplementedError
+
+
+    def one(self):
+        raise NotImplementedError
+
+
+    def fromInt(self, n: int):
+        """
+        Returns
+        -------
+        The image of the integer n in the domain.
+        """
+        return self.convert(n)
+
+
+    def convert(self, value):
+        """
+        Returns
+        -------
+        The value converted to an element of the domain.
+
+        Raises
+        ------
+        ValueError: If the value can not be converted.
+        """
+        raise NotImplementedError
+
+
+    def add(self, a, b):
+        return a + b
+
+
+    def sub(self, a, b):
+        return a - b
+
+
+    def neg(self, a):
+        return -a
+
+
+    def mul(self, a, b):
+        return a * b
+
+
+    def subtractProduct(self, a, b, c):
+        """
+        Returns
+        -------
+        a - b * c, the step of the division algorithm.
+        """
+        return a - b * c
+
+
+    def pow(self, a, n: int):
+        return a ** n
+
+
+    def inv(self, a):
+        """
+        Returns
+        -------
+        The multiplicative inverse of a.
+
+        Raises
+        ------
+        ZeroDivisionError: If a is zero.
+        """
+        raise NotImplementedError
+
+
+    def div(self, a, b):
+        return self.mul(a, self.inv(b))
+
+
+    def isZero(self, a) -> bool:
+        raise NotImplementedError
+
+
+    def reduce(self, a):
+        """
+        Returns
+        -------
+        The canonical representative of a.
+        """
+        return a
+
+
+    def normalize(self, coefficients: dict) -> dict:
+        """
+        Returns
+        -------
+        New dictionary of coefficients in canonical form with zero coefficients removed.
+        """
+        isZero = self.isZero
+        return {monomial: coefficient for monomial, coefficient in coefficients.items() if not isZero(coefficient)}
+
+
+    def toString(self, a) -> str:
+        """
+        Returns
+        -------
+        The element as printed in a polynomial. For signed domains a is nonnegative, the sign is printed by the polynomial.
+        """
+        return str(a)
+
+
+    def integerCoefficients(self, coefficients: list) -> tuple[list[int], int]:
+        """
+        Returns
+        -------
+        (integers, scale) such that coefficients are integers / scale, or None if the domain has no exact integer representation. Used by Kronecker substitution.
+        """
+        return None
+
+
+    def fromScaledInteger(self, n: int, scale: int):
+        """
+        Returns
+        -------
+        The element n / scale, inverse of integerCoefficients.
+        """
+        raise NotImplementedError
+
+
+
+class RationalDomain(CoefficientDomain):
+    """
+    The field of rational numbers with rational coefficients.
+    """
+    __slots__ = ()
+    field = rational
+
+    def __str__(self):
+        return 'ℚ'
+
+
+    def __eq__(self, other):
+        return isinstance(other, RationalDomain)
+
+
+    def __hash__(self):
+        return hash(RationalDomain)
+
+
+    def __reduce__(self):
+        return (RationalDomain, ())
+
+
+    def zero(self) -> rational:
+        return rational(0)
+
+
+    def one(self) -> rational:
+        return rational(1)
+
+
+    def convert(self, value) -> rational:
+        if isinstance(value, rational):
+            return value
+        elif isinstance(value, int):
+            return rational(value)
+        elif isinstance(value, float) and isfinite(value):
+            return rational(*value.as_integer_ratio())
+        elif isinstance(value, complex) and value.imag == 0 and isfinite(value.real):
+            return rational(*value.real.as_integer_ratio())
+        raise ValueError(f"Cannot convert {value} to {self}")
+
+
+    def inv(self, a: rational) -> rational:
+        return 1 / a
+
+
+    def isZero(self, a) -> bool:
+        return a == 0
+
+
+    def integerCoefficients(self, coefficients: list) -> tuple[list[int], int]:
+        scale = lcm(*(c.denominator for c in coefficients))
+        return [c.numerator * (scale // c.denominator) for c in coefficients], scale
+
+
+    def fromScaledInteger(self, n: int, scale: int) -> rational:
+        return rational(n, scale)
+
+
+
+class IntegerDomain(CoefficientDomain):
+    """
+    The ring of integers with int coefficients. Only 1 and -1 are invertible and division must be exact.
+    """
+    __slots__ = ()
+    field = int
+
+    def __str__(self):
+        return 'ℤ'
+
+
+    def __eq__(self, other):
+        return isinstance(other, IntegerDomain)
+
+
+    def __hash__(self):
+        return hash(IntegerDomain)
+
+
+    def __reduce__(self):
+        return (IntegerDomain, ())
+
+
+    def zero(self) -> int:
+        return 0
+
+
+    def one(self) -> int:
+        return 1
+
+
+    def convert(self, value) -> int:
+        if isinstance(value, int):
+            return value
+        elif isinstance(value, rational) and value.denominator == 1:
+            return value.numerator
+        elif isinstance(value, float) and value.is_integer():
+            return int(value)
+        raise ValueError(f"Cannot convert {value} to {self}")
+
+
+    def inv(self, a: int) -> int:
+        if a == 1 or a == -1:
+            return a
+        elif a == 0:
+            raise ZeroDivisionError("Division by zero")
+        raise ValueError(f"{a} is not invertible in {self}")
+
+
+    def div(self, a: int, b: int) -> int:
+        """
+        Returns
+        -------
+        The exact quotient a / b.
+
+        Raises
+        ------
+        ValueError: If b does not divide a.
+        """
+        if b == 0:
+            raise ZeroDivisionError("Division by zero")
+        q, r = divmod(a, b)
+        if r != 0:
+            raise ValueError(f"{b} does not divide {a} in {self}")
+        return q
+
+
+    def isZero(self, a) -> bool:
+        return a == 0
+
+
+    def integerCoefficients(self, coefficients: list) -> tuple[list[int], int]:
+        return list(coefficients), 1
+
+
+    def fromScaledInteger(self, n: int, scale: int) -> int:
+        return n // scale
+
+
+
+class RealDomain(CoefficientDomain):
+    """
+    Real numbers with float coefficients. Coefficients of absolute value below tolerance are treated as zero.
+    """
+    __slots__ = ('tolerance',)
+    field = float
+
+    def __init__(self, tolerance: float = 0.001):
+        object.__setattr__(self, 'tolerance', tolerance)
+
+
+    def __str__(self):
+        return 'ℝ'
+
+
+    def __eq__(self, other):
+        return isinstance(other, RealDomain) and self.tolerance == other.tolerance
+
+
+    def __hash__(self):
+        return hash((RealDomain, self.tolerance))
+
+
+    def __reduce__(self):
+        return (RealDomain, (self.tolerance,))
+
+
+    def zero(self) -> float:
+        return 0
+
+
+    def one(self) -> float:
+        return 1
+
+
+    def convert(self, value) -> float:
+        if isinstance(value, (int, float, rational)):
+            return float(value)
+        elif isinstance(value, complex) and value.imag == 0:
+            return value.real
+        raise ValueError(f"Cannot convert {value} to {self}")
+
+
+    def inv(self, a: float) -> float:
+        return 1 / a
+
+
+    def isZero(self, a) -> bool:
+        return abs(a) < self.tolerance
+
+
+    def toString(self, a) -> str:
+        if isinstance(a, float) and a.is_integer():
+            return str(int(a))
+        return str(a)
+
+
+
+class ComplexDomain(CoefficientDomain):
+    """
+    Complex numbers with complex coefficients. Coefficients of absolute value below tolerance are treated as zero.
+    """
+    __slots__ = ('tolerance',)
+    field = complex
+    signed = False
+
+    def __init__(self, tolerance: float = 0.001):
+        object.__setattr__(self, 'tolerance', tolerance)
+
+
+    def __str__(self):
+        return 'ℂ'
+
+
+    def __eq__(self, other):
+        return isinstance(other, ComplexDomain) and self.tolerance == other.tolerance
+
+
+    def __hash__(self):
+        return hash((ComplexDomain, self.tolerance))
+
+
+    def __reduce__(self):
+        return (ComplexDomain, (self.tolerance,))
+
+
+    def zero(self) -> complex:
+        return 0
+
+
+    def one(self) -> complex:
+        return 1
+
+
+    def convert(self, value) -> complex:
+        if isinstance(value, (int, float, complex, rational)):
+            return complex(value)
+        raise ValueError(f"Cannot convert {value} to {self}")
+
+
+    def inv(self, a: complex) -> complex:
+        return 1 / a
+
+
+    def isZero(self, a) -> bool:
+        return abs(a) < self.tolerance
+
+
+
+class GaloisFieldDomain(CoefficientDomain):
+    """
+    Integers modulo a prime with GaloisField coefficients. The prime may be None for polynomials without coefficients, then elements can not be created from integers.
+    """
+    __slots__ = ('prime',)
+    field = GaloisField
+    signed = False
+
+    def __init__(self, prime: int = None):
+        object.__setattr__(self, 'prime', prime)
+
+
+    def __str__(self):
+        return f'𝔽{self.prime}'
+
+
+    def __eq__(self, other):
+        return isinstance(other, GaloisFieldDomain) and self.prime == other.prime
+
+
+    def __hash__(self):
+        return hash((GaloisFieldDomain, self.prime))
+
+
+    def __reduce__(self):
+        return (GaloisFieldDomain, (self.prime,))
+
+
+    def _checkPrime(self) -> int:
+        if self.prime is None:
+            raise ValueError("The prime must be given for GaloisField.")
+        return self.prime
+
+
+    def zero(self) -> GaloisField:
+        return GaloisField(0, self._checkPrime())
+
+
+    def one(self) -> GaloisField:
+        return GaloisField(1, self._checkPrime())
+
+
+    def convert(self, value) -> GaloisField:
+        if isinstance(value, GaloisField):
+            if self.prime is not None and value.prime != self.prime:
+                raise ValueError(f"Cannot convert {value} to {self}")
+            return value
+        elif isinstance(value, int):
+            return GaloisField(value, self._checkPrime())
+        elif isinstance(value, rational):
+            return GaloisField(value.numerator, self._checkPrime()) / value.denominator
+        raise ValueError(f"Cannot convert {value} to {self}")
+
+
+    def inv(self, a: GaloisField) -> GaloisField:
+        return 1 / a
+
+
+    def isZero(self, a) -> bool:
+        return a.number == 0 if isinstance(a, GaloisField) else a % self._checkPrime() == 0
+
+
+    def integerCoefficients(self, coefficients: list) -> tuple[list[int], int]:
+        return [getattr(c, 'number', c) for c in coefficients], 1
+
+
+    def fromScaledInteger(self, n: int, scale: int) -> GaloisField:
+        return GaloisField(n, self._checkPrime())
+
+
+
+class GenericDomain(CoefficientDomain):
+    """
+    Fallback domain for coefficients of other types and for polynomials with unknown field, arithmetic uses the operators of the coefficients.
+    """
+    __slots__ = ('field',)
+
+    def __init__(self, field = None):
+        object.__setattr__(self, 'field', field)
+
+
+    def __str__(self):
+        return str(self.field)
+
+
+    def __eq__(self, other):
+        return isinstance(other, GenericDomain) and self.field == other.field
+
+
+    def __hash__(self):
+        return hash((GenericDomain, self.field))
+
+
+    def __reduce__(self):
+        return (GenericDomain, (self.field,))
+
+
+    def zero(self):
+        return 0
+
+
+    def one(self):
+        return 1
+
+
+    def convert(self, value):
+        return value
+
+
+    def inv(self, a):
+        return 1 / a
+
+
+    def isZero(self, a) -> bool:
+        if isinstance(a, (float, complex)):
+            return abs(a) < 0.001
+        elif isinstance(a, GaloisField):
+            return a.number == 0
+        return a == 0
+
+
+
+DOMAINS = {rational: RationalDomain(), int: RationalDomain(), float: RealDomain(), complex: ComplexDomain()}
+GALOIS_FIELD_DOMAINS = {}
+
+
+def coefficientDomain(field, prime: int = None) -> CoefficientDomain:
+    """
+    Returns
+    -------
+    The coefficient domain for the given field. field can be a CoefficientDomain, which is returned as it is, or one of rational, int, float, complex and GaloisField with given prime. int gives the rationals, so polynomials with integer coefficients are over a field, IntegerDomain is only used when passed explicitly. Domains are shared, so this is a dictionary lookup.
+    """
+    if isinstance(field, CoefficientDomain):
+        return field
+    domain = DOMAINS.get(field)
+    if domain is not None:
+        return domain
+    elif field is GaloisField:
+        domain = GALOIS_FIELD_DOMAINS.get(prime)
+        if domain is None:
+            domain = GaloisFieldDomain(prime)
+            GALOIS_FIELD_DOMAINS[prime] = domain
+        return domain
+    return GenericDomain(field)
@@ -0,0 +1,316 @@
+import heapq
+import numpy as np
+from typing import Callable
+from tqdm import tqdm
+from .polynomial import Polynomial, Monomial
+from .coefficientDomain import CoefficientDomain
+from .monomialOrders import lexOrder
+from .buchberger import BuchbergerEngine
+
+F4_NUMPY_PRIME_BOUND = 2 ** 31
+F4_ROW_BLOCK = 256
+
+
+class MacaulayMatrix:
+    """
+    Sparse Macaulay matrix of one F4 step. Columns are the monomials of all rows in decreasing monomial order, so column 0 holds the largest monomial. Every row is stored as a pair of column indices and coefficients. The first row with a given leading monomial is a pivot row, the pivot rows are in echelon form by construction. The other rows are reduced by the pivot rows and then echelonized among themselves, rows left with a leading monomial which is not the leading monomial of a pivot row are the new basis elements.
+
+    Over GF(p) with p < F4_NUMPY_PRIME_BOUND, given as PrimeField or GaloisField, the elimination runs on NumPy int64 arrays, products of two reduced coefficients stay below 2^62. The non-pivot rows are reduced in blocks of F4_ROW_BLOCK rows, each one dense only in the columns its rows reach through the pivot rows, and the remainders are echelonized on the non-pivot columns they still have. Over other fields it works on sparse rows with the arithmetic of the CoefficientDomain. Over the rationals the coefficients grow quickly, since many rows are reduced at once against each other, so the elimination is meant for GF(p).
+    """
+    def __init__(self, rows: list[dict], domain: CoefficientDomain, sortKey: Callable):
+        self.domain = domain
+        self.monomials = sorted(set().union(*rows), key = sortKey, reverse = True)
+        columns = {monomial: index for index, monomial in enumerate(self.monomials)}
+        self.pivots = {}
+        self.rows = []
+        for row in rows:
+            entries = sorted((columns[monomial], coefficient) for monomial, coefficient in row.items())
+            if entries[0][0] in self.pivots:
+                self.rows.append(entries)
+            else:
+                self.pivots[entries[0][0]] = entries
+
+
+    def isModular(self) -> bool:
+        """
+        Returns
+        -------
+        True if the elimination can be done on NumPy int64 arrays.
+        """
+        prime = self.domain.prime
+        return prime is not None and prime < F4_NUMPY_PRIME_BOUND
+
+
+    def reduce(self) -> list[Polynomial]:
+        """
+        Returns
+        -------
+        The monic polynomials of the reduced row echelon form of the non-pivot rows, all their monomials are outside the leading monomials of the pivot rows.
+        """
+        if not self.rows:
+            return []
+        domain = self.domain
+        monomials = self.monomials
+        if self.isModular():
+            rows = self._reduceModular()
+        else:
+            rows = self._reduceGeneric()
+        return [Polynomial({monomials[column]: coefficient for column, coefficient in row}, domain) for row in rows]
+
+
+    def _reachedColumns(self, rows: list[list[tuple]]) -> list[int]:
+        """
+        Returns
+        -------
+        The sorted columns which can become nonzero when the rows are reduced by the pivot rows: the columns of the rows and, for every pivot column among them, the columns of its pivot row.
+        """
+        pivots = self.pivots
+        reached = set()
+        columns = []
+        for entries in rows:
+            for index, _ in entries:
+                if index not in reached:
+                    reached.add(index)
+                    if index in pivots:
+                        columns.append(index)
+        heapq.heapify(columns)
+        while columns:
+            column = heapq.heappop(columns)
+            for index, _ in pivots[column]:
+                if index not in reached:
+                    reached.add(index)
+                    if index in pivots:
+                        heapq.heappush(columns, index)
+        return sorted(reached)
+
+
+    def _reduceModular(self) -> list[list[tuple]]:
+        domain = self.domain
+        prime = domain.prime
+        pivots = {}
+        for column, entries in self.pivots.items():
+            indices = np.array([index for index, _ in entries], dtype = np.int64)
+            values = np.array(domain.integerCoefficients([value for _, value in entries])[0], dtype = np.int64) % prime
+            pivots[column] = (indices, values * pow(int(values[0]), -1, prime) % prime)
+
+        position = np.full(len(self.monomials), -1, dtype = np.int64)
+        remainders = []
+        for start in range(0, len(self.rows), F4_ROW_BLOCK):
+            block = self.rows[start:start + F4_ROW_BLOCK]
+            columns = self._reachedColumns(block)
+            position[columns] = np.arange(len(columns))
+            matrix = np.zeros((len(block), len(columns)), dtype = np.int64)
+            for r, entries in enumerate(block):
+                matrix[r, position[[index for index, _ in entries]]] = np.array(domain.integerCoefficients([value for _, value in entries])[0], dtype = np.int64) % prime
+            for k, column in enumerate(columns):
+                if column not in pivots:
+                    continue
+                nonzero = np.flatnonzero(matrix[:, k])
+                if nonzero.size == 0:
+                    continue
+                indices, values = pivots[column]
+                cells = np.ix_(nonzero, position[indices])
+                matrix[cells] = (matrix[cells] - np.outer(matrix[nonzero, k], values)) % prime
+            columns = np.array(columns, dtype = np.int64)
+            for r in range(len(block)):
+                nonzero = np.flatnonzero(matrix[r])
+                if nonzero.size:
+                    remainders.append((columns[nonzero], matrix[r, nonzero]))
+        if not remainders:
+            return []
+
+        columns = np.unique(np.concatenate([indices for indices, _ in remainders]))
+        position[columns] = np.arange(columns.size)
+        matrix = np.zeros((len(remainders), columns.size), dtype = np.int64)
+        for r, (indices, values) in enumerate(remainders):
+            matrix[r, position[indices]] = values
+
+        rank = 0
+        for column in range(matrix.shape[1]):
+            if rank == matrix.shape[0]:
+                break
+            nonzero = np.flatnonzero(matrix[rank:, column])
+            if nonzero.size == 0:
+                continue
+            r = rank + int(nonzero[0])
+            if r != rank:
+                matrix[[rank, r]] = matrix[[r, rank]]
+            matrix[rank] = matrix[rank] * pow(int(matrix[rank, column]), -1, prime) % prime
+            others = np.flatnonzero(matrix[:, column])
+            others = others[others != rank]
+            if others.size:
+                matrix[others] = (matrix[others] - np.outer(matrix[others, column], matrix[rank])) % prime
+            rank += 1
+
+        rows = []
+        for r in range(rank):
+            indices = np.flatnonzero(matrix[r])
+            rows.append([(int(columns[index]), domain.fromScaledInteger(int(matrix[r, index]), 1)) for index in indices])
+        return rows
+
+
+    def _reduceGeneric(self) -> list[list[tuple]]:
+        domain = self.domain
+        pivots = {}
+        for column, entries in self.pivots.items():
+            inverse = domain.inv(entries[0][1])
+            pivots[column] = [(index, domain.mul(value, inverse)) for index, value in entries]
+
+        rows = []
+        for entries in self.rows:
+            row = dict(entries)
+            columns = [column for column in row if column in pivots]
+            heapq.heapify(columns)
+            while columns:
+                column = heapq.heappop(columns)
+                factor = row.pop(column, None)
+                if factor is None or domain.isZero(factor):
+                    continue
+                for index, value in pivots[column][1:]:
+                    if index in row:
+                        row[index] = domain.subtractProduct(row[index], factor, value)
+                    else:
+                        row[index] = domain.neg(domain.mul(factor, value))
+                        if index in pivots:
+                            heapq.heappush(columns, index)
+            row = {column: value for column, value in row.items() if not domain.isZero(value)}
+            if row:
+                rows.append(row)
+
+        echelon = []
+        for row in rows:
+            for leadingColumn, reducer in echelon:
+                factor = row.pop(leadingColumn, None)
+                if factor is None:
+                    continue
+                for index, value in reducer.items():
+                    if index != leadingColumn:
+                        row[index] = domain.subtractProduct(row.get(index, domain.zero()), factor, value)
+                row = {column: value for column, value in row.items() if not domain.isZero(value)}
+            if not row:
+                continue
+            column = min(row)
+            inverse = domain.inv(row[column])
+            row = {index: domain.mul(value, inverse) for index, value in row.items()}
+            for k, (otherColumn, other) in enumerate(echelon):
+                factor = other.pop(column, None)
+                if factor is None:
+                    continue
+                for index, value in row.items():
+                    if index != column:
+                        other[index] = domain.subtractProduct(other.get(index, domain.zero()), factor, value)
+                echelon[k] = (otherColumn, {index: value for index, value in other.items() if not domain.isZero(value)})
+            echelon.append((column, row))
+        echelon.sort(key = lambda entry: entry[0])
+        return [sorted(row.items()) for _, row in echelon]
+
+
+class F4Engine(BuchbergerEngine):
+    """
+    Faugere's F4 algorithm on the pair queue of BuchbergerEngine. Each step selects all pending pairs whose lcm has the smallest total degree, collects both multiples lcm/LM(g) * g of every pair, and by symbolic preprocessing adds a reducer m/LM(g) * g from the active basis for every monomial m of the rows divisible by a leading monomial. The whole batch is reduced at once by Gaussian elimination on the MacaulayMatrix of the rows, see MacaulayMatrix, and every row with a new leading monomial is added to the basis with the Gebauer-Moeller update.
+
+    The engine is meant for GF(p). It works over any field, but over the rationals, above all in lexicographic orders, the coefficients of the reduced batches grow much faster than in Buchberger's algorithm and the computation can be many orders of magnitude slower, there the modular algorithm is the better choice, see modularGroebnerBasis.
+
+    statistics counts in addition to the BuchbergerEngine ones the 'matrices' reduced and their total number of 'rows'. 'reductions' counts the non-pivot rows, which are reduced like S-polynomials, and 'zeroReductions' the ones which reduce to zero.
+    """
+    def __init__(self, permutation: list[str], order: Callable = lexOrder):
+        super().__init__(permutation, order)
+        self.statistics.update({'matrices': 0, 'rows': 0})
+
+
+    def symbolicPreprocessing(self, selected: list[tuple]) -> list[dict]:
+        """
+        Returns
+        -------
+        The rows of the Macaulay matrix for the selected pairs as dicts of monomials and coefficients: the two multiples of the polynomials of each pair to their lcm followed by the reducers of all monomials of the rows which are divisible by a leading monomial of the active basis.
+        """
+        polynomials = self.polynomials
+        leadingMonomials = self.leadingMonomials
+        rows = []
+        multiples = set()
+        done = set()
+        pending = set()
+
+        def addRow(k: int, multiplier: Monomial) -> None:
+            if (k, multiplier) in multiples:
+                return
+            multiples.add((k, multiplier))
+            row = {multiplier * monomial: coefficient for monomial, coefficient in polynomials[k].coefficients.items()}
+            rows.append(row)
+            done.add(multiplier * leadingMonomials[k])
+            pending.update(monomial for monomial in row if monomial not in done)
+
+        for _, i, j, lcm, _ in selected:
+            addRow(i, lcm / leadingMonomials[i])
+            addRow(j, lcm / leadingMonomials[j])
+        pending.difference_update(done)
+
+        active = [(leadingMonomials[k], k) for k in self.active]
+        while pending:
+            monomial = pending.pop()
+            if monomial in done:
+                continue
+            done.add(monomial)
+            for leading, k in active:
+                if leading.divides(monomial):
+                    addRow(k, monomial / leading)
+                    break
+        return rows
+
+
+    def step(self) -> list[Polynomial]:
+        """
+        Reduces the batch of pairs of the smallest degree by one MacaulayMatrix and adds the new polynomials to the basis.
+
+        Returns
+        -------
+        The new basis elements, empty if all rows reduced to zero or there are no pairs left.
+        """
+        if not self.pairs:
+            return []
+        selected = self.selectPairs()
+        rows = self.symbolicPreprocessing(selected)
+        matrix = MacaulayMatrix(rows, self.domain, self.sortKey)
+        new = matrix.reduce()
+
+        statistics = self.statistics
+        statistics['pairs'] += len(selected)
+        statistics['matrices'] += 1
+        statistics['rows'] += len(rows)
+        statistics['reductions'] += len(matrix.rows)
+        statistics['zeroReductions'] += len(matrix.rows) - len(new)
+
+        sugar = max(pair[4] for pair in selected)
+        new.sort(key = lambda h: self.sortKey(h.leadingTerm(self.permutation, self.order)[0]))
+        for h in new:
+            self.update(h, sugar)
+        return new
+
+
+    def run(self) -> None:
+        """
+        Processes batches of pairs until the queue is empty, then the active basis is a Groebner basis.
+        """
+        progress = tqdm(total=len(self.pairs))
+        while self.pairs:
+            before = len(self.pairs)
+            pairs = self.statistics['pairs']
+            self.step()
+            selected = self.statistics['pairs'] - pairs
+            progress.total += max(0, len(self.pairs) - before + selected)
+            progress.update(selected)
+        progress.close()
+
+
+def f4GroebnerBasis(Basis: list[Polynomial], permutation: list[str], order: Callable = lexOrder, statistics: dict = None) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    A Groebner basis of the ideal generated by Basis computed by F4Engine, it is not reduced. If statistics is a dict, it is updated with the statistics of the engine.
+    """
+    engine = F4Engine(permutation, order)
+    engine.addPolynomials(Basis)
+    engine.run()
+    if statistics is not None:
+        statistics.update(engine.statistics)
+    return engine.basis()
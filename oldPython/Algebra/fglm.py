@@ -0,0 +1,193 @@
+from typing import Callable
+from .polynomial import Polynomial, Monomial
+from .monomialOrders import lexOrder, gradedRevLexOrder, monomialSortKey
+from .buchberger import polynomialReduce, extendToGroebnerBasis, reduceGroebnerBasis
+from .groebnerWalk import groebnerWalk
+
+
+def variableMonomial(sample: Monomial, var: str) -> Monomial:
+    """
+    Returns
+    -------
+    The monomial of the variable var of the same kind as sample, a PackedMonomial over its layout if the layout has the variable.
+    """
+    layout = getattr(sample, 'layout', None)
+    if layout is not None and var in layout:
+        return layout.monomial({var: 1})
+    return Monomial({var: 1})
+
+
+def isZeroDimensional(G: list[Polynomial], permutation: list[str], order: Callable = lexOrder) -> bool:
+    """
+    Returns
+    -------
+    True if the ideal with Groebner basis G has finitely many solutions over the algebraic closure, that is for every variable of permutation some leading monomial is its pure power.
+    """
+    leadingMonomials = [g.leadingTerm(permutation, order)[0] for g in G if not g.isZeroPolynomial()]
+    if any(m.degree() == 0 for m in leadingMonomials):
+        return True
+    powers = set()
+    for m in leadingMonomials:
+        exponent = {var: exp for var, exp in m.exponent.items() if exp}
+        if len(exponent) == 1:
+            powers.update(exponent)
+    return all(var in powers for var in permutation)
+
+
+def standardMonomials(G: list[Polynomial], permutation: list[str], order: Callable = lexOrder) -> list[Monomial]:
+    """
+    Returns
+    -------
+    The monomials not divisible by any leading monomial of the Groebner basis G in increasing monomial order, they form a basis of the quotient ring of a zero-dimensional ideal.
+
+    Raises
+    ------
+    ValueError: If the ideal is not zero-dimensional.
+    """
+    if not isZeroDimensional(G, permutation, order):
+        raise ValueError("The ideal is not zero-dimensional.")
+    leadingMonomials = [g.leadingTerm(permutation, order)[0] for g in G if not g.isZeroPolynomial()]
+    if any(m.degree() == 0 for m in leadingMonomials):
+        return []
+    constant = leadingMonomials[0] / leadingMonomials[0]
+    variables = [variableMonomial(constant, var) for var in permutation]
+    result = [constant]
+    seen = {constant}
+    index = 0
+    while index < len(result):
+        for x in variables:
+            m = result[index] * x
+            if m not in seen and not any(leading.divides(m) for leading in leadingMonomials):
+                seen.add(m)
+                result.append(m)
+        index += 1
+    return sorted(result, key = monomialSortKey(permutation, order))
+
+
+def multiplicationMatrices(G: list[Polynomial], permutation: list[str], order: Callable = lexOrder) -> tuple[list[Monomial], dict[str, list[dict]]]:
+    """
+    Returns
+    -------
+    The standard monomials b_1, ..., b_D of the Groebner basis G and for every variable x the matrix of multiplication by x on the quotient ring. A matrix is the list of its columns, column j holds the coordinates of the normal form of x * b_j as a sparse dict {i: coefficient}.
+
+    Raises
+    ------
+    ValueError: If the ideal is not zero-dimensional.
+    """
+    basis = standardMonomials(G, permutation, order)
+    if not basis:
+        return basis, {var: [] for var in permutation}
+    domain = G[0].domain
+    one = domain.one()
+    position = {m: i for i, m in enumerate(basis)}
+    matrices = {}
+    for var in permutation:
+        x = variableMonomial(basis[0], var)
+        columns = []
+        for b in basis:
+            m = b * x
+            if m in position:
+                columns.append({position[m]: one})
+            else:
+                _, r = polynomialReduce(Polynomial({m: one}, domain), G, permutation, order)
+                columns.append({position[monomial]: coefficient for monomial, coefficient in r.coefficients.items()})
+        matrices[var] = columns
+    return basis, matrices
+
+
+def fglm(G: list[Polynomial], permutation: list[str], order: Callable, targetPermutation: list[str], targetOrder: Callable = lexOrder) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    The reduced Groebner basis of a zero-dimensional ideal with respect to the target order, computed from its Groebner basis G with respect to the order given by permutation by the FGLM algorithm. Monomials are visited in increasing target order starting from 1, the coordinates of x * m on the quotient ring are found by the multiplication matrices from those of m. A monomial whose coordinates are a linear combination of the coordinates of the earlier standard monomials gives a new basis element, otherwise it is a new standard monomial.
+
+    Raises
+    ------
+    ValueError: If the ideal is not zero-dimensional.
+    """
+    basis, matrices = multiplicationMatrices(G, permutation, order)
+    domain = G[0].domain
+    if not basis:
+        return [Polynomial({G[0].constantMonomial(): domain.one()}, domain)]
+    one = domain.one()
+    sortKey = monomialSortKey(targetPermutation, targetOrder)
+    variables = [(var, variableMonomial(basis[0], var)) for var in targetPermutation]
+
+    staircase = []
+    vectors = []
+    echelon = []
+    result = []
+    leadingMonomials = []
+    candidates = {basis[0]: None}
+    visited = set()
+    while candidates:
+        m = min(candidates, key = sortKey)
+        source = candidates.pop(m)
+        visited.add(m)
+        if any(leading.divides(m) for leading in leadingMonomials):
+            continue
+        if source is None:
+            vector = {0: one}
+        else:
+            k, var = source
+            vector = {}
+            for j, coefficient in vectors[k].items():
+                for i, value in matrices[var][j].items():
+                    vector[i] = domain.add(vector.get(i, domain.zero()), domain.mul(coefficient, value))
+            vector = {i: value for i, value in vector.items() if not domain.isZero(value)}
+
+        reduced = dict(vector)
+        combination = {len(staircase): one}
+        for pivot, row, rowCombination in echelon:
+            factor = reduced.get(pivot)
+            if factor is None:
+                continue
+            for i, value in row.items():
+                reduced[i] = domain.subtractProduct(reduced.get(i, domain.zero()), factor, value)
+            for j, value in rowCombination.items():
+                combination[j] = domain.subtractProduct(combination.get(j, domain.zero()), factor, value)
+            reduced = {i: value for i, value in reduced.items() if not domain.isZero(value)}
+
+        if reduced:
+            pivot = min(reduced)
+            inverse = domain.inv(reduced[pivot])
+            row = {i: domain.mul(value, inverse) for i, value in reduced.items()}
+            rowCombination = {j: domain.mul(value, inverse) for j, value in combination.items() if not domain.isZero(value)}
+            for index, (otherPivot, other, otherCombination) in enumerate(echelon):
+                factor = other.get(pivot)
+                if factor is None:
+                    continue
+                for i, value in row.items():
+                    other[i] = domain.subtractProduct(other.get(i, domain.zero()), factor, value)
+                for j, value in rowCombination.items():
+                    otherCombination[j] = domain.subtractProduct(otherCombination.get(j, domain.zero()), factor, value)
+                echelon[index] = (otherPivot, {i: value for i, value in other.items() if not domain.isZero(value)}, {j: value for j, value in otherCombination.items() if not domain.isZero(value)})
+            echelon.append((pivot, row, rowCombination))
+            staircase.append(m)
+            vectors.append(vector)
+            for var, x in variables:
+                product = m * x
+                if product not in candidates and product not in visited:
+                    candidates[product] = (len(staircase) - 1, var)
+        else:
+            terms = {m: one}
+            for j, value in combination.items():
+                if j < len(staircase) and not domain.isZero(value):
+                    terms[staircase[j]] = value
+            result.append(Polynomial(terms, domain))
+            leadingMonomials.append(m)
+    return result
+
+
+def fglmGroebnerBasis(G: list[Polynomial], permutation: list[str], order: Callable = lexOrder) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    The reduced Groebner basis of the ideal generated by G with respect to the order given by permutation. The basis is first computed for the graded reverse lexicographic order, if the ideal is zero-dimensional it is converted by fglm, otherwise it is converted by groebnerWalk.
+    """
+    H = reduceGroebnerBasis(extendToGroebnerBasis(G, permutation, gradedRevLexOrder), permutation, gradedRevLexOrder)
+    if order == gradedRevLexOrder:
+        return H
+    if not H or not isZeroDimensional(H, permutation, gradedRevLexOrder):
+        return groebnerWalk(H, permutation, gradedRevLexOrder, order)
+    return fglm(H, permutation, gradedRevLexOrder, permutation, order)
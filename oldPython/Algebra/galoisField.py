@@ -1,28 +1,41 @@
+from .primes import isPrime
 
 class GaloisField:
     """
-    Class representing integers modulo a prime number. Supported primes up to 1000. To extend prime range to N run getMorePrimes(N).
+    Class representing integers modulo a prime number. Primes are checked by Miller-Rabin and remembered in PRIMES. For polynomials over large primes prefer PrimeField, which stores coefficients as plain integers. Immutable, attributes are stored in slots and set only by the constructor.
     """
+    __slots__ = ('number', 'prime')
+
     PRIMES = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223, 227, 229, 233, 239, 241, 251, 257, 263, 269, 271, 277, 281, 283, 293, 307, 311, 313, 317, 331, 337, 347, 349, 353, 359, 367, 373, 379, 383, 389, 397, 401, 409, 419, 421, 431, 433, 439, 443, 449, 457, 461, 463, 467, 479, 487, 491, 499, 503, 509, 521, 523, 541, 547, 557, 563, 569, 571, 577, 587, 593, 599, 601, 607, 613, 617, 619, 631, 641, 643, 647, 653, 659, 661, 673, 677, 683, 691, 701, 709, 719, 727, 733, 739, 743, 751, 757, 761, 769, 773, 787, 797, 809, 811, 821, 823, 827, 829, 839, 853, 857, 859, 863, 877, 881, 883, 887, 907, 911, 919, 929, 937, 941, 947, 953, 967, 971, 977, 983, 991, 997}
     
     def __init__(self, number, prime) -> None:
         
         if prime not in GaloisField.PRIMES:
-            raise ValueError(f"Not a prime {prime}")
-        object.__setattr__(self, '_initialized', False)
+            if not isinstance(prime, int) or not isPrime(prime):
+                raise ValueError(f"Not a prime {prime}")
+            GaloisField.PRIMES.add(prime)
         object.__setattr__(self, 'number', number % prime)
         object.__setattr__(self, 'prime', prime)
-        object.__setattr__(self, '_initialized', True)
 
 
     def __setattr__(self, name, value):
-        if self.__dict__.get('_initialized', False):
-            raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
-        super().__setattr__(name, value)
+        raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
 
 
     def __delattr__(self, name):
         raise AttributeError(f"{self.__class__.__name__} does not support attribute deletion")
+
+
+    def __reduce__(self):
+        return (GaloisField, (self.number, self.prime))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
         
         
     def __str__(self):
@@ -98,24 +111,13 @@ class GaloisField:
     
     
     def __truediv__(self, other):
-
-        def extendedEuclidAlgorithm(a, b):
-            x, y, prev_x, prev_y = 0, 1, 1, 0
-            while b != 0:
-                quotient = a // b
-                a, b = b, a % b
-                x, prev_x = prev_x - quotient * x, x
-                y, prev_y = prev_y - quotient * y, y
-            return a, prev_x, prev_y
-        
         if isinstance(other, GaloisField) and self.prime == other.prime:
-            _, x, _ = extendedEuclidAlgorithm(other.number, self.prime)
-            return self * GaloisField(x, self.prime)
-        elif isinstance(other, int):
-            _, x, _ = extendedEuclidAlgorithm(other, self.prime)
-            return self * GaloisField(x, self.prime)
-        else:
+            other = other.number
+        elif not isinstance(other, int):
             return NotImplemented
+        if other % self.prime == 0:
+            raise ZeroDivisionError(f"Division by zero modulo {self.prime}")
+        return GaloisField(self.number * pow(other, -1, self.prime), self.prime)
         
 
     def __rtruediv__(self, other):
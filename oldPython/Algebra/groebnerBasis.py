@@ -1,179 +1,55 @@
-import copy
 from typing import Callable
-from tqdm import tqdm
-from .polynomial import Polynomial, Monomial
-from .monomialOrders import lexOrder, leadingMonomial, leadingCoefficient
+from .polynomial import Polynomial
+from .monomialOrders import lexOrder
+from .buchberger import BuchbergerEngine, polynomialReduce, syzygy, extendToGroebnerBasis, lcmCriterion, chainCriterion, isInLeadingTermsIdeal, reduceGroebnerBasis, primitivePart
+from .modularGroebner import modularGroebnerBasis
+from .f4 import f4GroebnerBasis
+from .signatureGroebner import signatureGroebnerBasis
+from .fglm import fglmGroebnerBasis
+from .groebnerWalk import walkGroebnerBasis
+from .hilbert import hilbertGroebnerBasis
+from .parallelGroebner import parallelGroebnerBasis
 
-def polynomialReduce(f: Polynomial, G: list[Polynomial], permutation: list[str], order: Callable
-= lexOrder) -> tuple[list[Polynomial], Polynomial]:
-    """
-    Division algorithm of f by G = [g1, g2, ..., gs] using monomial order given by permutation.
-
-    Returns
-    -------
-    ([q1, q2, ..., qs], r) : q are quotients and r is not divisble by all leading terms of G.
-    """
-    field = f.field
-    p = copy.deepcopy(f)
-    r = Polynomial({}, field)
-    quotients = [Polynomial({}, field) for _ in range(len(G))]
-    G_monomials_list = [leadingMonomial(g, permutation, order) for g in G]
-    G_leading_coefficients = [leadingCoefficient(g, permutation, order) for g in G]
-
-    while not p.isZeroPolynomial():
-        p_monomial = leadingMonomial(p, permutation, order)
-        p_coefficient = leadingCoefficient(p, permutation, order)
-        somethingDivided = False
-
-        for i, g in enumerate(G):
-            try:
-                power = p_monomial / G_monomials_list[i]
-                coefficient = p_coefficient / G_leading_coefficients[i]
-                quotients[i] += Polynomial({power: coefficient}, field)
-                p -= Polynomial({power: coefficient}, field) * g
-                somethingDivided = True
-                break  
-            
-            except ValueError:
-                pass
-        
-
-        if not somethingDivided:
-            r += Polynomial({p_monomial: p_coefficient}, field)
-            p -= Polynomial({p_monomial: p_coefficient}, field)
-
-    return quotients, r
-
-
-def syzygy(f: Polynomial, g: Polynomial, permutation: list[str], order: Callable
- = lexOrder) -> Polynomial:
-    """
-    Returns
-    -------
-    S(f, g) = lcm(LT(f), LT(g)) / LT(f) * f - lcm(LT(f), LT(g)) / LT(g) * g
-
-    lcm is least common multiple of monomials, leading terms are calcualted based on monomial order given by permutation.
-    """
-    f_monomial = leadingMonomial(f, permutation, order)
-    f_coefficient = leadingCoefficient(f, permutation, order)
-    g_monomial = leadingMonomial(g, permutation, order)
-    g_coefficient = leadingCoefficient(g, permutation, order)
-    m = Monomial.leastCommonMultiple(f_monomial, g_monomial)
-    a = Polynomial({m / f_monomial: 1 / f_coefficient}, f.field)
-    b = Polynomial({m / g_monomial: 1 / g_coefficient}, g.field)
-    return a * f - b * g
-
-
-def extendToGroebnerBasis(Basis: list[Polynomial], permutation = list[str], order: Callable
- = lexOrder) -> list[Polynomial]:
-    """
-    Returns
-    -------
-    Extends a given basis to a Groebner basis using Buchberger's algorithm. Monomial order is determined by permuation.
-    """
-    G = list(Basis)
-    while True: 
-        H = list(G)
-        for i in tqdm(range(len(G))):
-            for j in range(i + 1, len(G)):
-                if lcmCriterion(leadingMonomial(G[i], permutation, order), leadingMonomial(G[j], permutation, order)):
-                    continue
-                if chainCriterion(i, j, G, permutation):
-                    continue
-                _, r = polynomialReduce(syzygy(G[i], G[j], permutation, order), G, permutation, order)
-                if not r.isZeroPolynomial():
-                    H.append(r)
-
-        if len(G) == len(H):
-            return H
-        else:
-            G = H
-
-
-def lcmCriterion(alpha: Monomial, beta: Monomial) -> bool:
-    """
-    Returns
-    -------
-    True if monomials are relativly prime that is their prdouct is equal to their least common multiple, False otherwise. 
-    """
-    return Monomial.leastCommonMultiple(alpha, beta) == alpha * beta
-
-
-def chainCriterion(i: int, j: int, G: list[Polynomial], permutation: list[str], order: Callable
- = lexOrder) -> bool:
-    """
-    Returns
-    -------
-    True if the pair (i, j) , i < j is critical that is there is k not equal to i and j such LT(G[k]) | lcm(LT(G[i]), LT(G[j])), and pairs (i, k), (j, k) have been already checked in Buchberger's algorithm. False otherwise. 
-    """
-    for k in range(j + 1, len(G)):
-        try:
-            _ = Monomial.leastCommonMultiple(leadingMonomial(G[i], permutation, order), leadingMonomial(G[j], permutation)) / leadingMonomial(G[k], permutation, order)
-            return True
-        except ValueError:
-            pass
-    return False
-
-
-def isInLeadingTermsIdeal(f: Polynomial, G: list[Polynomial], permutation = list[str], order: Callable
- = lexOrder) -> bool:
-    """
-    Returns
-    -------
-    True if f is in the ideal generated by leading terms of G, False otherwise.
-    """
-    for g in G:
-        try:
-            _ = leadingMonomial(f, permutation, order) / leadingMonomial(g, permutation, order)
-            return True
-        except ValueError:
-            pass
-    return False
-
-
-
-def reduceGroebnerBasis(G: list[Polynomial], permutation: list[str], order: Callable
- = lexOrder, normalizeCoefficients: bool = True) -> list[Polynomial]:
-    """
-    Returns
-    -------
-    Reduces a Groebner basis to a minimal Groebner basis, that is:
-    1. For each g in G, g is not divisible by leading terms of other polynomials in G.
-    2. For each g in G, g is reduced by other polynomials in G.
-    3. If normalizeCoefficients is True, each polynomial is divided by it's leading coefficient.
-    """
-    H = list(G)
-    for g in G:
-        H.remove(g)
-        if not isInLeadingTermsIdeal(g, H, permutation, order):
-            H.append(g)
-
-    s = len(H)
-    counter = 0
-    while counter < s:
-
-        counter = 0
-        for i, h in enumerate(H):
-            F = list(H)
-            F.remove(h)
-            _, r = polynomialReduce(h, F, permutation, order)
-            H[i] = r
-
-            if r == h:
-                counter += 1
-
-    if normalizeCoefficients:
-        for i, h in enumerate(H):
-            H[i] *= 1 / leadingCoefficient(h, permutation, order)
-
-    return H
+GROEBNER_ALGORITHMS = ('buchberger', 'modular', 'f4', 'signature', 'fglm', 'walk', 'hilbert', 'parallel')
 
 
 def getGroebnerBasis(G: list[Polynomial], permutation: list[str], order: Callable
- = lexOrder, normalizeCoefficients: bool = True) -> list[Polynomial]:
-    """
-    Returns
-    -------
-    The minimal Groebner basis for a given ideal generated by G using Buchberger's algorithm with respect to monomial order given by permutation.
-    """
-    return reduceGroebnerBasis(extendToGroebnerBasis(G, permutation, order), permutation, order, normalizeCoefficients)
\ No newline at end of file
+ = lexOrder, normalizeCoefficients: bool = True, algorithm: str = 'buchberger', fractionFree: bool = False, statistics: dict = None, hilbertSeries: list[int] = None, processes: int = None) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    The minimal Groebner basis for a given ideal generated by G with respect to monomial order given by permutation. algorithm is one of GROEBNER_ALGORITHMS:
+    - 'buchberger' uses Buchberger's algorithm over the field of G.
+    - 'modular' computes the basis over several primes and lifts it to the rationals, see modularGroebnerBasis. Only for polynomials over rational.
+    - 'f4' reduces batches of critical pairs by Gaussian elimination on Macaulay matrices, see F4Engine. Over GF(p) the elimination is vectorized with NumPy. It is meant for GF(p), over rational the coefficients of the batches grow much faster than with 'buchberger', use 'modular' there.
+    - 'signature' processes critical pairs by signatures and skips reductions to zero by the syzygy and rewrite criteria, see SignatureEngine.
+    - 'fglm' computes the basis for the graded reverse lexicographic order and converts it to the given order by linear algebra on the quotient ring if the ideal is zero-dimensional, see fglm. Other ideals are converted by the Groebner walk. The result is always monic.
+    - 'walk' computes the basis for the graded reverse lexicographic order and converts it to the given order by the Groebner walk, see groebnerWalk. It works for ideals of any dimension and suits elimination orders for implicitization. The result is always monic.
+    - 'hilbert' is for homogeneous G only, inhomogeneous systems can be homogenized first, see homogenize. Pairs are processed degree by degree and the rest of a degree is skipped once the leading terms reach the Hilbert function of the ideal, see HilbertDrivenEngine. hilbertSeries is the numerator of the Hilbert series, for example hilbertNumerator of a basis in another order, if it is None it is taken from the basis for the graded reverse lexicographic order.
+    - 'parallel' reduces the S-polynomials of the next pairs of the queue in a pool of processes, one per CPU if processes is None, and merges the remainders deterministically, see ParallelBuchbergerEngine.
+
+    If fractionFree is True, polynomials over rational or int are kept as primitive integer polynomials during the computation and made monic only at the end, see extendToGroebnerBasis. It has no effect on the other algorithms.
+
+    If statistics is a dict, it is updated with the counters of the engine, for example the number of 'zeroReductions' or the 'avoidedReductions' of the signature algorithm. The modular, FGLM and walk algorithms do not report statistics.
+
+    Raises
+    ------
+    ValueError: If the algorithm is unknown or can not be used for the field of G, or G is not homogeneous for the 'hilbert' algorithm.
+    """
+    if algorithm == 'buchberger':
+        return reduceGroebnerBasis(extendToGroebnerBasis(G, permutation, order, fractionFree, statistics=statistics), permutation, order, normalizeCoefficients, fractionFree)
+    elif algorithm == 'modular':
+        return modularGroebnerBasis(G, permutation, order, normalizeCoefficients)
+    elif algorithm == 'f4':
+        return reduceGroebnerBasis(f4GroebnerBasis(G, permutation, order, statistics), permutation, order, normalizeCoefficients)
+    elif algorithm == 'signature':
+        return reduceGroebnerBasis(signatureGroebnerBasis(G, permutation, order, statistics), permutation, order, normalizeCoefficients)
+    elif algorithm == 'fglm':
+        return fglmGroebnerBasis(G, permutation, order)
+    elif algorithm == 'walk':
+        return walkGroebnerBasis(G, permutation, order)
+    elif algorithm == 'hilbert':
+        return reduceGroebnerBasis(hilbertGroebnerBasis(G, permutation, order, hilbertSeries, statistics), permutation, order, normalizeCoefficients)
+    elif algorithm == 'parallel':
+        return reduceGroebnerBasis(parallelGroebnerBasis(G, permutation, order, processes, statistics), permutation, order, normalizeCoefficients)
+    raise ValueError(f"Unknown algorithm {algorithm}, expected one of {', '.join(GROEBNER_ALGORITHMS)}")
@@ -0,0 +1,159 @@
+from itertools import islice
+from typing import Callable
+from .polynomial import Polynomial, Monomial
+from .monomialOrders import lexOrder
+from .polynomialAccumulator import PolynomialAccumulator
+from .buchberger import BuchbergerEngine, syzygy
+
+
+class GroebnerTrace:
+    """
+    Record of a run of Buchberger's algorithm which can be replayed for other coefficients of the same shape, for example the images of a system over other primes or other specializations of its parameters. Only the useful reductions are kept, every one as (i, j, steps, leadingMonomial, support): the S-polynomial of polynomials i and j, the steps (monomial, k) of its reduction, where the term of the monomial is reduced by polynomial k, and the leading monomial and monomials of the remainder, which becomes the next polynomial. Pairs which reduced to zero are only counted.
+
+    Attributes
+    ----------
+    generators : leading monomials of the nonzero generators, they are polynomials 0, 1, ...
+    reductions : useful reductions in the order they were done.
+    zeroReductions : number of pairs which reduced to zero, replay skips them.
+    active : indices of the polynomials of the final basis.
+    """
+    def __init__(self, permutation: list[str], order: Callable = lexOrder):
+        self.permutation = permutation
+        self.order = order
+        self.generators = []
+        self.reductions = []
+        self.zeroReductions = 0
+        self.active = []
+
+
+    def replayReduction(self, f: Polynomial, steps: list[tuple[Monomial, int]], polynomials: list[Polynomial], support: frozenset) -> Polynomial:
+        """
+        Returns
+        -------
+        The remainder of f reduced by the recorded steps, without searching for reducers.
+
+        Raises
+        ------
+        ValueError: If a term of f is not the one of the next step and not a monomial of the recorded remainder, or a step is left when f is reduced.
+        """
+        permutation = self.permutation
+        order = self.order
+        p = PolynomialAccumulator(f, permutation, order)
+        r = {}
+        position = 0
+        while True:
+            term = p.popLeadingTerm()
+            if term is None:
+                break
+            monomial, coefficient = term
+            if position < len(steps) and steps[position][0] == monomial:
+                g = polynomials[steps[position][1]]
+                terms = g.sortedTerms(permutation, order)
+                p.subtractMultiple(coefficient * g.coefficientInverse(terms[0][1]), monomial / terms[0][0], islice(terms, 1, None))
+                position += 1
+            elif monomial in support:
+                r[monomial] = coefficient
+            else:
+                raise ValueError(f"The term {monomial} does not appear in the trace.")
+        if position < len(steps):
+            raise ValueError(f"The term {steps[position][0]} of the trace vanished.")
+        return Polynomial(r, f.domain)
+
+
+    def replay(self, F: list[Polynomial]) -> list[Polynomial]:
+        """
+        Applies the trace to the generators F, which must be in the order of the traced run. Every recorded S-polynomial is reduced by its recorded steps, pairs which reduced to zero and the search for reducers are skipped.
+
+        Returns
+        -------
+        A Groebner basis of the ideal generated by F if the trace is valid for it, it is not reduced. Zero reductions are not checked, so for an unlucky traced run the result has to be verified, see isGroebnerBasisOf.
+
+        Raises
+        ------
+        ValueError: If the trace stops being valid: a generator or a remainder has another leading monomial, or a reduction meets a term the traced run did not have or misses one it had.
+        """
+        permutation = self.permutation
+        order = self.order
+        polynomials = [f for f in F if not f.isZeroPolynomial()]
+        if len(polynomials) != len(self.generators):
+            raise ValueError(f"The trace has {len(self.generators)} generators, got {len(polynomials)}.")
+        for index, (f, leading) in enumerate(zip(polynomials, self.generators)):
+            if f.leadingTerm(permutation, order)[0] != leading:
+                raise ValueError(f"The leading monomial of generator {index} does not match the trace.")
+        for number, (i, j, steps, leading, support) in enumerate(self.reductions):
+            try:
+                r = self.replayReduction(syzygy(polynomials[i], polynomials[j], permutation, order), steps, polynomials, support)
+            except ValueError as error:
+                raise ValueError(f"The trace is not valid at reduction {number}: {error}") from error
+            if r.leadingTerm(permutation, order)[0] != leading:
+                raise ValueError(f"The trace is not valid at reduction {number}: the leading monomial of the remainder does not match.")
+            polynomials.append(r)
+        return [polynomials[k] for k in self.active]
+
+
+class TracingBuchbergerEngine(BuchbergerEngine):
+    """
+    BuchbergerEngine recording its run in a GroebnerTrace, see GroebnerTrace.replay. With fractionFree the recorded steps and monomials are the same as over the field, so the trace replays over any field.
+    """
+    def __init__(self, permutation: list[str], order: Callable = lexOrder, strategy: str = 'normal', fractionFree: bool = False):
+        super().__init__(permutation, order, strategy, fractionFree)
+        self.trace = GroebnerTrace(permutation, order)
+
+
+    def addPolynomials(self, F: list[Polynomial]) -> None:
+        """
+        Adds polynomials to the basis, see BuchbergerEngine.addPolynomials, and records their leading monomials.
+
+        Raises
+        ------
+        ValueError: If the engine already found new basis elements, then the trace can not be replayed.
+        """
+        if self.trace.reductions:
+            raise ValueError("Generators can not be added to a traced run after reductions.")
+        before = len(self.polynomials)
+        super().addPolynomials(F)
+        self.trace.generators.extend(self.leadingMonomials[before:])
+
+
+    def step(self, trace: list = None) -> Polynomial:
+        """
+        Reduces the S-polynomial of the selected pair by BuchbergerEngine.step and records the reduction. If trace is a list, the reduction steps are also appended to it, see BuchbergerEngine.step.
+
+        Returns
+        -------
+        The new basis element or None if the S-polynomial reduced to zero or there are no pairs left.
+        """
+        if not self.pairs:
+            return None
+        _, i, j, _, _ = self.pairs[0]
+        steps = []
+        r = super().step(steps)
+        if trace is not None:
+            trace.extend(steps)
+        if r is None:
+            self.trace.zeroReductions += 1
+            return None
+        self.trace.reductions.append((i, j, steps, r.leadingTerm(self.permutation, self.order)[0], frozenset(r.coefficients)))
+        return r
+
+
+    def run(self) -> None:
+        """
+        Processes pairs until the queue is empty and records the final basis in the trace.
+        """
+        super().run()
+        self.trace.active = list(self.active)
+
+
+def traceGroebnerBasis(Basis: list[Polynomial], permutation: list[str], order: Callable = lexOrder, statistics: dict = None) -> tuple[list[Polynomial], GroebnerTrace]:
+    """
+    Returns
+    -------
+    A Groebner basis of the ideal generated by Basis, it is not reduced, and the GroebnerTrace of its computation by TracingBuchbergerEngine. If statistics is a dict, it is updated with the statistics of the engine.
+    """
+    engine = TracingBuchbergerEngine(permutation, order)
+    engine.addPolynomials(Basis)
+    engine.run()
+    if statistics is not None:
+        statistics.update(engine.statistics)
+    return engine.basis(), engine.trace
@@ -0,0 +1,161 @@
+from fractions import Fraction
+from math import gcd, lcm
+from typing import Callable
+from .polynomial import Polynomial, Monomial
+from .monomialOrders import MonomialOrder, MatrixOrder, LexOrder, GradedLexOrder, GradedRevLexOrder, WeightedOrder, BlockOrder, lexOrder, gradedRevLexOrder
+from .buchberger import polynomialReduce, extendToGroebnerBasis, reduceGroebnerBasis
+
+
+def orderMatrix(order: MonomialOrder, n: int) -> list[list[int]]:
+    """
+    Returns
+    -------
+    Rows of a matrix defining the monomial order on n variables as a MatrixOrder, its first row is the weight vector of the order.
+
+    Raises
+    ------
+    ValueError: If the order is not a MonomialOrder with a known matrix.
+    """
+    identity = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+    if isinstance(order, MatrixOrder):
+        return [list(row) for row in order.matrix]
+    elif isinstance(order, LexOrder):
+        return identity
+    elif isinstance(order, GradedLexOrder):
+        return [[1] * n] + identity
+    elif isinstance(order, GradedRevLexOrder):
+        return [[1] * n] + [[-1 if j == n - 1 - i else 0 for j in range(n)] for i in range(n - 1)]
+    elif isinstance(order, WeightedOrder):
+        return [list(order.weights)] + orderMatrix(order.tieBreakOrder, n)
+    elif isinstance(order, BlockOrder):
+        rows = []
+        start = 0
+        for blockOrder, size in order.blocks:
+            size = n - start if size is None else size
+            for row in orderMatrix(blockOrder, size):
+                rows.append([0] * start + list(row) + [0] * (n - start - size))
+            start += size
+        return rows
+    raise ValueError(f"No matrix is known for the order {order}")
+
+
+def exponentVector(monomial: Monomial, permutation: list[str]) -> list[int]:
+    """
+    Returns
+    -------
+    The exponents of the monomial listed in the order of permutation.
+    """
+    exponent = monomial.exponent
+    return [exponent.get(var, 0) for var in permutation]
+
+
+def initialForm(g: Polynomial, weight: list[int], permutation: list[str]) -> Polynomial:
+    """
+    Returns
+    -------
+    The sum of the terms of g of the largest weight.
+    """
+    weights = {monomial: sum(w * e for w, e in zip(weight, exponentVector(monomial, permutation))) for monomial in g.coefficients}
+    top = max(weights.values())
+    return Polynomial({monomial: coefficient for monomial, coefficient in g.coefficients.items() if weights[monomial] == top}, g.domain)
+
+
+def targetWeight(matrix: list[list[int]], degree: int) -> list[int]:
+    """
+    Returns
+    -------
+    The weight sum of degree^(k - i) * row_i over the k rows of the matrix, it orders monomials with exponents smaller than degree as the matrix order.
+    """
+    k = len(matrix)
+    return [sum(degree ** (k - 1 - i) * row[j] for i, row in enumerate(matrix)) for j in range(len(matrix[0]))]
+
+
+def nextWeight(G: list[Polynomial], permutation: list[str], order: Callable, weight: list[int], targetWeight: list[int]) -> list[int]:
+    """
+    Returns
+    -------
+    The first weight after the current one on the segment to targetWeight, including targetWeight itself, where an initial form of an element of G with respect to the order stops being its leading term, scaled to coprime integers. None if there is no such weight, then G is a Groebner basis for the order given by targetWeight refined by the order.
+    """
+    smallest = None
+    for g in G:
+        leading = exponentVector(g.leadingTerm(permutation, order)[0], permutation)
+        for monomial in g.coefficients:
+            gamma = [a - b for a, b in zip(leading, exponentVector(monomial, permutation))]
+            current = sum(w * c for w, c in zip(weight, gamma))
+            target = sum(w * c for w, c in zip(targetWeight, gamma))
+            if target <= 0 and current > 0:
+                t = Fraction(current, current - target)
+                if smallest is None or t < smallest:
+                    smallest = t
+    if smallest is None:
+        return None
+    point = [(1 - smallest) * w + smallest * v for w, v in zip(weight, targetWeight)]
+    denominator = lcm(*[x.denominator for x in point])
+    point = [int(x * denominator) for x in point]
+    divisor = gcd(*point)
+    return [x // divisor for x in point]
+
+
+def walkStep(G: list[Polynomial], permutation: list[str], order: Callable, weight: list[int], target: list[list[int]]) -> tuple[list[Polynomial], MatrixOrder]:
+    """
+    Returns
+    -------
+    The reduced Groebner basis for the order given by weight refined by the target matrix and that order, computed from the reduced Groebner basis G for the order. The basis of the initial forms in_w(G) is computed for the new order and every element h of it is lifted to sum q_g * g, where h = sum q_g * in_w(g) is found by division with respect to the old order.
+    """
+    initials = [initialForm(g, weight, permutation) for g in G]
+    walkOrder = MatrixOrder([weight] + target)
+    H = reduceGroebnerBasis(extendToGroebnerBasis(initials, permutation, walkOrder), permutation, walkOrder)
+    lifted = []
+    for h in H:
+        quotients, _ = polynomialReduce(h, initials, permutation, order)
+        f = Polynomial({}, h.domain)
+        for q, g in zip(quotients, G):
+            if not q.isZeroPolynomial():
+                f = f + q * g
+        lifted.append(f)
+    return reduceGroebnerBasis(lifted, permutation, walkOrder), walkOrder
+
+
+def groebnerWalk(G: list[Polynomial], permutation: list[str], order: Callable, targetOrder: Callable = lexOrder) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    The reduced Groebner basis for the target order of the ideal with reduced Groebner basis G for the order given by permutation, converted by the Groebner walk. Both orders are given as matrix orders by orderMatrix. The weight vector moves on the segment from the weight of the order to a perturbed target weight, see targetWeight, and at every weight where the Groebner cone changes the basis is converted by walkStep, so only bases of initial forms are computed by Buchberger's algorithm. At the end the leading terms are compared with the target order, if the perturbation was too small the degree of the perturbation grows and the walk continues.
+
+    Raises
+    ------
+    ValueError: If one of the orders is not a MonomialOrder with a known matrix.
+    """
+    G = [g for g in G if not g.isZeroPolynomial()]
+    if not G or any(g.leadingTerm(permutation, order)[0].degree() == 0 for g in G):
+        return reduceGroebnerBasis(G, permutation, targetOrder)
+    n = len(permutation)
+    target = orderMatrix(targetOrder, n)
+    weight = orderMatrix(order, n)[0]
+    G, currentOrder = walkStep(G, permutation, order, weight, target)
+    degree = 1 + max(g.totalDegree() for g in G)
+    while True:
+        goal = targetWeight(target, degree)
+        while weight != goal:
+            step = nextWeight(G, permutation, currentOrder, weight, goal)
+            if step is None:
+                weight = goal
+                currentOrder = MatrixOrder([weight] + target)
+            else:
+                weight = step
+                G, currentOrder = walkStep(G, permutation, currentOrder, weight, target)
+        if all(g.leadingTerm(permutation, currentOrder)[0] == g.leadingTerm(permutation, targetOrder)[0] for g in G):
+            return reduceGroebnerBasis(G, permutation, targetOrder)
+        degree = max(2 * degree, 1 + max(g.totalDegree() for g in G))
+
+
+def walkGroebnerBasis(G: list[Polynomial], permutation: list[str], order: Callable = lexOrder) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    The reduced Groebner basis of the ideal generated by G for the order given by permutation, computed by Buchberger's algorithm for the graded reverse lexicographic order and converted by groebnerWalk.
+    """
+    H = reduceGroebnerBasis(extendToGroebnerBasis(G, permutation, gradedRevLexOrder), permutation, gradedRevLexOrder)
+    if order == gradedRevLexOrder:
+        return H
+    return groebnerWalk(H, permutation, gradedRevLexOrder, order)
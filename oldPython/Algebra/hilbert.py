@@ -0,0 +1,205 @@
+import heapq
+from math import comb
+from typing import Callable
+from tqdm import tqdm
+from .polynomial import Polynomial, Monomial
+from .monomialOrders import lexOrder, gradedRevLexOrder
+from .buchberger import BuchbergerEngine, extendToGroebnerBasis, reduceGroebnerBasis
+
+
+def isHomogeneous(f: Polynomial) -> bool:
+    """
+    Returns
+    -------
+    True if all monomials of f have the same total degree.
+    """
+    return len({monomial.degree() for monomial in f.coefficients}) <= 1
+
+
+def homogenize(f: Polynomial, var: str) -> Polynomial:
+    """
+    Returns
+    -------
+    The homogenization of f with respect to the new variable var, every monomial m is multiplied by var^(deg(f) - deg(m)).
+
+    Raises
+    ------
+    ValueError: If var is already a variable of f.
+    """
+    if var in f.getVariables:
+        raise ValueError(f"The variable {var} is already in the polynomial")
+    degree = f.totalDegree()
+    return Polynomial({Monomial({**monomial.exponent, var: degree - monomial.degree()}): coefficient for monomial, coefficient in f.coefficients.items()}, f.domain)
+
+
+def dehomogenize(f: Polynomial, var: str) -> Polynomial:
+    """
+    Returns
+    -------
+    The polynomial f with the variable var set to 1.
+    """
+    domain = f.domain
+    result = {}
+    for monomial, coefficient in f.coefficients.items():
+        exponent = dict(monomial.exponent)
+        exponent.pop(var, None)
+        newMonomial = Monomial(exponent)
+        result[newMonomial] = domain.add(result[newMonomial], coefficient) if newMonomial in result else coefficient
+    return Polynomial({monomial: coefficient for monomial, coefficient in result.items() if not domain.isZero(coefficient)}, domain)
+
+
+def _minimalExponents(exponents: list[tuple[int]]) -> list[tuple[int]]:
+    exponents = sorted(set(exponents), key = sum)
+    minimal = []
+    for a in exponents:
+        if not any(all(x <= y for x, y in zip(b, a)) for b in minimal):
+            minimal.append(a)
+    return minimal
+
+
+def _numerator(exponents: list[tuple[int]]) -> list[int]:
+    if not exponents:
+        return [1]
+    supports = [{i for i, x in enumerate(a) if x} for a in exponents]
+    if all(not (supports[i] & supports[j]) for i in range(len(supports)) for j in range(i)):
+        result = [1]
+        for a in exponents:
+            d = sum(a)
+            shifted = [0] * d + [-x for x in result]
+            result = [x + y for x, y in zip(result + [0] * d, shifted)]
+        return result
+    pivot = exponents[-1]
+    rest = exponents[:-1]
+    first = _numerator(rest)
+    second = _numerator(_minimalExponents([tuple(max(x - y, 0) for x, y in zip(a, pivot)) for a in rest]))
+    d = sum(pivot)
+    result = first + [0] * max(0, d + len(second) - len(first))
+    for i, x in enumerate(second):
+        result[d + i] -= x
+    while len(result) > 1 and result[-1] == 0:
+        result.pop()
+    return result
+
+
+def monomialHilbertNumerator(monomials: list[Monomial], permutation: list[str]) -> list[int]:
+    """
+    Returns
+    -------
+    The coefficients [N_0, N_1, ...] of the numerator N(t) of the Hilbert series N(t) / (1 - t)^n of the quotient of the polynomial ring in the n variables of permutation by the ideal generated by the monomials. It is computed by the recursion N(I + <m>) = N(I) - t^deg(m) N(I : m) until the generators have disjoint supports.
+    """
+    return _numerator(_minimalExponents([tuple(monomial.exponent.get(var, 0) for var in permutation) for monomial in monomials]))
+
+
+def hilbertNumerator(G: list[Polynomial], permutation: list[str], order: Callable = lexOrder) -> list[int]:
+    """
+    Returns
+    -------
+    The numerator of the Hilbert series of the ideal with Groebner basis G, see monomialHilbertNumerator. For a homogeneous ideal it does not depend on the monomial order of G.
+    """
+    return monomialHilbertNumerator([g.leadingTerm(permutation, order)[0] for g in G if not g.isZeroPolynomial()], permutation)
+
+
+def hilbertFunction(numerator: list[int], n: int, degree: int) -> int:
+    """
+    Returns
+    -------
+    The dimension of the degree part of the quotient ring with Hilbert series numerator(t) / (1 - t)^n, the number of monomials of the degree outside the leading terms ideal.
+    """
+    if n == 0:
+        return numerator[degree] if degree < len(numerator) else 0
+    return sum(x * comb(degree - i + n - 1, n - 1) for i, x in enumerate(numerator) if i <= degree)
+
+
+class HilbertDrivenEngine(BuchbergerEngine):
+    """
+    Buchberger's algorithm for homogeneous ideals driven by a known Hilbert series. Pairs are processed degree by degree with the sugar strategy, for homogeneous polynomials the sugar of a pair is the degree of its S-polynomial. The leading monomials found so far generate a subideal of the leading terms ideal, so the Hilbert function of the current basis is at least the one of the ideal. As soon as they agree in the degree of the next pair, the leading terms ideal is complete in that degree and the remaining pairs of the degree are dropped without reduction, they would all reduce to zero.
+
+    statistics counts in addition to the BuchbergerEngine ones the pairs dropped by the 'hilbertCriterion'.
+    """
+    def __init__(self, permutation: list[str], order: Callable, hilbertSeries: list[int]):
+        super().__init__(permutation, order, 'sugar')
+        self.hilbertSeries = list(hilbertSeries)
+        self.statistics['hilbertCriterion'] = 0
+        self._numerator = None
+        self._size = None
+
+
+    def addPolynomials(self, F: list[Polynomial]) -> None:
+        """
+        Adds homogeneous polynomials to the basis, see BuchbergerEngine.addPolynomials.
+
+        Raises
+        ------
+        ValueError: If a polynomial is not homogeneous.
+        """
+        if not all(isHomogeneous(f) for f in F):
+            raise ValueError("The Hilbert driven algorithm needs homogeneous polynomials, see homogenize.")
+        super().addPolynomials(F)
+
+
+    def currentHilbertFunction(self, degree: int) -> int:
+        """
+        Returns
+        -------
+        The Hilbert function in the degree of the ideal generated by the leading monomials of the active basis.
+        """
+        if self._size != len(self.polynomials):
+            self._numerator = monomialHilbertNumerator([self.leadingMonomials[i] for i in self.active], self.permutation)
+            self._size = len(self.polynomials)
+        return hilbertFunction(self._numerator, len(self.permutation), degree)
+
+
+    def run(self) -> None:
+        """
+        Processes pairs degree by degree until the queue is empty, skipping the rest of a degree once its Hilbert function is reached.
+
+        Raises
+        ------
+        ValueError: If the leading terms found have a smaller Hilbert function than hilbertSeries, then it is not the Hilbert series of the ideal. A series with a larger Hilbert function than the ideal is not always detected and may end a degree too early, one with a smaller Hilbert function only disables the criterion.
+        """
+        n = len(self.permutation)
+        progress = tqdm(total=len(self.pairs))
+        while self.pairs:
+            degree = self.pairs[0][4]
+            current = self.currentHilbertFunction(degree)
+            expected = hilbertFunction(self.hilbertSeries, n, degree)
+            if current < expected:
+                raise ValueError("The Hilbert series does not match the ideal.")
+            if current == expected:
+                dropped = len(self.pairs)
+                self.pairs = [pair for pair in self.pairs if pair[4] != degree]
+                heapq.heapify(self.pairs)
+                dropped -= len(self.pairs)
+                self.statistics['hilbertCriterion'] += dropped
+                progress.update(dropped)
+                continue
+            before = len(self.pairs)
+            self.step()
+            progress.total += max(0, len(self.pairs) - before + 1)
+            progress.update(1)
+        progress.close()
+
+
+def hilbertGroebnerBasis(Basis: list[Polynomial], permutation: list[str], order: Callable = lexOrder, hilbertSeries: list[int] = None, statistics: dict = None) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    A Groebner basis of the ideal generated by the homogeneous polynomials Basis computed by HilbertDrivenEngine, it is not reduced. hilbertSeries is the numerator of the Hilbert series of the ideal, see hilbertNumerator. If it is None, the basis is first computed for the graded reverse lexicographic order and its Hilbert series drives the computation for the given order. If statistics is a dict, it is updated with the statistics of the engine.
+
+    Raises
+    ------
+    ValueError: If a polynomial is not homogeneous or the leading terms found have a smaller Hilbert function than hilbertSeries.
+    """
+    if not all(isHomogeneous(f) for f in Basis):
+        raise ValueError("The Hilbert driven algorithm needs homogeneous polynomials, see homogenize.")
+    if hilbertSeries is None:
+        Basis = reduceGroebnerBasis(extendToGroebnerBasis(Basis, permutation, gradedRevLexOrder), permutation, gradedRevLexOrder)
+        if order == gradedRevLexOrder:
+            return Basis
+        hilbertSeries = hilbertNumerator(Basis, permutation, gradedRevLexOrder)
+    engine = HilbertDrivenEngine(permutation, order, hilbertSeries)
+    engine.addPolynomials(Basis)
+    engine.run()
+    if statistics is not None:
+        statistics.update(engine.statistics)
+    return engine.basis()
@@ -1,6 +1,6 @@
 from typing import Callable
 from .polynomial import Polynomial, Monomial
-from .groebnerBasis import polynomialReduce, getGroebnerBasis
+from .groebnerBasis import polynomialReduce, getGroebnerBasis, reduceGroebnerBasis, BuchbergerEngine
 from .monomialOrders import lexOrder, gradedLexOrder
 
 class Ideal:
@@ -13,6 +13,7 @@ class Ideal:
             self.generators = [Polynomial({}, None)]
             self.variables = []
             self.groebnerBasis = []
+            self._engine = None
         else:
             if len(generators) == 1 and isinstance(generators[0], (list, set, tuple)):
                 generators = generators[0]
@@ -31,6 +32,7 @@ class Ideal:
                 self.variables.update(generator.getVariables)
             self.variables = sorted(list(self.variables))
             self.groebnerBasis = None
+            self._engine = None
     
 
     def __str__(self):
@@ -129,13 +131,13 @@ class Ideal:
         return other.subset(self)
     
 
-    def calculateGroebnerBasis(self, permutation: list[str], order: Callable = lexOrder) -> list[Polynomial]:
+    def calculateGroebnerBasis(self, permutation: list[str], order: Callable = lexOrder, algorithm: str = 'fglm', statistics: dict = None) -> list[Polynomial]:
         """
         Returns:
         --------
-        The reduced Groebner basis for the ideal with respect to the monomial order given by permutation.
+        The reduced Groebner basis for the ideal with respect to the monomial order given by permutation, computed by the given algorithm of getGroebnerBasis. By default zero-dimensional ideals are converted from the graded reverse lexicographic basis by FGLM.
         """
-        return getGroebnerBasis(self.generators, permutation, order)
+        return getGroebnerBasis(self.generators, permutation, order, algorithm=algorithm, statistics=statistics)
     
 
     def reduceBasis(self, permutation : list[str] = None, order: Callable = gradedLexOrder) -> None:
@@ -145,7 +147,53 @@ class Ideal:
         if permutation is None:
             permutation = self.variables
         self.generators = getGroebnerBasis(self.generators, permutation, order)
-        self.groebnerBasis = self.generators
+        if list(permutation) == self.variables and order == lexOrder:
+            self.groebnerBasis = self.generators
+        else:
+            self.groebnerBasis = None
+        self._engine = None
+    
+
+    def addGenerators(self, *generators) -> None:
+        """
+        Adds generators to the ideal and extends its Groebner basis with respect to lex order on the variables of the ideal. The first call starts from the stored Groebner basis, if it was computed, and only the pairs created by the new generators are processed. The BuchbergerEngine is kept with the ideal, so a further call continues from its basis and pair queue. If the generators bring new variables, the engine is started again from the stored basis.
+
+        Raises
+        ------
+        TypeError: If the generators are not polynomials.
+        ValueError: If the generators are not over the same field as the ideal.
+        """
+        if len(generators) == 1 and isinstance(generators[0], (list, set, tuple)):
+            generators = list(generators[0])
+        else:
+            generators = list(generators)
+        if not all(isinstance(generator, Polynomial) for generator in generators):
+            raise TypeError(f"Generators must be polynomials")
+        if self.field is None and generators:
+            self.field = generators[0].field
+            self.generators = []
+        if not all(generator.field == self.field for generator in generators):
+            raise ValueError("All generators must be over the same field")
+
+        variables = set(self.variables)
+        for generator in generators:
+            variables.update(generator.getVariables)
+        variables = sorted(list(variables))
+        if variables != self.variables:
+            self.variables = variables
+            self._engine = None
+
+        if self._engine is None:
+            self._engine = BuchbergerEngine(self.variables, lexOrder)
+            if self.groebnerBasis is not None:
+                self._engine.addBasis(self.groebnerBasis)
+            else:
+                self._engine.addPolynomials(self.generators)
+        present = set(self.generators)
+        self.generators += [generator for generator in set(generators) if generator not in present]
+        self._engine.addPolynomials(generators)
+        self._engine.run()
+        self.groebnerBasis = reduceGroebnerBasis(self._engine.basis(), self.variables, lexOrder)
     
 
     def isInIdeal(self, f: Polynomial) -> bool:
@@ -173,7 +221,7 @@ class Ideal:
         """
         Returns
         -------
-        Algebraic sum of two ideals.
+        Algebraic sum of two ideals. If the Groebner basis of self is stored, the basis of the sum is extended from it by addGenerators.
 
         Raises
         ------
@@ -184,6 +232,11 @@ class Ideal:
             raise TypeError("The argument must be an ideal.")
         elif self.field != other.field:
             raise ValueError("The ideals must be over the same field.")
+        elif self.groebnerBasis is not None:
+            result = Ideal(self.generators)
+            result.groebnerBasis = list(self.groebnerBasis)
+            result.addGenerators(other.generators)
+            return result
         else:
             return Ideal(self.generators + other.generators)
     
@@ -233,7 +286,7 @@ class Ideal:
             K = tI + sJ
             variables = list(set(self.variables + other.variables))
             permutation = [Monomial.DUMMY] + variables
-            G = K.calculateGroebnerBasis(permutation, lexOrder)
+            G = K.calculateGroebnerBasis(permutation, lexOrder, algorithm='walk')
             H = Ideal.eliminationIdeal(G, variables)
             return Ideal(H)
         
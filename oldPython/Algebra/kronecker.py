@@ -0,0 +1,99 @@
+from math import prod
+
+KRONECKER_MIN_PRODUCTS = 256
+KRONECKER_MAX_SLOTS_RATIO = 1
+
+
+def productSlots(fExponents: list[tuple[int]], gExponents: list[tuple[int]]) -> list[int]:
+    """
+    Returns
+    -------
+    Radices of the Kronecker substitution for the product of polynomials with given exponent tuples, which is the maximal exponent of every variable in the product plus one.
+    """
+    n = len(fExponents[0])
+    fDegrees = [max(exponents[t] for exponents in fExponents) for t in range(n)]
+    gDegrees = [max(exponents[t] for exponents in gExponents) for t in range(n)]
+    return [a + b + 1 for a, b in zip(fDegrees, gDegrees)]
+
+
+def isDense(fExponents: list[tuple[int]], gExponents: list[tuple[int]]) -> bool:
+    """
+    Returns
+    -------
+    True if the product of polynomials with given exponent tuples is large enough and the polynomials are dense enough so that Kronecker substitution beats term by term multiplication, False otherwise. The product has to have at least KRONECKER_MIN_PRODUCTS term products and at most KRONECKER_MAX_SLOTS_RATIO packed slots per term product.
+    """
+    products = len(fExponents) * len(gExponents)
+    if products < KRONECKER_MIN_PRODUCTS or not fExponents[0]:
+        return False
+    return prod(productSlots(fExponents, gExponents)) <= KRONECKER_MAX_SLOTS_RATIO * products
+
+
+def _pack(terms: list[tuple[tuple[int], int]], radices: list[int], slotBytes: int) -> int:
+    """
+    Returns
+    -------
+    The integer sum of c * 2^(8 * slotBytes * i) where i is the Kronecker index of the exponents of the term, for coefficients c of absolute value below 2^(8 * slotBytes - 1).
+    """
+    size = prod(radices) * slotBytes
+    positive = bytearray(size)
+    negative = bytearray(size)
+    hasNegative = False
+    for exponents, coefficient in terms:
+        index = 0
+        for exponent, radix in zip(reversed(exponents), reversed(radices)):
+            index = index * radix + exponent
+        start = index * slotBytes
+        if coefficient >= 0:
+            positive[start:start + slotBytes] = coefficient.to_bytes(slotBytes, 'little')
+        else:
+            negative[start:start + slotBytes] = (-coefficient).to_bytes(slotBytes, 'little')
+            hasNegative = True
+    result = int.from_bytes(positive, 'little')
+    if hasNegative:
+        result -= int.from_bytes(negative, 'little')
+    return result
+
+
+def _unpack(value: int, radices: list[int], slotBytes: int, signed: bool) -> list[tuple[tuple[int], int]]:
+    """
+    Returns
+    -------
+    Nonzero terms (exponents, coefficient) of the packed integer value. Signed coefficients are recovered by adding 2^(8 * slotBytes - 1) to every slot before reading it.
+    """
+    slots = prod(radices)
+    half = 1 << (8 * slotBytes - 1)
+    if signed:
+        value += int.from_bytes((bytes(slotBytes - 1) + b'\x80') * slots, 'little')
+    data = value.to_bytes(slots * slotBytes, 'little')
+
+    terms = []
+    for index in range(slots):
+        coefficient = int.from_bytes(data[index * slotBytes:(index + 1) * slotBytes], 'little')
+        if signed:
+            coefficient -= half
+        if coefficient:
+            exponents = []
+            rest = index
+            for radix in radices:
+                rest, exponent = divmod(rest, radix)
+                exponents.append(exponent)
+            terms.append((tuple(exponents), coefficient))
+    return terms
+
+
+def kroneckerMultiply(fTerms: list[tuple[tuple[int], int]], gTerms: list[tuple[tuple[int], int]]) -> list[tuple[tuple[int], int]]:
+    """
+    Returns
+    -------
+    The product of two polynomials with integer coefficients given as lists of terms (exponents, coefficient), all exponent tuples of the same length. Both polynomials are packed into single integers by Kronecker substitution x_t -> 2^(k * d_1 * ... * d_(t-1)), so the product is computed by one big integer multiplication.
+    """
+    if not fTerms or not gTerms:
+        return []
+    radices = productSlots([e for e, _ in fTerms], [e for e, _ in gTerms])
+    fMax = max(abs(c) for _, c in fTerms)
+    gMax = max(abs(c) for _, c in gTerms)
+    signed = any(c < 0 for _, c in fTerms) or any(c < 0 for _, c in gTerms)
+    bound = fMax * gMax * min(len(fTerms), len(gTerms))
+    slotBytes = (bound.bit_length() + (2 if signed else 1) + 7) // 8
+    product = _pack(fTerms, radices, slotBytes) * _pack(gTerms, radices, slotBytes)
+    return _unpack(product, radices, slotBytes, signed)
@@ -1,3 +1,6 @@
+from math import isqrt
+
+
 def _euclidAlgorithm2(a: int, b: int) -> int:
     while b != 0:
         a, b = b, a % b
@@ -97,6 +100,34 @@ def extendedEuclidAlgorithm(*args: int) -> tuple[int, list[int]]:
     return d, coefficients
 
 
+def rationalReconstruction(a: int, m: int) -> tuple[int, int]:
+    """
+    Rational number reconstruction by the extended Euclidean algorithm stopped halfway, as in Wang's algorithm.
+
+    Returns
+    -------
+    (n, d) with d > 0, gcd(n, d) = 1, |n|, d <= sqrt(m / 2) and n = a * d mod m. Such a fraction is unique if it exists.
+
+    Raises
+    ------
+    ValueError: If no such fraction exists or m is not positive.
+    """
+    if m < 1:
+        raise ValueError("The modulus must be positive.")
+    bound = isqrt(m // 2)
+    r0, r1 = m, a % m
+    s0, s1 = 0, 1
+    while r1 > bound:
+        quotient = r0 // r1
+        r0, r1 = r1, r0 - quotient * r1
+        s0, s1 = s1, s0 - quotient * s1
+    if s1 < 0:
+        r1, s1 = -r1, -s1
+    if s1 > bound or _euclidAlgorithm2(r1, s1) != 1:
+        raise ValueError(f"{a} mod {m} is not a reconstructible fraction.")
+    return r1, s1
+
+
 def divisors(n: int) -> list[int]:
     """
     Returns
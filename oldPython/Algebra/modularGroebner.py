@@ -0,0 +1,186 @@
+from math import lcm
+from typing import Callable
+from .polynomial import Polynomial
+from .rational import rational
+from .primeField import PrimeField
+from .primes import previousPrime
+from .monomialOrders import lexOrder, leadingMonomial, monomialSortKey
+from .modularArithmetic import rationalReconstruction
+from .buchberger import BuchbergerEngine, polynomialReduce, syzygy, extendToGroebnerBasis, reduceGroebnerBasis
+from .groebnerTrace import traceGroebnerBasis
+
+MODULAR_PRIME_BITS = 64
+MODULAR_PRIME_MAX_BITS = 256
+MODULAR_PRIMES = []
+
+
+class _LiftedBasis:
+    """
+    Reduced monic Groebner bases over several primes with the same leading monomials. Coefficients of equal monomials of the i-th polynomials are combined by the Chinese remainder theorem into integers modulo the product of the primes.
+    """
+    def __init__(self, leadingMonomials: tuple):
+        self.leadingMonomials = leadingMonomials
+        self.modulus = 1
+        self.primes = 0
+        self.coefficients = [{} for _ in leadingMonomials]
+        self.previous = None
+
+
+    def add(self, basis: list[Polynomial], prime: int) -> None:
+        """
+        Lifts the coefficients with the basis computed modulo prime, missing monomials have coefficient zero.
+        """
+        modulus = self.modulus
+        inverse = pow(modulus, -1, prime)
+        for lifted, g in zip(self.coefficients, basis):
+            coefficients = g.coefficients
+            for monomial in lifted.keys() | coefficients.keys():
+                a = lifted.get(monomial, 0)
+                lifted[monomial] = a + modulus * ((coefficients.get(monomial, 0) - a) * inverse % prime)
+        self.modulus = modulus * prime
+        self.primes += 1
+
+
+    def reconstruct(self) -> list[Polynomial]:
+        """
+        Returns
+        -------
+        The basis over the rationals obtained by rational reconstruction of all coefficients or None if some coefficient needs more primes.
+        """
+        modulus = self.modulus
+        basis = []
+        try:
+            for lifted in self.coefficients:
+                coefficients = {}
+                for monomial, c in lifted.items():
+                    numerator, denominator = rationalReconstruction(c, modulus)
+                    coefficients[monomial] = rational(numerator, denominator)
+                basis.append(Polynomial(coefficients, rational))
+        except ValueError:
+            return None
+        return basis
+
+
+def _nextModularPrime(prime: int, bits: int, maxBits: int) -> int:
+    """
+    Returns
+    -------
+    The prime following prime in the sequence of modularPrimes, the first one if prime is None.
+    """
+    if prime is None:
+        return previousPrime(2 ** min(bits, maxBits))
+    elif prime.bit_length() < maxBits:
+        return previousPrime(2 ** min(2 * prime.bit_length(), maxBits))
+    return previousPrime(prime)
+
+
+def modularPrimes(bits: int = MODULAR_PRIME_BITS, maxBits: int = MODULAR_PRIME_MAX_BITS):
+    """
+    Yields primes for the modular algorithms. Each prime has twice as many bits as the previous one until maxBits is reached, then the primes below 2^maxBits follow in decreasing order. Integers have arbitrary precision, so the cost of arithmetic modulo a prime barely depends on its size and large primes keep the number of modular computations small. Primes for the default sizes are remembered in MODULAR_PRIMES.
+    """
+    primes = MODULAR_PRIMES if (bits, maxBits) == (MODULAR_PRIME_BITS, MODULAR_PRIME_MAX_BITS) else []
+    index = 0
+    while True:
+        if index == len(primes):
+            primes.append(_nextModularPrime(primes[-1] if primes else None, bits, maxBits))
+        yield primes[index]
+        index += 1
+
+
+def modularImage(G: list[Polynomial], prime: int) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    The polynomials G over the rationals mapped to PrimeField(prime).
+
+    Raises
+    ------
+    ZeroDivisionError: If prime divides a denominator of a coefficient.
+    """
+    field = PrimeField(prime)
+    return [Polynomial({monomial: field.fromRational(coefficient) for monomial, coefficient in g.coefficients.items()}, field) for g in G]
+
+
+def isGroebnerBasisOf(basis: list[Polynomial], G: list[Polynomial], permutation: list[str], order: Callable = lexOrder, checkSyzygies: bool = True) -> bool:
+    """
+    Returns
+    -------
+    True if every polynomial of G reduces to zero by basis and, if checkSyzygies is True, basis is a Groebner basis, that is the S-polynomials of all pairs kept by the product and chain criteria of BuchbergerEngine reduce to zero. False otherwise.
+    """
+    for f in G:
+        _, r = polynomialReduce(f, basis, permutation, order)
+        if not r.isZeroPolynomial():
+            return False
+
+    if checkSyzygies:
+        engine = BuchbergerEngine(permutation, order)
+        engine.addPolynomials(basis)
+        polynomials = engine.polynomials
+        for _, i, j, _, _ in sorted(engine.pairs):
+            _, r = polynomialReduce(syzygy(polynomials[i], polynomials[j], permutation, order), basis, permutation, order)
+            if not r.isZeroPolynomial():
+                return False
+    return True
+
+
+def modularGroebnerBasis(G: list[Polynomial], permutation: list[str], order: Callable = lexOrder, normalizeCoefficients: bool = True, verify: bool = True, replay: bool = True) -> list[Polynomial]:
+    """
+    Multi-modular Groebner basis of polynomials over the rationals. Reduced bases are computed over PrimeFields of the primes of modularPrimes, so coefficients never grow beyond the prime. Primes dividing a denominator of G are skipped. Bases with different leading monomials come from unlucky primes, they are grouped by their leading monomials and the group with the most primes is lifted, which is the majority vote of modStd. Coefficients are combined by the Chinese remainder theorem and mapped to rationals by rational reconstruction. The result is accepted when the reconstruction stabilizes, that is it is the same after one more prime, and G reduces to zero by it. If verify is True it is also checked to be a Groebner basis by reducing its S-polynomials over the rationals.
+
+    If replay is True, the first prime is computed with a GroebnerTrace and the following primes replay it, skipping the pairs which reduce to zero and the search for reducers. A prime for which the trace is not valid is computed again with a new trace, and so is the next prime after a lifted basis fails the final check, since an unlucky traced prime may have skipped a pair it should not.
+
+    Returns
+    -------
+    The reduced Groebner basis of the ideal generated by G sorted by leading monomials. Polynomials are monic if normalizeCoefficients is True, otherwise they have coprime integer coefficients.
+
+    Raises
+    ------
+    ValueError: If the polynomials are not over rational.
+    """
+    if not all(g.field == rational for g in G):
+        raise ValueError("The modular algorithm needs polynomials over rational.")
+    G = [g for g in G if not g.isZeroPolynomial()]
+    if not G:
+        return []
+
+    sortKey = monomialSortKey(permutation, order)
+    denominators = lcm(*(c.denominator for g in G for c in g.coefficients.values()))
+    candidates = {}
+    trace = None
+    for prime in modularPrimes():
+        if denominators % prime == 0:
+            continue
+
+        F = modularImage(G, prime)
+        image = None
+        if trace is not None:
+            try:
+                image = trace.replay(F)
+            except ValueError:
+                image = None
+        if image is None and replay:
+            image, trace = traceGroebnerBasis(F, permutation, order)
+        elif image is None:
+            image = extendToGroebnerBasis(F, permutation, order)
+        image = reduceGroebnerBasis(image, permutation, order)
+        image.sort(key=lambda g: sortKey(leadingMonomial(g, permutation, order)))
+        leadingMonomials = tuple(leadingMonomial(g, permutation, order) for g in image)
+        lifted = candidates.get(leadingMonomials)
+        if lifted is None:
+            lifted = _LiftedBasis(leadingMonomials)
+            candidates[leadingMonomials] = lifted
+        lifted.add(image, prime)
+        if any(other.primes > lifted.primes for other in candidates.values()):
+            continue
+
+        basis = lifted.reconstruct()
+        if basis is None or basis != lifted.previous:
+            lifted.previous = basis
+            continue
+        if isGroebnerBasisOf(basis, G, permutation, order, verify):
+            break
+        trace = None
+
+    if not normalizeCoefficients:
+        basis = [g * rational(lcm(*(c.denominator for c in g.coefficients.values()))) for g in basis]
+    return basis
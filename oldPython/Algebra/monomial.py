@@ -1,29 +1,65 @@
 
+HASH_MODULUS = (1 << 61) - 1
+
+
+def variableWeight(var: str) -> int:
+    """
+    Returns
+    -------
+    The weight of the variable used in monomial hashing. The hash of a monomial is the sum of exponents times weights of its variables, so that hashes of products and quotients are sums and differences of hashes.
+    """
+    return hash(var) % HASH_MODULUS
+
+
+MASK_BITS = 62
+
+
+def variableMaskBits(var: str) -> tuple[int, int]:
+    """
+    Returns
+    -------
+    Bits of the divisibility mask set by the variable, the first one for exponent at least 1 and the second one for exponent at least 2.
+    """
+    h = hash(var) % (MASK_BITS * MASK_BITS)
+    return 1 << (h % MASK_BITS), 1 << (h // MASK_BITS)
+
+
 class Monomial:
     """
-    Represents a monomial like x^2y^3z^4 as {'x': 2, 'y': 3, 'z': 4}. Immutable. If Monomial.STRICT is set to True, contructor will check if variables are allowed and exponents are natural numbers.
+    Represents a monomial like x^2y^3z^4 as {'x': 2, 'y': 3, 'z': 4}. Immutable. If Monomial.STRICT is set to True, contructor will check if variables are allowed and exponents are natural numbers. Attributes are stored in slots and set only by the constructor, except for the divisibility mask computed on first use.
     """
-    
+    __slots__ = ('exponent', '_hash', '_mask')
+
     VARIABLES = {'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'α', 'β', 'γ', 'δ', 'ε', 'ζ', 'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', 'ς', 'σ', 'τ', 'υ', 'φ', 'χ', 'ψ', 'ω'}
     DUMMY = '_'
 
     def __init__(self, exponent: dict[str, int]):
         exponent = {var: exp for var, exp in exponent.items() if exp != 0}
-        object.__setattr__(self, '_initialized', False)
         object.__setattr__(self, 'exponent', dict(sorted(exponent.items())))
-        object.__setattr__(self, '_initialized', True)
+        object.__setattr__(self, '_hash', sum([exp * hash(var) for var, exp in exponent.items()]) % HASH_MODULUS)
+        object.__setattr__(self, '_mask', None)
 
 
     def __setattr__(self, attr, value):
-        if self.__dict__.get('_initialized', False):
-            raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
-        super().__setattr__(attr, value)
+        raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
 
 
     def __delattr__(self, attr):
         raise AttributeError(f"{self.__class__.__name__} does not support attribute deletion")
 
 
+    def __reduce__(self):
+        return (Monomial, (self.exponent,))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
     def __str__(self):
         def toSuperscript(num):
             superscripts = {'0': '⁰','1': '¹', '2': '²', '3': '³', '4': '⁴', '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹'}
@@ -68,12 +104,7 @@ class Monomial:
     
     
     def __imul__(self, other):
-        for var, exp in other.exponent.items():
-            if var in self.exponent:
-                self.exponent[var] += exp
-            else:
-                self.exponent[var] = exp
-        return self
+        return self * other
     
 
     def __truediv__(self, other):
@@ -90,23 +121,21 @@ class Monomial:
     
 
     def __itruediv__(self, other):
-        for var, exp in other.exponent.items():
-            if var in self.exponent:
-                self.exponent[var] -= exp
-            else:
-                self.exponent[var] = -exp
-        if all(exp >= 0 for exp in self.exponent.values()): 
-            return self
-        else:
-            raise ValueError(f'Cannot divide monomials {self} by {other}')
+        return self / other
     
 
     def __rtruediv__(self, other):
         return self * other
     
 
+    def __pow__(self, other):
+        if not isinstance(other, int) or other < 0:
+            raise TypeError(f"Exponentiation is only supported with natural exponents")
+        return Monomial({var: exp * other for var, exp in self.exponent.items()})
+
+
     def __hash__(self):
-        return hash(tuple(sorted(self.exponent.items())))
+        return self._hash
     
 
     def __len__(self):
@@ -120,6 +149,34 @@ class Monomial:
         The degree of the monomial is sum of it's exponents.
         """
         return sum(self.exponent.values())
+
+
+    @property
+    def divisibilityMask(self) -> int:
+        """
+        Returns
+        -------
+        Bitmask of the variables with exponent at least 1 and at least 2. If alpha divides beta then alpha.divisibilityMask & ~beta.divisibilityMask == 0. Computed once on first use.
+        """
+        if self._mask is None:
+            mask = 0
+            for var, exp in self.exponent.items():
+                atLeastOne, atLeastTwo = variableMaskBits(var)
+                mask |= atLeastOne if exp == 1 else atLeastOne | atLeastTwo
+            object.__setattr__(self, '_mask', mask)
+        return self._mask
+
+
+    def divides(self, other: 'Monomial') -> bool:
+        """
+        Returns
+        -------
+        True if the monomial divides other, False otherwise. Most non divisible pairs are rejected by comparing divisibility masks.
+        """
+        if type(self) is Monomial and type(other) is Monomial and self.divisibilityMask & ~other.divisibilityMask:
+            return False
+        exponent = other.exponent
+        return all(exponent.get(var, 0) >= exp for var, exp in self.exponent.items())
     
     
     @staticmethod
@@ -147,16 +204,22 @@ class Monomial:
         -------
         The least common multiple of two monomials. For example lcm(x^2y^5, x^3y^2) = x^3*y^5
         """
-        variables = sorted(list(set(alpha.exponent.keys()).union(set(beta.exponent.keys()))))
+        if isinstance(beta, alpha.__class__) and beta.__class__ is not alpha.__class__:
+            alpha, beta = beta, alpha
+        return alpha._leastCommonMultiple(beta)
+
+
+    def _leastCommonMultiple(self, other):
+        variables = sorted(list(set(self.exponent.keys()).union(set(other.exponent.keys()))))
         result = []
 
         for i in variables:
-            if i not in alpha.exponent and i in beta.exponent:
-                result.append(beta.exponent[i])
-            elif i in alpha.exponent and i not in beta.exponent:
-                result.append(alpha.exponent[i])
+            if i not in self.exponent and i in other.exponent:
+                result.append(other.exponent[i])
+            elif i in self.exponent and i not in other.exponent:
+                result.append(self.exponent[i])
             else:
-                result.append(max(alpha.exponent[i], beta.exponent[i]))
+                result.append(max(self.exponent[i], other.exponent[i]))
 
         return Monomial.makeFromTuples(tuple(result), variables)
     
@@ -1,66 +1,321 @@
+from fractions import Fraction
 from functools import cmp_to_key
+from operator import itemgetter, mul, neg
 from .monomial import Monomial
-from .polynomial import Polynomial
+from .packedMonomial import PackedMonomial, VariableLayout
 from typing import Callable
 
-def lexOrder(alpha: Monomial, beta: Monomial, permutation: list[str]) -> bool:
+
+class MonomialOrder:
+    """
+    Abstract monomial order given by a sort key. Derived classes implement exponentKey, which maps exponents listed in the order of permutation to a tuple, so that monomials compare as their keys. Orders are callable like comparators order(alpha, beta, permutation) returning -1, 0 or 1.
+    """
+    def __init__(self):
+        self._sortKeys = {}
+        self._heapKeys = {}
+
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_sortKeys'] = {}
+        state['_heapKeys'] = {}
+        return state
+
+
+    def __call__(self, alpha: Monomial, beta: Monomial, permutation: list[str]) -> int:
+        sortKey = self.sortKey(permutation)
+        a = sortKey(alpha)
+        b = sortKey(beta)
+        return (a > b) - (a < b)
+
+
+    def __repr__(self):
+        return self.__class__.__name__
+
+
+    def exponentKey(self, exponents: tuple[int]) -> tuple:
+        """
+        Returns
+        -------
+        The sort key of the monomial with given exponents listed in the order of permutation as a flat tuple of numbers.
+        """
+        raise NotImplementedError
+
+
+    def validate(self, permutation: list[str]) -> None:
+        """
+        Checks if the order can be used with permutation.
+
+        Raises
+        ------
+        ValueError: If the order does not fit the number of variables.
+        """
+        pass
+
+
+    def sortKey(self, permutation: list[str]) -> Callable:
+        """
+        Returns
+        -------
+        Key function of monomials sorting them in increasing order with respect to permutation. Key functions are cached per permutation.
+        """
+        permutation = tuple(permutation)
+        sortKey = self._sortKeys.get(permutation)
+        if sortKey is None:
+            self.validate(permutation)
+            sortKey = self._makeSortKey(permutation)
+            self._sortKeys[permutation] = sortKey
+        return sortKey
+
+
+    def heapKey(self, permutation: list[str]) -> Callable:
+        """
+        Returns
+        -------
+        Key function of monomials sorting them in decreasing order with respect to permutation, used to keep the greatest monomial on top of a heap.
+        """
+        permutation = tuple(permutation)
+        heapKey = self._heapKeys.get(permutation)
+        if heapKey is None:
+            sortKey = self.sortKey(permutation)
+            heapKey = lambda monomial: tuple(map(neg, sortKey(monomial)))
+            self._heapKeys[permutation] = heapKey
+        return heapKey
+
+
+    def _makeSortKey(self, permutation: tuple[str]) -> Callable:
+        exponentKey = self.exponentKey
+        getters = {}
+
+        def sortKey(monomial: Monomial) -> tuple:
+            if monomial.__class__ is PackedMonomial:
+                getter = getters.get(monomial.layout)
+                if getter is None:
+                    getter = _exponentGetter(monomial.layout, permutation)
+                    getters[monomial.layout] = getter
+                return exponentKey(getter(monomial.exponents))
+            get = monomial.exponent.get
+            return exponentKey(tuple([get(var, 0) for var in permutation]))
+
+        return sortKey
+
+
+def _exponentGetter(layout: VariableLayout, permutation: tuple[str]) -> Callable:
     """
     Returns
     -------
-    -1 : if alpha < beta
-    0  : if alpha = beta
-    1  : if alpha > beta
-        in lexicographic order given by permutation
+    Function mapping exponents of a packed monomial over layout to exponents listed in the order of permutation.
+    """
+    positions = [layout.index.get(var) for var in permutation]
+    if positions == list(range(len(layout.variables))):
+        return lambda exponents: exponents
+    elif None not in positions and len(positions) > 1:
+        getter = itemgetter(*positions)
+        return getter
+    else:
+        return lambda exponents: tuple([0 if i is None else exponents[i] for i in positions])
+
+
+class LexOrder(MonomialOrder):
+    """
+    Lexicographic order, variables in permutation are listed in decreasing order.
+    """
+    def exponentKey(self, exponents: tuple[int]) -> tuple:
+        return exponents
+
+
+class GradedLexOrder(MonomialOrder):
+    """
+    Graded lexicographic order, compares degrees and breaks ties by lexicographic order.
     """
-    for var in permutation:
-        a = alpha.exponent.get(var, 0)
-        b = beta.exponent.get(var, 0)
-        
-        if a < b:
-            return -1
-        elif a > b:
-            return 1
+    def exponentKey(self, exponents: tuple[int]) -> tuple:
+        return (sum(exponents),) + exponents
 
-    return 0
+
+class GradedRevLexOrder(MonomialOrder):
+    """
+    Graded reverse lexicographic order, compares degrees and breaks ties in favour of the monomial with smaller exponent of the last variable in permutation which differs.
+    """
+    def exponentKey(self, exponents: tuple[int]) -> tuple:
+        return (sum(exponents),) + tuple([-exp for exp in reversed(exponents)])
 
 
-def gradedLexOrder(alpha: Monomial, beta: Monomial, permutation: list[str]) -> bool:
+class WeightedOrder(MonomialOrder):
+    """
+    Compares dot products of exponents with non-negative weights, where weights[i] is the weight of permutation[i], and breaks ties by tieBreakOrder.
+    """
+    def __init__(self, weights: list, tieBreakOrder: MonomialOrder = None):
+        super().__init__()
+        if any(w < 0 for w in weights):
+            raise ValueError("Weights must be non-negative")
+        self.weights = tuple(weights)
+        self.tieBreakOrder = tieBreakOrder if tieBreakOrder is not None else lexOrder
+
+
+    def __repr__(self):
+        return f"WeightedOrder({list(self.weights)}, {self.tieBreakOrder})"
+
+
+    def validate(self, permutation: list[str]) -> None:
+        if len(self.weights) != len(permutation):
+            raise ValueError("Weights and permutation must have the same size")
+
+
+    def exponentKey(self, exponents: tuple[int]) -> tuple:
+        return (sum(map(mul, self.weights, exponents)),) + self.tieBreakOrder.exponentKey(exponents)
+
+
+class MatrixOrder(MonomialOrder):
+    """
+    Compares the products of the matrix with exponents lexicographically. The matrix must have one column per variable in permutation, full column rank and first nonzero entry of every column positive.
+    """
+    def __init__(self, matrix: list[list]):
+        super().__init__()
+        self.matrix = tuple(tuple(row) for row in matrix)
+        if not self.matrix:
+            raise ValueError("Matrix must have at least one row")
+        columns = len(self.matrix[0])
+        if any(len(row) != columns for row in self.matrix):
+            raise ValueError("All rows of the matrix must have the same length")
+        for j in range(columns):
+            column = [row[j] for row in self.matrix if row[j] != 0]
+            if not column or column[0] < 0:
+                raise ValueError("First nonzero entry of every column must be positive")
+        if _rank(self.matrix) != columns:
+            raise ValueError("Matrix must have full column rank")
+
+
+    def __repr__(self):
+        return f"MatrixOrder({[list(row) for row in self.matrix]})"
+
+
+    def validate(self, permutation: list[str]) -> None:
+        if len(self.matrix[0]) != len(permutation):
+            raise ValueError("Matrix must have one column for each variable of permutation")
+
+
+    def exponentKey(self, exponents: tuple[int]) -> tuple:
+        return tuple([sum(map(mul, row, exponents)) for row in self.matrix])
+
+
+class BlockOrder(MonomialOrder):
+    """
+    Product of orders on consecutive blocks of variables in permutation. Blocks are given as pairs (order, size), the size of the last block may be None meaning all remaining variables. Monomials are compared on the first block and ties are broken by the following blocks.
+    """
+    def __init__(self, blocks: list[tuple[MonomialOrder, int]]):
+        super().__init__()
+        if not blocks:
+            raise ValueError("At least one block must be given")
+        if any(size is None for _, size in blocks[:-1]):
+            raise ValueError("Only the last block can have unspecified size")
+        self.blocks = tuple(blocks)
+        self._slices = []
+        start = 0
+        for _, size in blocks:
+            end = None if size is None else start + size
+            self._slices.append(slice(start, end))
+            start = end
+
+
+    def __repr__(self):
+        return f"BlockOrder({list(self.blocks)})"
+
+
+    def validate(self, permutation: list[str]) -> None:
+        sizes = [size for _, size in self.blocks]
+        if (sizes[-1] is None and sum(sizes[:-1]) > len(permutation)) or (sizes[-1] is not None and sum(sizes) != len(permutation)):
+            raise ValueError("Sizes of blocks must add up to the number of variables of permutation")
+
+
+    def exponentKey(self, exponents: tuple[int]) -> tuple:
+        key = ()
+        for (order, _), block in zip(self.blocks, self._slices):
+            key += order.exponentKey(exponents[block])
+        return key
+
+
+class EliminationOrder(BlockOrder):
+    """
+    Elimination order for the first k variables of permutation, graded reverse lexicographic on both blocks. Any monomial containing one of the first k variables is greater than all monomials in the remaining variables.
+    """
+    def __init__(self, k: int):
+        super().__init__([(gradedRevLexOrder, k), (gradedRevLexOrder, None)])
+        self.k = k
+
+
+    def __repr__(self):
+        return f"EliminationOrder({self.k})"
+
+
+def _rank(matrix: tuple[tuple]) -> int:
     """
     Returns
     -------
-    -1 : if alpha < beta
-    0  : if alpha = beta
-    1  : if alpha > beta
-        in graded lexicographic order given by permutation
+    Rank of the matrix computed by exact Gaussian elimination.
     """
-    if alpha.degree() < beta.degree():
-        return -1
-    elif alpha.degree() > beta.degree():
-        return 1
-    else:
-        return lexOrder(alpha, beta, permutation)
-    
+    rows = [[Fraction(entry) for entry in row] for row in matrix]
+    rank = 0
+    for j in range(len(rows[0]) if rows else 0):
+        pivot = next((i for i in range(rank, len(rows)) if rows[i][j] != 0), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        for i in range(rank + 1, len(rows)):
+            factor = rows[i][j] / rows[rank][j]
+            rows[i] = [a - factor * b for a, b in zip(rows[i], rows[rank])]
+        rank += 1
+    return rank
+
+
+lexOrder = LexOrder()
+gradedLexOrder = GradedLexOrder()
+gradedRevLexOrder = GradedRevLexOrder()
 
-def leadingMonomial(f: Polynomial, permutation: list[str], order: Callable = lexOrder) -> Monomial:
+
+def monomialSortKey(permutation: list[str], order: Callable = lexOrder) -> Callable:
     """
     Returns
     -------
-    Leading monomial of the polynomial f with respect to the monomial order given by permutation
+    Key function sorting monomials in increasing monomial order given by permutation. If permutation is a PolynomialRing, the precomputed key of the ring order is returned.
     """
-    if not f.coefficients:
-        return None
+    sortKey = getattr(permutation, 'sortKey', None)
+    if sortKey is not None:
+        return sortKey
+    elif isinstance(order, MonomialOrder):
+        return order.sortKey(permutation)
+    return cmp_to_key(lambda alpha, beta: order(alpha, beta, permutation))
+
 
-    key_function = cmp_to_key(lambda alpha, beta: order(alpha, beta, permutation))
-    return max(f.coefficients.keys(), key=key_function)
+def monomialHeapKey(permutation: list[str], order: Callable = lexOrder) -> Callable:
+    """
+    Returns
+    -------
+    Key function sorting monomials in decreasing monomial order given by permutation, used to keep the greatest monomial on top of a heap. If permutation is a PolynomialRing, the precomputed key of the ring order is returned.
+    """
+    heapKey = getattr(permutation, 'heapKey', None)
+    if heapKey is not None:
+        return heapKey
+    elif isinstance(order, MonomialOrder):
+        return order.heapKey(permutation)
+    return cmp_to_key(lambda alpha, beta: order(beta, alpha, permutation))
+
+
+def leadingMonomial(f: 'Polynomial', permutation: list[str], order: Callable = lexOrder) -> Monomial:
+    """
+    Returns
+    -------
+    Leading monomial of the polynomial f with respect to the monomial order given by permutation
+    """
+    return f.leadingTerm(permutation, order)[0]
 
 
-def leadingCoefficient(f: Polynomial, permutation: list[str], order: Callable = lexOrder):
+def leadingCoefficient(f: 'Polynomial', permutation: list[str], order: Callable = lexOrder):
     """
     Returns
     -------
     Leading coefficient of the polynomial f with respect to the monomial order given by permutation
     """
-    return f.coefficients.get(leadingMonomial(f, permutation, order), 0)
+    return f.leadingTerm(permutation, order)[1]
 
 
 def monomialOrder(alpha: Monomial, beta: Monomial, permutation: list[str], order: Callable = lexOrder) -> bool:
@@ -72,4 +327,8 @@ def monomialOrder(alpha: Monomial, beta: Monomial, permutation: list[str], order
     1  : if alpha > beta
         in monomial order given by permutation
     """
+    sortKey = getattr(permutation, 'sortKey', None)
+    if sortKey is not None:
+        a, b = sortKey(alpha), sortKey(beta)
+        return (a > b) - (a < b)
     return order(alpha, beta, permutation)
\ No newline at end of file
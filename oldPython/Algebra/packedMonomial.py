@@ -0,0 +1,314 @@
+from functools import reduce
+from operator import add, sub, mul, le, or_
+from itertools import compress
+from .monomial import Monomial, HASH_MODULUS, MASK_BITS, variableWeight
+
+
+class VariableLayout:
+    """
+    Fixed list of variables shared by all PackedMonomials built from it. Position of a variable in the list is its index in the exponent tuple. Immutable.
+    """
+    def __init__(self, variables):
+        variables = tuple(variables)
+        if len(set(variables)) != len(variables):
+            raise ValueError("Variables must be distinct")
+
+        object.__setattr__(self, '_initialized', False)
+        object.__setattr__(self, 'variables', variables)
+        object.__setattr__(self, 'index', {var: i for i, var in enumerate(variables)})
+        object.__setattr__(self, 'weights', tuple(variableWeight(var) for var in variables))
+        object.__setattr__(self, 'maskBits', VariableLayout._maskBits(len(variables)))
+        object.__setattr__(self, 'alphabeticalPositions', tuple(sorted(range(len(variables)), key=lambda i: variables[i])))
+        object.__setattr__(self, '_constant', PackedMonomial((0,) * len(variables), self))
+        object.__setattr__(self, '_initialized', True)
+
+
+    def __setattr__(self, attr, value):
+        if self.__dict__.get('_initialized', False):
+            raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
+        super().__setattr__(attr, value)
+
+
+    def __delattr__(self, attr):
+        raise AttributeError(f"{self.__class__.__name__} does not support attribute deletion")
+
+
+    @staticmethod
+    def _maskBits(n: int) -> tuple[tuple[int, tuple[int]]]:
+        """
+        Returns
+        -------
+        Pairs (bound, bits) for divisibility masks of n variables, bits[i] is set in the mask when exponent of i-th variable is greater than bound. Up to 62 bits are split evenly between variables using exponent thresholds 1, 2, 4, with more variables bits are shared.
+        """
+        thresholds = (1, 2, 4)[:max(1, min(3, MASK_BITS // max(n, 1)))]
+        result = []
+        for j, threshold in enumerate(thresholds):
+            result.append((threshold - 1, tuple(1 << ((j * n + i) % MASK_BITS) for i in range(n))))
+        return tuple(result)
+
+
+    def mask(self, exponents: tuple[int]) -> int:
+        """
+        Returns
+        -------
+        The divisibility mask of the monomial with given exponents.
+        """
+        mask = 0
+        for bound, bits in self.maskBits:
+            mask |= reduce(or_, compress(bits, map(bound.__lt__, exponents)), 0)
+        return mask
+
+
+    def __reduce__(self):
+        return (VariableLayout, (self.variables,))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def __len__(self):
+        return len(self.variables)
+
+
+    def __contains__(self, var):
+        return var in self.index
+
+
+    def __iter__(self):
+        return iter(self.variables)
+
+
+    def monomial(self, exponent: dict[str, int]) -> 'PackedMonomial':
+        """
+        Returns
+        -------
+        The packed monomial with given exponents, for example {'x': 1, 'z': 2} for layout ('x', 'y', 'z') gives (1, 0, 2).
+
+        Raises
+        ------
+        ValueError: If one of the variables is not in the layout.
+        """
+        exponents = [0] * len(self.variables)
+        for var, exp in exponent.items():
+            if var not in self.index:
+                raise ValueError(f"The variable {var} is not in the layout {self.variables}")
+            exponents[self.index[var]] = exp
+        return PackedMonomial(exponents, self)
+
+
+    def pack(self, monomial: Monomial) -> 'PackedMonomial':
+        """
+        Returns
+        -------
+        The monomial converted to a packed monomial over this layout.
+
+        Raises
+        ------
+        ValueError: If one of the variables of the monomial is not in the layout.
+        """
+        if isinstance(monomial, PackedMonomial) and monomial.layout is self:
+            return monomial
+        return self.monomial(monomial.exponent)
+
+
+    def constant(self) -> 'PackedMonomial':
+        """
+        Returns
+        -------
+        The constant monomial 1 of this layout.
+        """
+        return self._constant
+
+
+    def hashOf(self, exponents: tuple[int]) -> int:
+        """
+        Returns
+        -------
+        The hash of a monomial with given exponents, equal to the hash of the Monomial with the same exponents.
+        """
+        return sum(map(mul, exponents, self.weights)) % HASH_MODULUS
+
+
+
+class PackedMonomial(Monomial):
+    """
+    Monomial stored as a tuple of exponents indexed by the variables of a VariableLayout, for example x^2z over ('x', 'y', 'z') is (2, 0, 1). Degree and hash are computed once, so multiplication, division, lcm and hashing are element-wise operations on tuples. Compares equal to the Monomial with the same exponents. Immutable.
+    """
+    __slots__ = ('exponents', 'layout', '_degree', '_exponent')
+
+    def __init__(self, exponents: tuple[int], layout: VariableLayout):
+        exponents = tuple(exponents)
+        if len(exponents) != len(layout.variables):
+            raise ValueError(f"Expected {len(layout.variables)} exponents, got {len(exponents)}")
+
+        object.__setattr__(self, 'exponents', exponents)
+        object.__setattr__(self, 'layout', layout)
+        object.__setattr__(self, '_degree', sum(exponents))
+        object.__setattr__(self, '_hash', layout.hashOf(exponents))
+        object.__setattr__(self, '_exponent', None)
+        object.__setattr__(self, '_mask', None)
+
+
+    @staticmethod
+    def _make(exponents: tuple[int], layout: VariableLayout, degree: int, hashValue: int) -> 'PackedMonomial':
+        """
+        Builds a packed monomial from already computed degree and hash without validation.
+        """
+        monomial = object.__new__(PackedMonomial)
+        object.__setattr__(monomial, 'exponents', exponents)
+        object.__setattr__(monomial, 'layout', layout)
+        object.__setattr__(monomial, '_degree', degree)
+        object.__setattr__(monomial, '_hash', hashValue)
+        object.__setattr__(monomial, '_exponent', None)
+        object.__setattr__(monomial, '_mask', None)
+        return monomial
+
+
+    @property
+    def exponent(self) -> dict[str, int]:
+        """
+        Returns
+        -------
+        Exponents as a dictionary of nonzero exponents sorted by variables, like Monomial.exponent. Must not be modified.
+        """
+        if self._exponent is None:
+            variables = self.layout.variables
+            exponents = self.exponents
+            object.__setattr__(self, '_exponent', {variables[i]: exponents[i] for i in self.layout.alphabeticalPositions if exponents[i]})
+        return self._exponent
+
+
+    @property
+    def divisibilityMask(self) -> int:
+        """
+        Returns
+        -------
+        Bitmask of exponent thresholds reached by the variables. If alpha divides beta over the same layout then alpha.divisibilityMask & ~beta.divisibilityMask == 0. Computed once on first use.
+        """
+        if self._mask is None:
+            object.__setattr__(self, '_mask', self.layout.mask(self.exponents))
+        return self._mask
+
+
+    def divides(self, other: Monomial) -> bool:
+        """
+        Returns
+        -------
+        True if the monomial divides other, False otherwise. Most non divisible pairs over the same layout are rejected by comparing divisibility masks.
+        """
+        if other.__class__ is PackedMonomial and other.layout is self.layout:
+            if self.divisibilityMask & ~other.divisibilityMask:
+                return False
+            return all(map(le, self.exponents, other.exponents))
+        return Monomial.divides(self, other)
+
+
+    def __reduce__(self):
+        return (PackedMonomial, (self.exponents, self.layout))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def __eq__(self, other):
+        if isinstance(other, PackedMonomial) and other.layout is self.layout:
+            return self.exponents == other.exponents
+        elif isinstance(other, Monomial):
+            return self._hash == hash(other) and self.exponent == other.exponent
+        else:
+            return NotImplemented
+
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+
+    def __hash__(self):
+        return self._hash
+
+
+    def __len__(self):
+        return len(self.exponents) - self.exponents.count(0)
+
+
+    def _sameLayout(self, other: Monomial):
+        """
+        Returns
+        -------
+        Other monomial packed over the layout of self or None if it has variables outside of the layout.
+        """
+        if isinstance(other, PackedMonomial) and other.layout is self.layout:
+            return other
+        try:
+            return self.layout.pack(other)
+        except ValueError:
+            return None
+
+
+    def __mul__(self, other):
+        packed = self._sameLayout(other)
+        if packed is None:
+            return Monomial.__mul__(self, other)
+        return PackedMonomial._make(tuple(map(add, self.exponents, packed.exponents)), self.layout, self._degree + packed._degree, (self._hash + packed._hash) % HASH_MODULUS)
+
+
+    def __rmul__(self, other):
+        return self * other
+
+
+    def __imul__(self, other):
+        return self * other
+
+
+    def __truediv__(self, other):
+        packed = self._sameLayout(other)
+        if packed is None:
+            return Monomial.__truediv__(self, other)
+        if not all(map(le, packed.exponents, self.exponents)):
+            raise ValueError(f'Cannot divide monomials {self} by {other}')
+        return PackedMonomial._make(tuple(map(sub, self.exponents, packed.exponents)), self.layout, self._degree - packed._degree, (self._hash - packed._hash) % HASH_MODULUS)
+
+
+    def __rtruediv__(self, other):
+        packed = self._sameLayout(other)
+        if packed is None:
+            return Monomial.__truediv__(Monomial(dict(other.exponent)), self)
+        return packed / self
+
+
+    def __itruediv__(self, other):
+        return self / other
+
+
+    def __pow__(self, other):
+        if not isinstance(other, int) or other < 0:
+            raise TypeError(f"Exponentiation is only supported with natural exponents")
+        return PackedMonomial._make(tuple(exp * other for exp in self.exponents), self.layout, self._degree * other, self._hash * other % HASH_MODULUS)
+
+
+    def degree(self):
+        """
+        Returns
+        -------
+        The degree of the monomial is sum of it's exponents.
+        """
+        return self._degree
+
+
+    def _leastCommonMultiple(self, other):
+        packed = self._sameLayout(other)
+        if packed is None:
+            return Monomial._leastCommonMultiple(self, other)
+        exponents = tuple(map(max, self.exponents, packed.exponents))
+        return PackedMonomial._make(exponents, self.layout, sum(exponents), self.layout.hashOf(exponents))
@@ -0,0 +1,171 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from tqdm import tqdm
+from .polynomial import Polynomial, Monomial
+from .packedMonomial import PackedMonomial, VariableLayout
+from .coefficientDomain import CoefficientDomain
+from .monomialOrders import lexOrder
+from .buchberger import BuchbergerEngine, polynomialReduce, syzygy
+
+
+def serializePolynomial(f: Polynomial, variables: tuple[str]) -> tuple:
+    """
+    Returns
+    -------
+    The compact form (exponents, integers, scale) of f: the exponent tuples of its monomials over variables and its coefficients as integers / scale, see CoefficientDomain.integerCoefficients. For domains without an integer representation scale is None and the coefficients are kept as they are.
+    """
+    monomials = list(f.coefficients)
+    exponents = tuple(tuple(monomial.exponent.get(var, 0) for var in variables) for monomial in monomials)
+    values = [f.coefficients[monomial] for monomial in monomials]
+    scaled = f.domain.integerCoefficients(values) if values else ([], 1)
+    if scaled is None:
+        return exponents, tuple(values), None
+    integers, scale = scaled
+    return exponents, tuple(integers), scale
+
+
+def deserializePolynomial(data: tuple, variables: tuple[str], domain: CoefficientDomain, layout: VariableLayout = None) -> Polynomial:
+    """
+    Returns
+    -------
+    The polynomial of the compact form made by serializePolynomial. Its monomials are PackedMonomials over layout, which must have the given variables, or Monomials if layout is None.
+    """
+    exponents, integers, scale = data
+    coefficients = integers if scale is None else [domain.fromScaledInteger(n, scale) for n in integers]
+    if layout is None:
+        monomials = [Monomial.makeFromTuples(exponent, variables) for exponent in exponents]
+    else:
+        monomials = [PackedMonomial(exponent, layout) for exponent in exponents]
+    return Polynomial(dict(zip(monomials, coefficients)), domain)
+
+
+def _reduceChunk(task: tuple) -> list[tuple]:
+    """
+    Reduces the S-polynomials of a chunk of pairs by a snapshot of the basis in a worker process. task is (variables, layout, permutation, order, domain, polynomials, active, pairs), polynomials maps indices to compact forms over variables. permutation is the one of the engine, a PolynomialRing reduces by its own order.
+
+    Returns
+    -------
+    The compact forms of the remainders of the pairs, None for the ones which reduce to zero.
+    """
+    variables, layout, permutation, order, domain, polynomials, active, pairs = task
+    if layout is None:
+        layout = VariableLayout(variables)
+    polynomials = {k: deserializePolynomial(data, variables, domain, layout) for k, data in polynomials.items()}
+    G = [polynomials[k] for k in active]
+    remainders = []
+    for i, j in pairs:
+        _, r = polynomialReduce(syzygy(polynomials[i], polynomials[j], permutation, order), G, permutation, order)
+        remainders.append(None if r.isZeroPolynomial() else serializePolynomial(r, variables))
+    return remainders
+
+
+class ParallelBuchbergerEngine(BuchbergerEngine):
+    """
+    Buchberger's algorithm with the S-polynomials of a batch of pairs reduced in parallel by a process pool. Each step takes the next pairs of the queue in the order of the serial engine, one per process, and reduces them against a snapshot of the active basis. Polynomials travel to the workers and back in the compact form of serializePolynomial, exponent tuples and integer coefficients, instead of pickled Polynomial and Monomial objects.
+
+    The remainders are merged while the pair in front of the queue is one of the batch, independent of which worker finishes first: each one is reduced again by the elements added earlier in the same merge and added to the basis with the Gebauer-Moeller update if it is nonzero. When a new element brings a pair with a smaller key or the criteria drop a pair of the batch, the rest of the batch is discarded and its pairs stay in the queue. So pairs are processed in the same order as by the serial engine and the computation is deterministic. Batches of whole degrees would reduce many pairs against an outdated basis and, in lexicographic orders over the rationals, make the coefficients of the remainders explode. With processes equal to 1 the pairs are reduced in the calling process one by one, exactly as by BuchbergerEngine.
+
+    statistics counts in addition to the BuchbergerEngine ones the parallel 'batches' and the 'discardedReductions' of remainders which were not merged.
+    """
+    def __init__(self, permutation: list[str], order: Callable = lexOrder, processes: int = None, strategy: str = 'normal'):
+        super().__init__(permutation, order, strategy)
+        self.processes = processes or os.cpu_count() or 1
+        self.variables = tuple(permutation)
+        self.layout = None
+        self.statistics['batches'] = 0
+        self.statistics['discardedReductions'] = 0
+
+
+    def addPolynomials(self, F: list[Polynomial]) -> None:
+        """
+        Adds polynomials to the basis, see BuchbergerEngine.addPolynomials. Remainders are built over permutation if it is a PolynomialRing, otherwise over the VariableLayout of the first polynomial if it has the variables of permutation.
+        """
+        if self.layout is None and isinstance(self.permutation, VariableLayout):
+            self.layout = self.permutation
+            self.variables = tuple(self.permutation)
+        for f in F:
+            monomial = next(iter(f.coefficients), None)
+            if self.layout is None and isinstance(monomial, PackedMonomial) and all(var in monomial.layout for var in self.variables):
+                self.layout = monomial.layout
+                self.variables = tuple(monomial.layout)
+        super().addPolynomials(F)
+
+
+    def step(self, mapper: Callable = map) -> list[Polynomial]:
+        """
+        Reduces the next pairs of the queue, one per process, with mapper, map or the map of a process pool, and merges the remainders into the basis as long as their pairs stay in front of the queue.
+
+        Returns
+        -------
+        The new basis elements, empty if all S-polynomials reduced to zero or there are no pairs left.
+        """
+        if not self.pairs:
+            return []
+        permutation = self.permutation
+        order = self.order
+        variables = self.variables
+        domain = self.domain
+        selected = heapq.nsmallest(self.processes, self.pairs)
+        needed = set(self.active).union(*[(pair[1], pair[2]) for pair in selected])
+        polynomials = {k: serializePolynomial(self.polynomials[k], variables) for k in needed}
+        tasks = [(variables, self.layout, permutation, order, domain, polynomials, list(self.active), [(pair[1], pair[2])]) for pair in selected]
+        remainders = {(pair[1], pair[2]): data for pair, result in zip(selected, mapper(_reduceChunk, tasks)) for data in result}
+
+        statistics = self.statistics
+        statistics['batches'] += 1
+        new = []
+        while self.pairs and (self.pairs[0][1], self.pairs[0][2]) in remainders:
+            pair = heapq.heappop(self.pairs)
+            data = remainders.pop((pair[1], pair[2]))
+            statistics['pairs'] += 1
+            statistics['reductions'] += 1
+            if data is None:
+                statistics['zeroReductions'] += 1
+                continue
+            r = deserializePolynomial(data, variables, domain, self.layout)
+            if new:
+                _, r = polynomialReduce(r, [self.polynomials[k] for k in self.active], permutation, order)
+                if r.isZeroPolynomial():
+                    statistics['zeroReductions'] += 1
+                    continue
+            self.update(r, pair[4])
+            new.append(r)
+        statistics['discardedReductions'] += len(remainders)
+        return new
+
+
+    def run(self) -> None:
+        """
+        Processes batches of pairs in a process pool until the queue is empty, then the active basis is a Groebner basis.
+        """
+        executor = ProcessPoolExecutor(self.processes) if self.processes > 1 else None
+        mapper = executor.map if executor is not None else map
+        progress = tqdm(total=len(self.pairs))
+        try:
+            while self.pairs:
+                before = len(self.pairs)
+                pairs = self.statistics['pairs']
+                self.step(mapper)
+                selected = self.statistics['pairs'] - pairs
+                progress.total += max(0, len(self.pairs) - before + selected)
+                progress.update(selected)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        progress.close()
+
+
+def parallelGroebnerBasis(Basis: list[Polynomial], permutation: list[str], order: Callable = lexOrder, processes: int = None, statistics: dict = None) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    A Groebner basis of the ideal generated by Basis computed by ParallelBuchbergerEngine with the given number of processes, by default one per CPU. It is not reduced. If statistics is a dict, it is updated with the statistics of the engine.
+    """
+    engine = ParallelBuchbergerEngine(permutation, order, processes)
+    engine.addPolynomials(Basis)
+    engine.run()
+    if statistics is not None:
+        statistics.update(engine.statistics)
+    return engine.basis()
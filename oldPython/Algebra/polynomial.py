@@ -1,52 +1,98 @@
 
+import heapq
+import itertools
+from operator import add
+from typing import Callable
 from .monomial import Monomial
+from .packedMonomial import PackedMonomial, VariableLayout
+from .monomialOrders import MonomialOrder, monomialSortKey, monomialHeapKey, lexOrder
 from functools import cmp_to_key
 from .rational import rational
 from .galoisField import GaloisField
+from .coefficientDomain import CoefficientDomain, coefficientDomain
+from .kronecker import KRONECKER_MIN_PRODUCTS, isDense, kroneckerMultiply
+
+SCALAR_TYPES = (int, float, complex, rational, GaloisField)
+
 
 class Polynomial:
-    
+    """
+    Polynomial stored as a dictionary mapping monomials to nonzero coefficients. Coefficient arithmetic goes through the CoefficientDomain of the polynomial. field is either a coefficient class (rational, float, complex, GaloisField, int) or a CoefficientDomain, when it is omitted it is taken from the class of the first coefficient. Integer coefficients are converted to rational, int is not a field. Polynomial.field stays the class, for example rational, while Polynomial.domain is the domain object. Immutable, attributes are stored in slots and set only by the constructor, except for cached leading term and sorted terms.
+    """
+    __slots__ = ('coefficients', 'field', 'domain', '_leadingTerm', '_sortedTerms')
+
     def __init__(self, coefficients: dict, field = None):
-        if field is None and coefficients:
-            field = next(iter(coefficients.values())).__class__
-        object.__setattr__(self, '_initialized', False)
+        if isinstance(field, CoefficientDomain):
+            domain = field
+        else:
+            if field is None and coefficients:
+                field = next(iter(coefficients.values())).__class__
+            if field is GaloisField:
+                domain = coefficientDomain(field, next((c.prime for c in coefficients.values() if isinstance(c, GaloisField)), None))
+            else:
+                domain = coefficientDomain(field)
+            if field is int:
+                coefficients = {monomial: domain.convert(coefficient) for monomial, coefficient in coefficients.items()}
         object.__setattr__(self, 'coefficients', coefficients)
-        object.__setattr__(self, 'field', field)
+        object.__setattr__(self, 'field', domain.field)
+        object.__setattr__(self, 'domain', domain)
+        object.__setattr__(self, '_leadingTerm', None)
+        object.__setattr__(self, '_sortedTerms', None)
         self.removeZeroCoefficients()
-        object.__setattr__(self, '_initialized', True)
 
 
     def __setattr__(self, name, value):
-        if self.__dict__.get('_initialized', False):
-            raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
-        super().__setattr__(name, value)
+        raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
 
 
     def __delattr__(self, name):
         raise AttributeError(f"{self.__class__.__name__} does not support attribute deletion")
 
 
+    def __reduce__(self):
+        return (Polynomial, (self.coefficients, self.domain))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    @staticmethod
+    def fromTerms(terms, field = None) -> 'Polynomial':
+        """
+        Returns
+        -------
+        The polynomial with given terms (monomial, coefficient), coefficients of repeated monomials are added. Builds one dictionary, so it is linear in the number of terms unlike summing the terms one by one.
+        """
+        coefficients = {}
+        for monomial, coefficient in terms:
+            if monomial in coefficients:
+                coefficients[monomial] += coefficient
+            else:
+                coefficients[monomial] = coefficient
+        return Polynomial(coefficients, field)
+
+
     def __str__(self):
         if len(self.coefficients) == 0:
             return '0'
       
         result = ''
+        domain = self.domain
         self.sortCoefficients() 
         for monomial, coefficient in self.coefficients.items():
-            if isinstance(coefficient, float) and coefficient.is_integer():
-                coefficient = int(coefficient)
-
-            if isinstance(coefficient, (complex, GaloisField)) or coefficient > 0:
-                result += ' + '
-            else:
+            if domain.signed and coefficient < 0:
                 result += ' - '
-
-            if isinstance(coefficient, (complex, GaloisField)):
-                result += f'{coefficient}'
-            elif monomial == Monomial.constant():
-                result += f'{abs(coefficient)}'
-            elif (coefficient != 1 and coefficient != -1):
-                result += f'{abs(coefficient)}'
+                coefficient = -coefficient
+            else:
+                result += ' + '
+            text = domain.toString(coefficient)
+            if monomial == Monomial.constant() or text != '1':
+                result += text
 
             if monomial != Monomial.constant():
                 result += monomial.__str__()
@@ -75,43 +121,33 @@ class Polynomial:
     
     
     def __neg__(self):
-        result = {}
-        for monomial, coefficient in self.coefficients.items():
-            result[monomial] = -coefficient
-            
-        return Polynomial(result, self.field)
+        neg = self.domain.neg
+        return Polynomial({monomial: neg(coefficient) for monomial, coefficient in self.coefficients.items()}, self.domain)
     
     
     def __add__(self, other):
-        result = {}
-        
-        for monomial, coefficient in self.coefficients.items():
-                result[monomial] = coefficient
+        domain = self.domain
+        result = dict(self.coefficients)
                 
         if isinstance(other, Polynomial):
             if self.field != other.field:
                 raise ValueError(f"Both polynomials must be over the same field")
-            
+            if not self.coefficients:
+                domain = other.domain
+            add = domain.add
             for monomial, coefficient in other.coefficients.items():
-                if monomial in result:
-                    result[monomial] += coefficient
-                else:
-                    result[monomial] = coefficient
+                current = result.get(monomial)
+                result[monomial] = coefficient if current is None else add(current, coefficient)
         
-        elif isinstance(other, (int, float, complex, rational, GaloisField)):
-            if isinstance(other, GaloisField) and self.field != GaloisField:
-                raise ValueError(f"Cannot add modular integer to a polynomial over a field of characteristic 0")
-            elif Monomial.constant() in result:
-                result[Monomial.constant()] += other
-            else:
-                if isinstance(other, int) and self.field == GaloisField:
-                    result[Monomial.constant()] = GaloisField(other, next(iter(self.getCoefficients.values())).prime)
-                else:
-                    result[Monomial.constant()] = other
+        elif isinstance(other, SCALAR_TYPES):
+            other = domain.convert(other)
+            constant = self.constantMonomial()
+            current = result.get(constant)
+            result[constant] = other if current is None else domain.add(current, other)
         else:
             return NotImplemented
         
-        return Polynomial(result, self.field)
+        return Polynomial(result, domain)
     
     
     def __radd__(self, other):
@@ -140,30 +176,163 @@ class Polynomial:
         if isinstance(other, Polynomial):
             if self.field != other.field:
                 raise ValueError(f"Both polynomials must be over the same field")
-            for monomial1, coefficient1 in self.coefficients.items():
-                for monomial2, coefficient2 in other.coefficients.items():
-                    newMonomial = monomial1 * monomial2
-                    newCoefficient = coefficient1 * coefficient2
-                    
-                    if newMonomial in result:
-                        result[newMonomial] += newCoefficient
-                    else:
-                        result[newMonomial] = newCoefficient
-                        
-        elif isinstance(other, (int, float, complex, rational, GaloisField)):
-            if isinstance(other, GaloisField) and self.field != GaloisField:
-                raise ValueError(f"Cannot multiply a polynomial over a field of characteristic 0 by a modular integer ")
-            elif Polynomial.isCoefficientZero(other):
-                return Polynomial({}, self.field)
-            else:
-                for monomial, coefficient in self.coefficients.items():
-                    result[monomial] = coefficient * other
+            if len(other.coefficients) == 1:
+                monomial, coefficient = next(iter(other.coefficients.items()))
+                return self.multiplyByTerm(monomial, coefficient)
+            elif len(self.coefficients) == 1:
+                monomial, coefficient = next(iter(self.coefficients.items()))
+                return other.multiplyByTerm(monomial, coefficient)
+            elif self.coefficients and other.coefficients:
+                permutation, order = Polynomial._productOrder(self, other)
+                product = Polynomial._kroneckerProduct(self, other, permutation)
+                if product is not None:
+                    return product
+                return Polynomial._heapProduct(self, other, permutation, order)
+
+        elif isinstance(other, SCALAR_TYPES):
+            domain = self.domain
+            other = domain.convert(other)
+            if domain.isZero(other):
+                return Polynomial({}, domain)
+            mul = domain.mul
+            for monomial, coefficient in self.coefficients.items():
+                result[monomial] = mul(coefficient, other)
         else:
             return NotImplemented
         
-        return Polynomial(result, self.field)
+        return Polynomial(result, self.domain)
         
     
+    def multiplyByTerm(self, monomial: Monomial, coefficient) -> 'Polynomial':
+        """
+        Returns
+        -------
+        The product of the polynomial and the term coefficient * monomial. Multiplication by a monomial preserves the monomial order, so cached sorted terms and leading term are carried over to the result.
+        """
+        domain = self.domain
+        if domain.isZero(coefficient):
+            return Polynomial({}, domain)
+        mul = domain.mul
+
+        if self._sortedTerms is not None:
+            tag, terms = self._sortedTerms
+            terms = [(m * monomial, mul(c, coefficient)) for m, c in terms]
+            product = Polynomial(dict(terms), domain)
+            if len(product.coefficients) == len(terms):
+                object.__setattr__(product, '_sortedTerms', (tag, terms))
+                object.__setattr__(product, '_leadingTerm', (tag, terms[0]))
+            return product
+
+        product = Polynomial({m * monomial: mul(c, coefficient) for m, c in self.coefficients.items()}, domain)
+        if self._leadingTerm is not None and self._leadingTerm[1][0] is not None:
+            tag, (m, c) = self._leadingTerm
+            leading = (m * monomial, product.coefficients.get(m * monomial))
+            if leading[1] is not None:
+                object.__setattr__(product, '_leadingTerm', (tag, leading))
+        return product
+
+
+    @staticmethod
+    def _productOrder(f: 'Polynomial', g: 'Polynomial') -> tuple:
+        """
+        Returns
+        -------
+        (permutation, order) in which the terms of the product f * g are merged. The order of the ring is used if all monomials are packed over the same PolynomialRing with a MonomialOrder, otherwise lexicographic order of all variables of f and g. A ring with a comparator function order is not returned, its key is not a tuple of exponent sums.
+        """
+        layout = None
+        for monomial in itertools.chain(f.coefficients, g.coefficients):
+            if monomial.__class__ is not PackedMonomial or (layout is not None and monomial.layout is not layout):
+                layout = None
+                break
+            layout = monomial.layout
+        if layout is not None and isinstance(getattr(layout, 'order', None), MonomialOrder):
+            return layout, layout.order
+        elif layout is not None:
+            return sorted(layout), lexOrder
+        return sorted(set(f.getVariables) | set(g.getVariables)), lexOrder
+
+
+    @staticmethod
+    def _heapProduct(f: 'Polynomial', g: 'Polynomial', permutation: list[str], order: MonomialOrder) -> 'Polynomial':
+        """
+        Returns
+        -------
+        The product f * g by Johnson's heap multiplication. Products f_i * g_j are merged in decreasing monomial order using a heap of size at most len(f), so equal monomials are combined as they appear and a new monomial is built once for every term of the result. Keys of MonomialOrder are linear in exponents, so the key of a product is the sum of keys of its factors.
+        """
+        if len(f.coefficients) > len(g.coefficients):
+            f, g = g, f
+        heapKey = monomialHeapKey(permutation, order)
+        fTerms = f.sortedTerms(permutation, order)
+        gTerms = g.sortedTerms(permutation, order)
+        fKeys = [heapKey(monomial) for monomial, _ in fTerms]
+        gKeys = [heapKey(monomial) for monomial, _ in gTerms]
+        fLength = len(fTerms)
+        gLength = len(gTerms)
+        domain = f.domain
+        isZero = domain.isZero
+        add = domain.add
+        mul = domain.mul
+
+        heap = [(tuple(map(add, fKeys[0], gKeys[0])), 0, 0)]
+        terms = []
+        while heap:
+            key, i, j = heap[0]
+            monomial = fTerms[i][0] * gTerms[j][0]
+            coefficient = None
+            while heap and heap[0][0] == key:
+                _, i, j = heapq.heappop(heap)
+                product = mul(fTerms[i][1], gTerms[j][1])
+                coefficient = product if coefficient is None else add(coefficient, product)
+                if j + 1 < gLength:
+                    heapq.heappush(heap, (tuple(map(add, fKeys[i], gKeys[j + 1])), i, j + 1))
+                if j == 0 and i + 1 < fLength:
+                    heapq.heappush(heap, (tuple(map(add, fKeys[i + 1], gKeys[0])), i + 1, 0))
+            if not isZero(coefficient):
+                terms.append((monomial, coefficient))
+
+        product = Polynomial(dict(terms), domain)
+        if len(product.coefficients) == len(terms):
+            tag = Polynomial._orderTag(permutation, order)
+            object.__setattr__(product, '_sortedTerms', (tag, terms))
+            object.__setattr__(product, '_leadingTerm', (tag, terms[0] if terms else (None, 0)))
+        return product
+
+
+    @staticmethod
+    def _kroneckerProduct(f: 'Polynomial', g: 'Polynomial', permutation: list[str]) -> 'Polynomial':
+        """
+        Returns
+        -------
+        The product f * g computed by Kronecker substitution or None if f and g are not dense enough or their domain has no exact integer representation (CoefficientDomain.integerCoefficients). Rational coefficients are multiplied after clearing denominators and modular coefficients are reduced modulo p after multiplication.
+        """
+        domain = f.domain
+        if len(f.coefficients) * len(g.coefficients) < KRONECKER_MIN_PRODUCTS:
+            return None
+        fIntegers = domain.integerCoefficients(list(f.coefficients.values()))
+        if fIntegers is None:
+            return None
+        if isinstance(permutation, VariableLayout):
+            fExponents = [monomial.exponents for monomial in f.coefficients]
+            gExponents = [monomial.exponents for monomial in g.coefficients]
+        else:
+            fExponents = [tuple(monomial.exponent.get(var, 0) for var in permutation) for monomial in f.coefficients]
+            gExponents = [tuple(monomial.exponent.get(var, 0) for var in permutation) for monomial in g.coefficients]
+        if not isDense(fExponents, gExponents):
+            return None
+
+        fIntegers, fScale = fIntegers
+        gIntegers, gScale = domain.integerCoefficients(list(g.coefficients.values()))
+        terms = kroneckerMultiply(list(zip(fExponents, fIntegers)), list(zip(gExponents, gIntegers)))
+
+        if isinstance(permutation, VariableLayout):
+            monomials = [PackedMonomial(exponents, permutation) for exponents, _ in terms]
+        else:
+            monomials = [Monomial(dict(zip(permutation, exponents))) for exponents, _ in terms]
+        scale = fScale * gScale
+        coefficients = [domain.fromScaledInteger(c, scale) for _, c in terms]
+        return Polynomial(dict(zip(monomials, coefficients)), domain)
+
+
     def __rmul__(self, other):
         return self * other
     
@@ -177,10 +346,12 @@ class Polynomial:
             raise TypeError(f"Exponentiation is only supported with natural exponents")
 
         if other == 0:
-            return Polynomial({Monomial.constant(): 1}, self.field)
-
+            return Polynomial({self.constantMonomial(): self.domain.one()}, self.domain)
+        elif len(self.coefficients) == 1:
+            monomial, coefficient = next(iter(self.coefficients.items()))
+            return Polynomial({monomial ** other: self.domain.pow(coefficient, other)}, self.domain)
 
-        result = Polynomial({Monomial.constant(): 1}, self.field)
+        result = Polynomial({self.constantMonomial(): self.domain.one()}, self.domain)
         base = self
 
         while other > 0:
@@ -197,9 +368,22 @@ class Polynomial:
     
     
     def __hash__(self):
-        return hash(tuple(self.coefficients.items()))
+        return hash(frozenset(self.coefficients.items()))
                     
     
+    def constantMonomial(self) -> Monomial:
+        """
+        Returns
+        -------
+        The constant monomial 1 in the same representation as the monomials of the polynomial.
+        """
+        for monomial in self.coefficients:
+            if isinstance(monomial, PackedMonomial):
+                return monomial.layout.constant()
+            break
+        return Monomial.constant()
+
+
     def evaluate(self, point: dict):
         """
         Returns
@@ -219,7 +403,7 @@ class Polynomial:
                 term *= point[variable] ** power
             result += term
         
-        return result
+        return self.domain.reduce(result)
     
 
     def totalDegree(self) -> int:
@@ -237,12 +421,62 @@ class Polynomial:
         return max_sum
     
 
+    @staticmethod
+    def _orderTag(permutation: list[str], order: Callable) -> tuple:
+        """
+        Returns
+        -------
+        Hashable description of the monomial order given by permutation, used to validate cached leading terms.
+        """
+        if getattr(permutation, 'sortKey', None) is not None:
+            return (None, permutation)
+        elif isinstance(permutation, VariableLayout):
+            return (order, permutation)
+        return (order, tuple(permutation))
+
+
+    def leadingTerm(self, permutation: list[str], order: Callable = lexOrder) -> tuple[Monomial, object]:
+        """
+        Returns
+        -------
+        (monomial, coefficient) of the leading term with respect to the monomial order given by permutation or (None, 0) for the zero polynomial. The result is cached for the last used order.
+        """
+        tag = Polynomial._orderTag(permutation, order)
+        if self._leadingTerm is not None and self._leadingTerm[0] == tag:
+            return self._leadingTerm[1]
+
+        if not self.coefficients:
+            term = (None, 0)
+        else:
+            monomial = max(self.coefficients.keys(), key=monomialSortKey(permutation, order))
+            term = (monomial, self.coefficients[monomial])
+        object.__setattr__(self, '_leadingTerm', (tag, term))
+        return term
+
+
+    def sortedTerms(self, permutation: list[str], order: Callable = lexOrder) -> list[tuple[Monomial, object]]:
+        """
+        Returns
+        -------
+        List of pairs (monomial, coefficient) sorted in decreasing monomial order given by permutation. The result is cached for the last used order and must not be modified.
+        """
+        tag = Polynomial._orderTag(permutation, order)
+        if self._sortedTerms is not None and self._sortedTerms[0] == tag:
+            return self._sortedTerms[1]
+
+        sortKey = monomialSortKey(permutation, order)
+        terms = sorted(self.coefficients.items(), key=lambda term: sortKey(term[0]), reverse=True)
+        object.__setattr__(self, '_sortedTerms', (tag, terms))
+        object.__setattr__(self, '_leadingTerm', (tag, terms[0] if terms else (None, 0)))
+        return terms
+
+
     @staticmethod
     def isCoefficientZero(coefficient) -> bool:
         """
         Returns
         -------
-        If field is countable, checks if the coefficient is zero. If the field is uncountable, checks if the coefficient is close to zero.
+        If field is countable, checks if the coefficient is zero. If the field is uncountable, checks if the coefficient is close to zero. Decided by the type of the coefficient, polynomials use CoefficientDomain.isZero of their domain instead.
         """
         if isinstance(coefficient, (float, complex)) and abs(coefficient) < 0.001:
             return True
@@ -254,21 +488,30 @@ class Polynomial:
             return False
         
 
+    def coefficientInverse(self, coefficient):
+        """
+        Returns
+        -------
+        The multiplicative inverse of the coefficient in the field of the polynomial.
+        """
+        return self.domain.inv(coefficient)
+
+
     def isZeroPolynomial(self) -> bool:
         """
         Returns
         -------
         Checks if the polynomial is identically zero. If the field is countable, checks if all coefficients are zero. If the field is uncountable, checks if all coefficients are close to zero.
         """
-        return all(Polynomial.isCoefficientZero(coefficient) for coefficient in self.coefficients.values())
+        isZero = self.domain.isZero
+        return all(isZero(coefficient) for coefficient in self.coefficients.values())
 
     
     def removeZeroCoefficients(self) -> None:
         """
-        Removes all zero coefficients from the polynomial.
+        Removes all zero coefficients from the polynomial and brings the others to canonical form of the domain, for example reduces them modulo p over a PrimeField.
         """
-        nonZeroCoefficients = {monomial: coefficient for monomial, coefficient in self.coefficients.items() if not Polynomial.isCoefficientZero(coefficient)}
-        object.__setattr__(self, 'coefficients', nonZeroCoefficients)
+        object.__setattr__(self, 'coefficients', self.domain.normalize(self.coefficients))
     
     
     def sortCoefficients(self) -> None:
@@ -352,4 +595,4 @@ class Polynomial:
                 result[newMonomial] += newCoefficient
             else:
                 result[newMonomial] = newCoefficient
-        return Polynomial(result, self.field)
\ No newline at end of file
+        return Polynomial(result, self.domain)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import heapq
+from itertools import count
+from typing import Callable
+from .monomial import Monomial
+from .polynomial import Polynomial
+from .monomialOrders import lexOrder, monomialHeapKey
+
+
+class PolynomialAccumulator:
+    """
+    Mutable polynomial used as the dividend in the division algorithm. Terms are kept in a dictionary and their monomials in a heap ordered by the monomial order given by permutation, so adding a multiple of g costs O(len(g) log n) and taking the leading term costs O(log n), instead of rebuilding the whole polynomial. Monomials whose coefficient cancelled are removed from the heap lazily.
+    """
+    def __init__(self, f: Polynomial, permutation: list[str], order: Callable = lexOrder):
+        self.domain = f.domain
+        self.heapKey = monomialHeapKey(permutation, order)
+        self.coefficients = dict(f.coefficients)
+        self._counter = count()
+        self._heap = [(self.heapKey(monomial), next(self._counter), monomial) for monomial in self.coefficients]
+        heapq.heapify(self._heap)
+
+
+    def __len__(self):
+        return len(self.coefficients)
+
+
+    def isZeroPolynomial(self) -> bool:
+        """
+        Returns
+        -------
+        True if all remaining coefficients are zero, False otherwise.
+        """
+        isZero = self.domain.isZero
+        return all(isZero(coefficient) for coefficient in self.coefficients.values())
+
+
+    def popLeadingTerm(self) -> tuple[Monomial, object]:
+        """
+        Removes the leading term.
+
+        Returns
+        -------
+        (monomial, coefficient) of the leading term or None if the accumulated polynomial is zero.
+        """
+        heap = self._heap
+        coefficients = self.coefficients
+        isZero = self.domain.isZero
+        while heap:
+            _, _, monomial = heapq.heappop(heap)
+            coefficient = coefficients.pop(monomial, None)
+            if coefficient is not None and not isZero(coefficient):
+                return monomial, coefficient
+        return None
+
+
+    def subtractMultiple(self, coefficient, monomial: Monomial, terms) -> None:
+        """
+        Subtracts coefficient * monomial * g where terms are pairs (monomial, coefficient) of g.
+        """
+        coefficients = self.coefficients
+        heap = self._heap
+        heapKey = self.heapKey
+        counter = self._counter
+        domain = self.domain
+        neg = domain.neg
+        mul = domain.mul
+        subtractProduct = domain.subtractProduct
+        for gMonomial, gCoefficient in terms:
+            product = monomial * gMonomial
+            current = coefficients.get(product)
+            if current is None:
+                coefficients[product] = neg(mul(coefficient, gCoefficient))
+                heapq.heappush(heap, (heapKey(product), next(counter), product))
+            else:
+                coefficients[product] = subtractProduct(current, coefficient, gCoefficient)
+
+
+    def scale(self, factor) -> None:
+        """
+        Multiplies all terms by a nonzero factor in place.
+        """
+        mul = self.domain.mul
+        coefficients = self.coefficients
+        for monomial, coefficient in coefficients.items():
+            coefficients[monomial] = mul(coefficient, factor)
+
+
+    def toPolynomial(self) -> Polynomial:
+        """
+        Returns
+        -------
+        The accumulated polynomial.
+        """
+        return Polynomial(dict(self.coefficients), self.domain)
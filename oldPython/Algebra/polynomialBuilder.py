@@ -0,0 +1,137 @@
+from typing import Type
+from .galoisField import GaloisField
+from .monomial import Monomial
+from .packedMonomial import PackedMonomial
+from .polynomial import Polynomial, SCALAR_TYPES
+from .coefficientDomain import coefficientDomain
+
+
+class PolynomialBuilder:
+    """
+    Mutable polynomial used to build a large polynomial term by term. Terms are added in place to a single dictionary, so adding a term costs O(1) and adding a polynomial g costs O(len(g)), instead of copying all terms like Polynomial.__add__ does. The result is frozen into a Polynomial by build(). field is a coefficient class or a CoefficientDomain, when it is omitted it is taken from the first added coefficient.
+    """
+    def __init__(self, field: Type = None, prime: int = None):
+        self.domain = coefficientDomain(field, prime) if field is not None else None
+        self.coefficients = {}
+
+
+    @property
+    def field(self):
+        """
+        Returns
+        -------
+        The field of the builder as in Polynomial.field, None while it is unknown.
+        """
+        return self.domain.field if self.domain is not None else None
+
+
+    def __len__(self):
+        return len(self.coefficients)
+
+
+    def addTerm(self, monomial: Monomial, coefficient) -> 'PolynomialBuilder':
+        """
+        Adds the term coefficient * monomial in place.
+
+        Returns
+        -------
+        The builder itself, so calls can be chained.
+        """
+        if self.domain is None:
+            self.domain = coefficientDomain(coefficient.__class__, getattr(coefficient, 'prime', None))
+        coefficients = self.coefficients
+        if monomial in coefficients:
+            coefficients[monomial] += coefficient
+        else:
+            coefficients[monomial] = coefficient
+        return self
+
+
+    def addTerms(self, terms) -> 'PolynomialBuilder':
+        """
+        Adds all terms (monomial, coefficient) of an iterable in place.
+
+        Returns
+        -------
+        The builder itself, so calls can be chained.
+        """
+        for monomial, coefficient in terms:
+            self.addTerm(monomial, coefficient)
+        return self
+
+
+    def addMultiple(self, coefficient, monomial: Monomial, f: Polynomial) -> 'PolynomialBuilder':
+        """
+        Adds coefficient * monomial * f in place without building the product as a Polynomial.
+
+        Returns
+        -------
+        The builder itself, so calls can be chained.
+        """
+        domain = f.domain
+        if domain.isZero(coefficient):
+            return self
+        mul = domain.mul
+        for m, c in f.coefficients.items():
+            self.addTerm(m * monomial, mul(c, coefficient))
+        return self
+
+
+    def __iadd__(self, other):
+        if isinstance(other, (Polynomial, PolynomialBuilder)):
+            if other.field is not None and self.field is not None and self.field != other.field:
+                raise ValueError(f"Both polynomials must be over the same field")
+            return self.addTerms(other.coefficients.items())
+        elif isinstance(other, SCALAR_TYPES):
+            if self.domain is not None:
+                other = self._scalarDomain().convert(other)
+            return self.addTerm(self._constantMonomial(), other)
+        else:
+            return NotImplemented
+
+
+    def __isub__(self, other):
+        if isinstance(other, (Polynomial, PolynomialBuilder)):
+            if other.field is not None and self.field is not None and self.field != other.field:
+                raise ValueError(f"Both polynomials must be over the same field")
+            return self.addTerms((monomial, -coefficient) for monomial, coefficient in other.coefficients.items())
+        elif isinstance(other, SCALAR_TYPES):
+            return self.__iadd__(-other)
+        else:
+            return NotImplemented
+
+
+    def _scalarDomain(self):
+        """
+        Returns
+        -------
+        The domain of the builder, for GaloisField without a given prime the prime is read from the terms.
+        """
+        if self.domain.field is GaloisField and self.domain.prime is None:
+            for coefficient in self.coefficients.values():
+                if isinstance(coefficient, GaloisField):
+                    self.domain = coefficientDomain(GaloisField, coefficient.prime)
+                    break
+        return self.domain
+
+
+    def _constantMonomial(self) -> Monomial:
+        """
+        Returns
+        -------
+        The constant monomial 1 in the same representation as the monomials already added.
+        """
+        for monomial in self.coefficients:
+            if isinstance(monomial, PackedMonomial):
+                return monomial.layout.constant()
+            break
+        return Monomial.constant()
+
+
+    def build(self) -> Polynomial:
+        """
+        Returns
+        -------
+        The accumulated polynomial with zero coefficients removed. The builder can still be used afterwards without affecting the result.
+        """
+        return Polynomial(self.coefficients, self._scalarDomain() if self.domain is not None else None)
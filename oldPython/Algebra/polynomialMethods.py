@@ -5,7 +5,9 @@ from typing import Type
 from tqdm import tqdm
 from .rational import rational
 from .galoisField import GaloisField
+from .coefficientDomain import CoefficientDomain, coefficientDomain
 from .polynomial import Polynomial
+from .polynomialBuilder import PolynomialBuilder
 from .monomial import Monomial
 from .ideal import Ideal
 from .monomialOrders import lexOrder, gradedLexOrder, leadingCoefficient
@@ -29,14 +31,9 @@ def one(field: Type, prime: int = None):
     ------
     ValueError: If the field is not supported.
     """
-    if field == GaloisField:
-        return GaloisField(1, prime)
-    elif field == rational:
-        return rational(1)
-    elif field == float or field == complex:
-        return 1
-    else:
+    if field not in SUPPORTED_FIELDS:
         raise ValueError(f"The field {field} is not supported.")
+    return coefficientDomain(field, prime).one()
     
 
 def zero(field: Type, prime: int = None):
@@ -49,14 +46,9 @@ def zero(field: Type, prime: int = None):
     ------
     ValueError: If the field is not supported.
     """
-    if field == GaloisField:
-        return GaloisField(0, prime)
-    elif field == rational:
-        return rational(0)
-    elif field == float or field == complex:
-        return 0
-    else:
+    if field not in SUPPORTED_FIELDS:
         raise ValueError(f"The field {field} is not supported.")
+    return coefficientDomain(field, prime).zero()
 
 
 def defineVariable(var: str, field: Type = rational, prime: int = None):
@@ -93,19 +85,9 @@ def elementarySymetricPolynomial(degree: int, variables: list[str], field: Type
     numberOfVariables = len(variables)
     if degree <= 0 or degree > numberOfVariables:
         return ZERO
-        
-    coefficients = {}
-    subsets = list(combinations(list(range(numberOfVariables)), degree))
-    binarySubsets = []
 
-    for subset in subsets:
-        binaryRepresentation = [1 if i in subset else 0 for i in range(numberOfVariables)]
-        binarySubsets.append(tuple(binaryRepresentation))
-        
-    for binarySubset in binarySubsets:
-        coefficients[Monomial.makeFromTuples(binarySubset, variables)] = one(field, prime)
-        
-    return Polynomial(coefficients, field)
+    coefficient = one(field, prime)
+    return Polynomial.fromTerms(((Monomial({variables[i]: 1 for i in subset}), coefficient) for subset in combinations(range(numberOfVariables), degree)), field)
 
 
 def powerSumPolynomial(degree: int, variables: list[str], field: Type = rational, prime: int = None) -> Polynomial:
@@ -123,12 +105,8 @@ def powerSumPolynomial(degree: int, variables: list[str], field: Type = rational
     elif degree <= 0:
         raise ValueError("Degree of power sum polynomial must be positive")
         
-    result = {}
-    for var in variables:
-        exponent = Monomial({var: degree})
-        result[exponent] = one(field, prime)
-        
-    return Polynomial(result, field)
+    coefficient = one(field, prime)
+    return Polynomial.fromTerms(((Monomial({var: degree}), coefficient) for var in variables), field)
 
 
 
@@ -156,13 +134,10 @@ def derivative(f: Polynomial, variable: str, order: int = 1) -> Polynomial:
                 continue
             else:
                 newCoefficient = coefficient * monomial.exponent[variable]
-                newMonomial = copy.deepcopy(monomial)
-                newMonomial.exponent[variable] -= 1
-                if newMonomial.exponent[variable] == 0:
-                    del newMonomial.exponent[variable]
+                newMonomial = monomial / Monomial({variable: 1})
                 result[newMonomial] = newCoefficient
 
-        return Polynomial(result, g.field)
+        return Polynomial(result, g.domain)
 
     h = copy.deepcopy(f)
     while order > 0:
@@ -264,7 +239,7 @@ def polynomialLCM(*args: Polynomial) -> Polynomial:
     for i in range(1, len(args)):
         result = _lcm(result, args[i])
         newLeadingCoefficient *= leadingCoefficient(args[i], args[i].getVariables, gradedLexOrder)
-    return result * (newLeadingCoefficient / leadingCoefficient(result, result.getVariables, gradedLexOrder))
+    return result * (newLeadingCoefficient * result.coefficientInverse(leadingCoefficient(result, result.getVariables, gradedLexOrder)))
 
 
 def normalizeCoefficients(f: Polynomial, toIntegers: bool = False) -> Polynomial:
@@ -280,7 +255,7 @@ def normalizeCoefficients(f: Polynomial, toIntegers: bool = False) -> Polynomial
         d = integerGCD(*[coefficient.numerator for coefficient in f.getCoefficients.values()])
         return f * (l / d) * (-1 if leadingCoefficient(f, f.getVariables, gradedLexOrder) < 0 else 1)
     else:
-        return f * (1 / leadingCoefficient(f, f.getVariables, gradedLexOrder))
+        return f * f.coefficientInverse(leadingCoefficient(f, f.getVariables, gradedLexOrder))
     
 
 def squareFreePart(f: Polynomial) -> Polynomial:
@@ -307,29 +282,23 @@ def embed(f: Polynomial, field, prime = None) -> Polynomial:
     """
     Returns
     -------
-    The polynomial f embedded into the given field.
+    The polynomial f embedded into the given field. The field can also be a CoefficientDomain, for example a PrimeField, then coefficients are converted by it.
     
     Raises
     ------
-    ValueError: If the field is not supported.
+    ValueError: If the field is not supported or a coefficient can not be converted.
     """
-
-    if field not in SUPPORTED_FIELDS:
-        raise ValueError(f"The field {field} is not supported.")
-    elif f.field == field:
+    if not isinstance(field, CoefficientDomain):
+        if field not in SUPPORTED_FIELDS:
+            raise ValueError(f"The field {field} is not supported.")
+        elif field == GaloisField and prime is None:
+            raise ValueError("The prime must be given for GaloisField.")
+    domain = coefficientDomain(field, prime)
+    if f.domain == domain:
         return f
 
-    if field != GaloisField:
-        result = {}
-        for monomial, coefficient in f.coefficients.items():
-            result[monomial] = field(coefficient)
-    elif field == GaloisField and prime is not None:
-        result = {}
-        for monomial, coefficient in f.coefficients.items():
-            result[monomial] = field(coefficient, prime)
-    else:
-        raise ValueError("The prime must be given for GaloisField.")
-    return Polynomial(result, field)
+    convert = domain.convert
+    return Polynomial({monomial: convert(coefficient) for monomial, coefficient in f.coefficients.items()}, domain)
 
 
 def findIrreduciblePolynomial(prime: int, degree: int) -> Polynomial:
@@ -339,14 +308,15 @@ def findIrreduciblePolynomial(prime: int, degree: int) -> Polynomial:
     An irreducible polynomial of given degree over the Galois field of given prime.
     """
     x = defineVariable("x", GaloisField, prime)
-    monomials = [x**i for i in range(degree)]
+    monomials = [Monomial({"x": i}) for i in range(degree)]
+    leadingMonomial = Monomial({"x": degree})
     coefficients = [GaloisField(i, prime) for i in range(prime)] 
     allPolynomials = []
     for coeffCombination in product(coefficients, repeat=degree):
-        polynomial = x**degree
-        for c, m in zip(coeffCombination, monomials):
-            polynomial += c * m
-        allPolynomials.append(polynomial)
+        polynomial = PolynomialBuilder(GaloisField, prime)
+        polynomial.addTerm(leadingMonomial, one(GaloisField, prime))
+        polynomial.addTerms(zip(monomials, coeffCombination))
+        allPolynomials.append(polynomial.build())
 
     pF = set(primeFactorization(degree).keys())
     mainPolynomial = x**(prime**degree) - x
@@ -0,0 +1,190 @@
+from functools import cmp_to_key
+from typing import Callable, Type
+from .rational import rational
+from .galoisField import GaloisField
+from .coefficientDomain import CoefficientDomain, coefficientDomain
+from .monomial import Monomial
+from .packedMonomial import PackedMonomial, VariableLayout
+from .polynomial import Polynomial
+from .monomialOrders import MonomialOrder, lexOrder
+from .groebnerBasis import polynomialReduce, getGroebnerBasis
+
+
+class PolynomialRing(VariableLayout):
+    """
+    Polynomial ring K[x_1, ... , x_n] with fixed variables, field and monomial order. Variables are listed in decreasing order, so they also serve as the permutation for the monomial order. Monomials of the ring are PackedMonomials over it and polynomials built by the ring keep their terms sorted in decreasing order. A ring can be passed instead of permutation to polynomialReduce, syzygy, getGroebnerBasis, leadingMonomial and leadingCoefficient. The field can be a PrimeField instance, then coefficients are plain integers modulo its prime, or any other CoefficientDomain. The domain of the field is kept in domain and shared by all polynomials of the ring.
+    """
+    def __init__(self, variables, field: Type = rational, order: Callable = lexOrder, prime: int = None):
+        if isinstance(variables, str):
+            variables = [variables]
+        if not all(isinstance(var, str) for var in variables):
+            raise TypeError("Variables must be strings")
+        elif field == GaloisField and prime is None:
+            raise ValueError("The prime must be given for GaloisField.")
+
+        if isinstance(field, CoefficientDomain):
+            prime = field.prime
+        super().__init__(variables)
+        object.__setattr__(self, '_initialized', False)
+        object.__setattr__(self, 'field', field)
+        object.__setattr__(self, 'prime', prime)
+        object.__setattr__(self, 'domain', coefficientDomain(field, prime))
+        object.__setattr__(self, 'order', order)
+        object.__setattr__(self, 'permutation', list(self.variables))
+        if isinstance(order, MonomialOrder):
+            object.__setattr__(self, 'sortKey', order.sortKey(self.variables))
+            object.__setattr__(self, 'heapKey', order.heapKey(self.variables))
+        else:
+            permutation = self.permutation
+            object.__setattr__(self, 'sortKey', cmp_to_key(lambda alpha, beta: order(alpha, beta, permutation)))
+            object.__setattr__(self, 'heapKey', cmp_to_key(lambda alpha, beta: order(beta, alpha, permutation)))
+        object.__setattr__(self, '_initialized', True)
+
+
+    def __reduce__(self):
+        return (PolynomialRing, (self.variables, self.field, self.order, self.prime))
+
+
+    def __str__(self):
+        return f"{self.domain}[{', '.join(self.variables)}]"
+
+
+    def __repr__(self):
+        return self.__str__()
+
+
+    @staticmethod
+    def indexedVariables(name: str, count: int, start: int = 1) -> list[str]:
+        """
+        Returns
+        -------
+        Names of indexed variables, for example ('x', 3) gives ['x_1', 'x_2', 'x_3'].
+        """
+        return [f'{name}_{i}' for i in range(start, start + count)]
+
+
+    def coefficient(self, value):
+        """
+        Returns
+        -------
+        The value converted to the field of the ring.
+
+        Raises
+        ------
+        ValueError: If the value can not be converted.
+        """
+        return self.domain.convert(value)
+
+
+    def polynomial(self, terms) -> Polynomial:
+        """
+        Returns
+        -------
+        The polynomial of the ring with given terms sorted in decreasing order. Terms are given as a dictionary or an iterable of pairs (monomial, coefficient), where monomial is a Monomial, a dictionary of exponents or a tuple of exponents indexed by the variables of the ring.
+        """
+        if isinstance(terms, dict):
+            terms = terms.items()
+        coefficients = {}
+        for monomial, coefficient in terms:
+            if isinstance(monomial, tuple):
+                monomial = PackedMonomial(monomial, self)
+            elif isinstance(monomial, dict):
+                monomial = self.monomial(monomial)
+            else:
+                monomial = self.pack(monomial)
+            if monomial in coefficients:
+                coefficients[monomial] += self.coefficient(coefficient)
+            else:
+                coefficients[monomial] = self.coefficient(coefficient)
+        return self.sort(Polynomial(coefficients, self.domain))
+
+
+    def sort(self, f: Polynomial) -> Polynomial:
+        """
+        Returns
+        -------
+        The polynomial f with monomials packed over the ring and terms sorted in decreasing monomial order of the ring.
+        """
+        sortKey = self.sortKey
+        terms = sorted(((self.pack(monomial), coefficient) for monomial, coefficient in f.coefficients.items()), key=lambda term: sortKey(term[0]), reverse=True)
+        return Polynomial(dict(terms), self.domain)
+
+
+    def variable(self, var: str) -> Polynomial:
+        """
+        Returns
+        -------
+        The variable var as a polynomial of the ring.
+
+        Raises
+        ------
+        ValueError: If var is not a variable of the ring.
+        """
+        if var not in self.index:
+            raise ValueError(f"The variable {var} is not in the ring {self}")
+        return Polynomial({self.monomial({var: 1}): self.one()}, self.domain)
+
+
+    @property
+    def generators(self) -> list[Polynomial]:
+        """
+        Returns
+        -------
+        The variables of the ring as polynomials.
+        """
+        return [self.variable(var) for var in self.variables]
+
+
+    def one(self):
+        """
+        Returns
+        -------
+        The multiplicative identity of the field of the ring.
+        """
+        return self.domain.one()
+
+
+    def zero(self):
+        """
+        Returns
+        -------
+        The additive identity of the field of the ring.
+        """
+        return self.domain.zero()
+
+
+    def leadingMonomial(self, f: Polynomial) -> Monomial:
+        """
+        Returns
+        -------
+        Leading monomial of f with respect to the order of the ring.
+        """
+        return f.leadingTerm(self)[0]
+
+
+    def leadingCoefficient(self, f: Polynomial):
+        """
+        Returns
+        -------
+        Leading coefficient of f with respect to the order of the ring.
+        """
+        return f.leadingTerm(self)[1]
+
+
+    def reduce(self, f: Polynomial, G: list[Polynomial]) -> tuple[list[Polynomial], Polynomial]:
+        """
+        Returns
+        -------
+        ([q1, q2, ..., qs], r) from division of f by G = [g1, g2, ..., gs] with respect to the order of the ring.
+        """
+        quotients, r = polynomialReduce(f, G, self)
+        return [self.sort(q) for q in quotients], self.sort(r)
+
+
+    def groebnerBasis(self, G: list[Polynomial], normalizeCoefficients: bool = True, algorithm: str = 'buchberger') -> list[Polynomial]:
+        """
+        Returns
+        -------
+        The reduced Groebner basis of the ideal generated by G with respect to the order of the ring, computed by the given algorithm of getGroebnerBasis.
+        """
+        return [self.sort(g) for g in getGroebnerBasis(G, self, normalizeCoefficients=normalizeCoefficients, algorithm=algorithm)]
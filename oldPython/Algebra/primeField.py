@@ -0,0 +1,176 @@
+from .primes import isPrime
+from .rational import rational
+from .galoisField import GaloisField
+from .coefficientDomain import CoefficientDomain
+
+
+class PrimeField(CoefficientDomain):
+    """
+    Field of integers modulo a prime p with elements stored as plain integers in [0, p). A PrimeField is given as the field of a Polynomial instead of GaloisField, then coefficients are ints and no object is allocated per coefficient. Polynomials over a PrimeField reduce their coefficients modulo p when constructed, so sums and products may be left unreduced until then. Primes are checked by Miller-Rabin, word size primes up to 2^31 keep all products of two coefficients small. Inverses are computed by pow(a, -1, p) and cached. Immutable, PrimeFields with the same prime are equal. A PrimeField is its own field identifier in Polynomial.field.
+    """
+    __slots__ = ('prime', '_inverses')
+
+    def __init__(self, prime: int):
+        if not isinstance(prime, int) or not isPrime(prime):
+            raise ValueError(f"Not a prime {prime}")
+        object.__setattr__(self, 'prime', prime)
+        object.__setattr__(self, '_inverses', {})
+
+
+    @property
+    def field(self) -> 'PrimeField':
+        return self
+
+
+    def __reduce__(self):
+        return (PrimeField, (self.prime,))
+
+
+    def __eq__(self, other):
+        return isinstance(other, PrimeField) and self.prime == other.prime
+
+
+    def __ne__(self, other):
+        return not self == other
+
+
+    def __hash__(self):
+        return hash((PrimeField, self.prime))
+
+
+    def __str__(self):
+        return f'𝔽{self.prime}'
+
+
+    def __repr__(self):
+        return f'PrimeField({self.prime})'
+
+
+    def zero(self) -> int:
+        return 0
+
+
+    def one(self) -> int:
+        return 1
+
+
+    def fromInt(self, n: int) -> int:
+        """
+        Returns
+        -------
+        The integer n reduced modulo p.
+        """
+        return n % self.prime
+
+
+    def fromRational(self, q: rational) -> int:
+        """
+        Returns
+        -------
+        The image of q = a/b modulo p, that is a * b^-1 mod p.
+
+        Raises
+        ------
+        ZeroDivisionError: If p divides the denominator of q.
+        """
+        return q.numerator * self.inv(q.denominator % self.prime) % self.prime
+
+
+    def convert(self, value) -> int:
+        """
+        Returns
+        -------
+        The value given as int, rational or GaloisField converted to an element of the field.
+
+        Raises
+        ------
+        ValueError: If the value is a GaloisField over a different prime or can not be converted.
+        ZeroDivisionError: If p divides the denominator of a rational value.
+        """
+        if isinstance(value, int):
+            return value % self.prime
+        elif isinstance(value, rational):
+            return self.fromRational(value)
+        elif isinstance(value, GaloisField):
+            if value.prime != self.prime:
+                raise ValueError(f"Cannot convert {value} to {self}")
+            return value.number
+        else:
+            raise ValueError(f"Cannot convert {value} to {self}")
+
+
+    def toGaloisField(self, a: int) -> GaloisField:
+        """
+        Returns
+        -------
+        The element a as a GaloisField object.
+        """
+        return GaloisField(a, self.prime)
+
+
+    def add(self, a: int, b: int) -> int:
+        return (a + b) % self.prime
+
+
+    def sub(self, a: int, b: int) -> int:
+        return (a - b) % self.prime
+
+
+    def neg(self, a: int) -> int:
+        return -a % self.prime
+
+
+    def mul(self, a: int, b: int) -> int:
+        return a * b % self.prime
+
+
+    def inv(self, a: int) -> int:
+        """
+        Returns
+        -------
+        The multiplicative inverse of a modulo p, inverses are cached.
+
+        Raises
+        ------
+        ZeroDivisionError: If a is zero modulo p.
+        """
+        inverse = self._inverses.get(a)
+        if inverse is None:
+            if a % self.prime == 0:
+                raise ZeroDivisionError(f"Division by zero modulo {self.prime}")
+            inverse = pow(a, -1, self.prime)
+            self._inverses[a] = inverse
+        return inverse
+
+
+    def div(self, a: int, b: int) -> int:
+        return a * self.inv(b) % self.prime
+
+
+    def subtractProduct(self, a: int, b: int, c: int) -> int:
+        return (a - b * c) % self.prime
+
+
+    def pow(self, a: int, n: int) -> int:
+        return pow(a, n, self.prime)
+
+
+    def isZero(self, a: int) -> bool:
+        return a % self.prime == 0
+
+
+    def reduce(self, a: int) -> int:
+        return a % self.prime
+
+
+    def normalize(self, coefficients: dict) -> dict:
+        prime = self.prime
+        return {monomial: reduced for monomial, coefficient in coefficients.items() if (reduced := coefficient % prime)}
+
+
+    def integerCoefficients(self, coefficients: list) -> tuple[list[int], int]:
+        return list(coefficients), 1
+
+
+    def fromScaledInteger(self, n: int, scale: int) -> int:
+        return n % self.prime
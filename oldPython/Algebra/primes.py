@@ -2,6 +2,7 @@
 PRIMES = []
 PRIMES_UPPER_BOUND = 1_000_000
 PRIMES_SET = set()
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
 
 def sieveOfEratosthenes(N = PRIMES_UPPER_BOUND) -> None:
     """
@@ -47,4 +48,49 @@ def primeFactorization(n: int) -> dict[int, int]:
     return result
 
 
+def isPrime(n: int) -> bool:
+    """
+    Returns
+    -------
+    True if n is a prime number, False otherwise. Numbers up to PRIMES_UPPER_BOUND are looked up in the sieve, larger ones are tested by Miller-Rabin with the first 12 primes as bases, which is deterministic for n < 3.3 * 10^24.
+    """
+    if n <= PRIMES_UPPER_BOUND:
+        return n in PRIMES_SET
+
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def previousPrime(n: int) -> int:
+    """
+    Returns
+    -------
+    The largest prime smaller than n.
+
+    Raises
+    ------
+    ValueError: If n is at most 2.
+    """
+    if n <= 2:
+        raise ValueError("There is no prime smaller than 2.")
+    n -= 1
+    while not isPrime(n):
+        n -= 1
+    return n
+
+
 sieveOfEratosthenes()
\ No newline at end of file
@@ -1,8 +1,14 @@
+from math import gcd, isfinite
+
+HASH_MODULUS = (1 << 61) - 1
+
 
 class rational:
     """
-    Fraction in reduced form with positive denominator
+    Fraction in reduced form with positive denominator. Immutable, attributes are stored in slots and set only by the constructor. Arithmetic keeps results reduced using the gcd saving tricks from Knuth's TAOCP 4.5.1, so the gcds are computed on the denominators and smaller cofactors instead of full products, and are skipped for integers. Arithmetic with float or complex gives float or complex, and comparisons with floats are exact.
     """ 
+    __slots__ = ('numerator', 'denominator')
+
     def __init__(self, numerator, denominator = 1):
         if denominator == 0:
             raise ValueError("Denominator cannot be zero")
@@ -11,36 +17,92 @@ class rational:
             numerator = round(numerator, 4)
             numerator = round(numerator * 10**4)
             denominator = 10**4
-            
-        def gcd(a: int, b: int) -> int:
-            while b != 0:
-                a, b = b, a % b
-            return a
-        
-        d = gcd(numerator, denominator)
-        numerator //= d
-        denominator //= d
 
-        if denominator < 0:
-            numerator = -numerator
-            denominator = -denominator
+        if denominator != 1:
+            d = gcd(numerator, denominator)
+            if denominator < 0:
+                d = -d
+            if d != 1:
+                numerator //= d
+                denominator //= d
 
-        object.__setattr__(self, '_initialized', False)
         object.__setattr__(self, 'numerator', numerator)
         object.__setattr__(self, 'denominator', denominator)
-        object.__setattr__(self, '_initialized', True)
+
+
+    @staticmethod
+    def _make(numerator: int, denominator: int) -> 'rational':
+        """
+        Builds a rational from a numerator and a positive denominator which are already coprime, without normalization.
+        """
+        result = object.__new__(rational)
+        object.__setattr__(result, 'numerator', numerator)
+        object.__setattr__(result, 'denominator', denominator)
+        return result
+
+
+    @staticmethod
+    def _add(a: int, b: int, c: int, d: int) -> 'rational':
+        """
+        Returns
+        -------
+        a/b + c/d for reduced fractions with positive denominators. Only gcd(b, d) and the gcd of the numerator with it are needed, because the result a*(d/g) + c*(b/g) over b*(d/g) can only share factors of g.
+        """
+        if b == 1:
+            return rational._make(a * d + c, d)
+        elif d == 1:
+            return rational._make(a + c * b, b)
+        g = gcd(b, d)
+        if g == 1:
+            return rational._make(a * d + c * b, b * d)
+        s = b // g
+        t = a * (d // g) + c * s
+        g = gcd(t, g)
+        if g == 1:
+            return rational._make(t, s * d)
+        return rational._make(t // g, s * (d // g))
+
+
+    @staticmethod
+    def _multiply(a: int, b: int, c: int, d: int) -> 'rational':
+        """
+        Returns
+        -------
+        a/b * c/d for reduced fractions with positive denominators. Cross gcds gcd(a, d) and gcd(c, b) are cancelled before multiplying, so the result is reduced.
+        """
+        if b == 1 and d == 1:
+            return rational._make(a * c, 1)
+        g1 = gcd(a, d) if d != 1 else 1
+        g2 = gcd(c, b) if b != 1 else 1
+        if g1 != 1:
+            a //= g1
+            d //= g1
+        if g2 != 1:
+            c //= g2
+            b //= g2
+        return rational._make(a * c, b * d)
 
 
     def __setattr__(self, name, value):
-        if self.__dict__.get('_initialized', False):
-            raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
-        super().__setattr__(name, value)
+        raise AttributeError(f"{self.__class__.__name__} does not support attribute assignment")
 
 
     def __delattr__(self, name):
         raise AttributeError(f"{self.__class__.__name__} does not support attribute deletion")
 
 
+    def __reduce__(self):
+        return (rational, (self.numerator, self.denominator))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
     def __str__(self):
         if self.denominator == 1:
             return f"{self.numerator}" 
@@ -58,7 +120,12 @@ class rational:
         elif isinstance(other, int):
             return self.numerator == other and self.denominator == 1
         elif isinstance(other, float):
-            return (self.numerator / self.denominator - other) < 0.0001 
+            if not isfinite(other):
+                return False
+            numerator, denominator = other.as_integer_ratio()
+            return self.numerator * denominator == numerator * self.denominator
+        elif isinstance(other, complex):
+            return other.imag == 0 and self == other.real
         else:
             return False
     
@@ -72,16 +139,16 @@ class rational:
 
     
     def __neg__(self):
-        return rational(-self.numerator, self.denominator)
+        return rational._make(-self.numerator, self.denominator)
      
     
     def __add__(self, other):
         if isinstance(other, rational):
-            return rational(self.numerator * other.denominator + other.numerator * self.denominator, self.denominator * other.denominator)
+            return rational._add(self.numerator, self.denominator, other.numerator, other.denominator)
         elif isinstance(other, int):
-            return rational(self.numerator + other * self.denominator, self.denominator)
-        elif isinstance(other, float):
-            return self + rational(other)
+            return rational._make(self.numerator + other * self.denominator, self.denominator)
+        elif isinstance(other, (float, complex)):
+            return float(self) + other
         else:
             return NotImplemented
     
@@ -95,24 +162,36 @@ class rational:
 
 
     def __sub__(self, other):
-        return self + (-other)
+        if isinstance(other, rational):
+            return rational._add(self.numerator, self.denominator, -other.numerator, other.denominator)
+        elif isinstance(other, int):
+            return rational._make(self.numerator - other * self.denominator, self.denominator)
+        elif isinstance(other, (float, complex)):
+            return float(self) - other
+        else:
+            return NotImplemented
     
     
     def __rsub__(self, other):
-        return -self + other
+        if isinstance(other, int):
+            return rational._make(other * self.denominator - self.numerator, self.denominator)
+        elif isinstance(other, (float, complex)):
+            return other - float(self)
+        else:
+            return NotImplemented
     
     
     def __isub__(self, other):
-        return self + (-other)
+        return self - other
     
     
     def __mul__(self, other):
         if isinstance(other, rational):
-            return rational(self.numerator * other.numerator, self.denominator * other.denominator)
+            return rational._multiply(self.numerator, self.denominator, other.numerator, other.denominator)
         elif isinstance(other, int):
-            return rational(self.numerator * other, self.denominator)
-        elif isinstance(other, float):
-            return self * rational(other)
+            return rational._multiply(self.numerator, self.denominator, other, 1)
+        elif isinstance(other, (float, complex)):
+            return float(self) * other
         else:
             return NotImplemented
         
@@ -127,18 +206,26 @@ class rational:
     
     def __truediv__(self, other):
         if isinstance(other, rational) and other.numerator != 0:
-            return self * rational(other.denominator, other.numerator)
+            if other.numerator < 0:
+                return rational._multiply(self.numerator, self.denominator, -other.denominator, -other.numerator)
+            return rational._multiply(self.numerator, self.denominator, other.denominator, other.numerator)
         elif isinstance(other, int) and other != 0:
-            return self * rational(1, other)
-        elif isinstance(other, float) and abs(other) > 0.0001:
-            self /= rational(other)
-            return self
+            if other < 0:
+                return rational._multiply(self.numerator, self.denominator, -1, -other)
+            return rational._multiply(self.numerator, self.denominator, 1, other)
+        elif isinstance(other, (float, complex)) and other != 0:
+            return float(self) / other
         else:
             return NotImplemented
         
 
     def __rtruediv__(self, other):
-        return rational(other) / self
+        if isinstance(other, int):
+            return rational(other) / self
+        elif isinstance(other, (float, complex)):
+            return other / float(self)
+        else:
+            return NotImplemented
     
 
     def __itruediv__(self, other):
@@ -149,22 +236,14 @@ class rational:
         if not isinstance(other, int):
             raise TypeError(f"Exponentiation is only supported with integer exponents and {other} is type {type(other)}")
 
-        if other == 0:
-            return rational(1)
-        elif other < 0:
-            self = rational(1) / self
-            other = -other
-
-        result = 1
-        base = rational(self.numerator, self.denominator)
-
-        while other > 0:
-            if other % 2 == 1:
-                result *= base
-            base *= base
-            other //= 2
-
-        return result
+        if other >= 0:
+            return rational._make(self.numerator ** other, self.denominator ** other)
+        elif self.numerator == 0:
+            raise ZeroDivisionError("Cannot raise zero to a negative power")
+        elif self.numerator < 0:
+            return rational._make((-self.denominator) ** -other, (-self.numerator) ** -other)
+        else:
+            return rational._make(self.denominator ** -other, self.numerator ** -other)
     
     
     def __ipow__(self, other):
@@ -175,7 +254,7 @@ class rational:
         if isinstance(other, rational):
             return self.numerator * other.denominator < other.numerator * self.denominator
         elif isinstance(other, int):
-            return self < rational(other, 1)
+            return self.numerator < other * self.denominator
         elif isinstance(other, float):
             return self.numerator / self.denominator < other
         else:
@@ -186,7 +265,7 @@ class rational:
         if isinstance(other, rational):
             return self.numerator * other.denominator <= other.numerator * self.denominator
         elif isinstance(other, int):
-            return self <= rational(other, 1)
+            return self.numerator <= other * self.denominator
         elif isinstance(other, float):
             return self.numerator / self.denominator <= other
         else:
@@ -197,7 +276,7 @@ class rational:
         if isinstance(other, rational):
             return self.numerator * other.denominator > other.numerator * self.denominator
         elif isinstance(other, int):
-            return self > rational(other, 1)
+            return self.numerator > other * self.denominator
         elif isinstance(other, float):
             return self.numerator / self.denominator > other
         else:
@@ -208,7 +287,7 @@ class rational:
         if isinstance(other, rational):
             return self.numerator * other.denominator >= other.numerator * self.denominator
         elif isinstance(other, int):
-            return self >= rational(other, 1)
+            return self.numerator >= other * self.denominator
         elif isinstance(other, float):
             return self.numerator / self.denominator >= other
         else:
@@ -216,7 +295,7 @@ class rational:
     
     
     def __abs__(self):
-        return rational(abs(self.numerator), self.denominator)
+        return rational._make(abs(self.numerator), self.denominator)
 
 
     def __float__(self):
@@ -228,9 +307,18 @@ class rational:
 
 
     def __hash__(self):
-        return hash((self.numerator, self.denominator))
-    
-
-    def __copy__(self):
-        return rational(self.numerator, self.denominator)
-    
\ No newline at end of file
+        """
+        Returns
+        -------
+        The same hash as int and fractions.Fraction with equal value, so rationals equal to integers are interchangeable as dictionary keys.
+        """
+        if self.denominator == 1:
+            return hash(self.numerator)
+        try:
+            inverse = pow(self.denominator, -1, HASH_MODULUS)
+        except ValueError:
+            result = hash(float('inf'))
+        else:
+            result = hash(hash(abs(self.numerator)) * inverse)
+        result = result if self.numerator >= 0 else -result
+        return -2 if result == -1 else result
@@ -0,0 +1,246 @@
+import heapq
+from itertools import islice, count
+from typing import Callable
+from tqdm import tqdm
+from .polynomial import Polynomial, Monomial
+from .monomialOrders import lexOrder, monomialSortKey
+from .polynomialAccumulator import PolynomialAccumulator
+from .buchberger import polynomialReduce
+
+
+class SignatureEngine:
+    """
+    Signature-based Groebner basis algorithm in the incremental F5 setting. Every basis element g = sum a_i f_i carries the signature m * e_i of the largest term of (a_1, ..., a_n) in the position over term order: signatures compare by the index i first and by the monomial order on m second. Generators are added one at a time, the basis of f_1, ..., f_i is completed before f_{i+1} is added.
+
+    Critical pairs are processed in increasing order of their signature and S-polynomials are reduced only by regular reductions, which do not change the signature. A pair with signature s is discarded without reduction by:
+    - the syzygy criterion if s is divisible by the signature of a known syzygy, either a principal syzygy LM(g) * e_i with g of a smaller index or a signature whose S-polynomial reduced to zero,
+    - the rewrite criterion if s is divisible by the signature of a basis element added after the element the pair multiplies.
+
+    After the regular reduction a polynomial whose leading term is divisible by the leading term of an element with the same signature is discarded by the singular criterion. For a regular sequence no S-polynomial reduces to zero.
+
+    Attributes
+    ----------
+    polynomials : basis elements in the order they were found.
+    signatures : signatures (i, m) of the basis elements.
+    syzygies : signatures of S-polynomials that reduced to zero.
+    pairs : heap of pending critical pairs (key, k, counter, multiplier, signature) standing for multiplier * polynomials[k].
+    statistics : numbers of 'pairs' considered, 'reductions', 'zeroReductions', pairs discarded by 'syzygyCriterion', 'rewriteCriterion' and 'singularCriterion', and 'avoidedReductions' by the first two.
+    """
+    def __init__(self, permutation: list[str], order: Callable = lexOrder):
+        self.permutation = permutation
+        self.order = order
+        self.sortKey = monomialSortKey(permutation, order)
+        self.domain = None
+        self.polynomials = []
+        self.leadingMonomials = []
+        self.signatures = []
+        self.syzygies = []
+        self.pairs = []
+        self._counter = count()
+        self.generators = []
+        self.index = 0
+        self.previous = 0
+        self.statistics = {'pairs': 0, 'reductions': 0, 'zeroReductions': 0, 'syzygyCriterion': 0, 'rewriteCriterion': 0, 'singularCriterion': 0, 'avoidedReductions': 0}
+
+
+    def signatureKey(self, signature: tuple[int, Monomial]) -> tuple:
+        """
+        Returns
+        -------
+        The key of a signature (i, m) in the position over term order.
+        """
+        return (signature[0], self.sortKey(signature[1]))
+
+
+    def addPolynomials(self, F: list[Polynomial]) -> None:
+        """
+        Queues generators, zero polynomials are skipped. They get the next indices and are processed by run.
+        """
+        for f in F:
+            if self.domain is None:
+                self.domain = f.domain
+            if not f.isZeroPolynomial():
+                self.generators.append(f)
+
+
+    def isSyzygySignature(self, signature: tuple[int, Monomial]) -> bool:
+        """
+        Returns
+        -------
+        True if the signature is divisible by the signature of a known syzygy.
+        """
+        index, m = signature
+        leadingMonomials = self.leadingMonomials
+        if any(leadingMonomials[k].divides(m) for k in range(self.previous)):
+            return True
+        return any(i == index and syzygy.divides(m) for i, syzygy in self.syzygies)
+
+
+    def isRewritable(self, signature: tuple[int, Monomial], k: int) -> bool:
+        """
+        Returns
+        -------
+        True if the signature is divisible by the signature of a basis element added after polynomials[k].
+        """
+        index, m = signature
+        return any(i == index and other.divides(m) for i, other in islice(self.signatures, k + 1, None))
+
+
+    def addElement(self, h: Polynomial, signature: tuple[int, Monomial]) -> None:
+        """
+        Adds a monic polynomial h with given signature to the basis and queues its critical pairs with all earlier elements. Pairs whose two multiples have the same signature are dropped.
+        """
+        t = len(self.polynomials)
+        m = h.leadingTerm(self.permutation, self.order)[0]
+        self.polynomials.append(h)
+        self.leadingMonomials.append(m)
+        self.signatures.append(signature)
+        for k in range(t):
+            lcm = Monomial.leastCommonMultiple(self.leadingMonomials[k], m)
+            u = lcm / m
+            v = lcm / self.leadingMonomials[k]
+            first = (signature[0], u * signature[1])
+            second = (self.signatures[k][0], v * self.signatures[k][1])
+            firstKey = self.signatureKey(first)
+            secondKey = self.signatureKey(second)
+            if firstKey > secondKey:
+                heapq.heappush(self.pairs, (firstKey, t, next(self._counter), u, first))
+            elif secondKey > firstKey:
+                heapq.heappush(self.pairs, (secondKey, k, next(self._counter), v, second))
+
+
+    def regularReduce(self, f: Polynomial, key: tuple) -> Polynomial:
+        """
+        Reduces f of signature with given key by the basis elements g with multiples u * g of smaller signature.
+
+        Returns
+        -------
+        The monic remainder, the zero polynomial or None if the leading term is divisible by a multiple of a basis element of the same signature.
+        """
+        domain = self.domain
+        sortKey = self.sortKey
+        leadingMonomials = self.leadingMonomials
+        signatures = self.signatures
+        terms = [g.sortedTerms(self.permutation, self.order) for g in self.polynomials]
+        inverses = [domain.inv(g[0][1]) for g in terms]
+        p = PolynomialAccumulator(f, self.permutation, self.order)
+        r = {}
+        top = True
+        while True:
+            term = p.popLeadingTerm()
+            if term is None:
+                break
+            monomial, coefficient = term
+            reduced = False
+            singular = False
+            for k, leading in enumerate(leadingMonomials):
+                if not leading.divides(monomial):
+                    continue
+                u = monomial / leading
+                index, m = signatures[k]
+                reducerKey = (index, sortKey(u * m))
+                if reducerKey < key:
+                    p.subtractMultiple(domain.mul(coefficient, inverses[k]), u, islice(terms[k], 1, None))
+                    reduced = True
+                    break
+                singular = singular or reducerKey == key
+            if top and not reduced and singular:
+                return None
+            if not reduced:
+                r[monomial] = coefficient
+                top = False
+        h = Polynomial(r, domain)
+        m, c = h.leadingTerm(self.permutation, self.order)
+        if m is None:
+            return h
+        return h.multiplyByTerm(m / m, domain.inv(c))
+
+
+    def step(self) -> Polynomial:
+        """
+        Processes the pair of the smallest signature.
+
+        Returns
+        -------
+        The new basis element or None if the pair was discarded or reduced to zero.
+        """
+        key, k, _, u, signature = heapq.heappop(self.pairs)
+        statistics = self.statistics
+        statistics['pairs'] += 1
+        while self.pairs and self.pairs[0][0] == key and self.pairs[0][1] == k:
+            heapq.heappop(self.pairs)
+        if self.isSyzygySignature(signature):
+            statistics['syzygyCriterion'] += 1
+            statistics['avoidedReductions'] += 1
+            return None
+        if self.isRewritable(signature, k):
+            statistics['rewriteCriterion'] += 1
+            statistics['avoidedReductions'] += 1
+            return None
+        statistics['reductions'] += 1
+        h = self.regularReduce(self.polynomials[k].multiplyByTerm(u, self.domain.one()), key)
+        if h is None:
+            statistics['singularCriterion'] += 1
+            return None
+        if h.isZeroPolynomial():
+            statistics['zeroReductions'] += 1
+            self.syzygies.append(signature)
+            return None
+        self.addElement(h, signature)
+        return h
+
+
+    def addGenerator(self, f: Polynomial) -> None:
+        """
+        Starts the next index with the generator f reduced by the current basis, whose signatures are all smaller.
+        """
+        self.index += 1
+        self.previous = len(self.polynomials)
+        self.statistics['reductions'] += 1
+        _, h = polynomialReduce(f, self.polynomials, self.permutation, self.order) if self.polynomials else (None, f)
+        m, c = h.leadingTerm(self.permutation, self.order)
+        if m is None:
+            self.statistics['zeroReductions'] += 1
+            return
+        self.addElement(h.multiplyByTerm(m / m, self.domain.inv(c)), (self.index, m / m))
+
+
+    def run(self) -> None:
+        """
+        Adds the queued generators one at a time and processes all pairs after each, then the basis is a Groebner basis.
+        """
+        progress = tqdm(total=len(self.generators))
+        while self.generators:
+            self.addGenerator(self.generators.pop(0))
+            while self.pairs:
+                self.step()
+            progress.update(1)
+        progress.close()
+
+
+    def basis(self) -> list[Polynomial]:
+        """
+        Returns
+        -------
+        The basis elements whose leading monomials are not divisible by the leading monomial of another element.
+        """
+        leadingMonomials = self.leadingMonomials
+        basis = []
+        for k, m in enumerate(leadingMonomials):
+            if not any(leadingMonomials[j].divides(m) and (leadingMonomials[j] != m or j < k) for j in range(len(leadingMonomials)) if j != k):
+                basis.append(self.polynomials[k])
+        return basis
+
+
+def signatureGroebnerBasis(Basis: list[Polynomial], permutation: list[str], order: Callable = lexOrder, statistics: dict = None) -> list[Polynomial]:
+    """
+    Returns
+    -------
+    A Groebner basis of the ideal generated by Basis computed by SignatureEngine, it is not reduced. If statistics is a dict, it is updated with the statistics of the engine.
+    """
+    engine = SignatureEngine(permutation, order)
+    engine.addPolynomials(Basis)
+    engine.run()
+    if statistics is not None:
+        statistics.update(engine.statistics)
+    return engine.basis()
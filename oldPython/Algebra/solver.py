@@ -2,12 +2,13 @@
 import itertools
 import numpy as np
 from .polynomialMethods import embed
-from .monomialOrders import lexOrder
+from .monomialOrders import lexOrder, gradedRevLexOrder
 from .rational import rational
 from .galoisField import GaloisField
 from .polynomial import Polynomial
 from .modularArithmetic import integerLCM, divisors
 from .groebnerBasis import getGroebnerBasis
+from .fglm import fglm, isZeroDimensional
 
 def findRoots(f: Polynomial) -> list:
     """
@@ -140,7 +141,7 @@ def solveSystem(F: list[Polynomial], field = None, prime = None) -> list[tuple]:
 
     
     variables = sorted(list(set(sum([f.getVariables for f in F], []))))
-    G = getGroebnerBasis(F, variables, order=lexOrder)
+    G = getGroebnerBasis(F, variables, order=lexOrder, algorithm='fglm')
     if field != F[0].field:
         G = [embed(g, field, prime) for g in G]
 
@@ -239,14 +240,19 @@ def characteristicEquations(F: list[Polynomial]) -> dict[str, Polynomial]:
     """
     Returns
     -------
-    For system of equations F returns the characteristic equations for each variable.
+    For system of equations F returns the characteristic equations for each variable. For a zero-dimensional system the graded reverse lexicographic basis is computed once and converted by fglm for every variable.
     """
     variables = sorted(list(set(sum([f.getVariables for f in F], []))))
+    B = getGroebnerBasis(F, variables, order=gradedRevLexOrder)
+    zeroDimensional = isZeroDimensional(B, variables, gradedRevLexOrder)
     result = {}
     for var in variables:
         newPermutation = [v for v in variables if v != var]
         newPermutation += [var]
-        G = getGroebnerBasis(F, newPermutation, order=lexOrder)
+        if zeroDimensional:
+            G = fglm(B, variables, gradedRevLexOrder, newPermutation, lexOrder)
+        else:
+            G = getGroebnerBasis(F, newPermutation, order=lexOrder)
         H = [g for g in G if g.getVariables == [var]]
         if len(H) == 0:
             return "Characteristic equations do not exist."
@@ -29,7 +29,7 @@ def polynomialImplicitization(F: dict[str, Polynomial]) -> list[Polynomial]:
     parameters = list(set(sum([f.getVariables for f in F.values()], [])))
     variables = list(F.keys())
     coordinates = [defineVariable(var) for var in variables]
-    G = getGroebnerBasis([f - var for f, var in zip(F.values(), coordinates)], parameters + variables, lexOrder)
+    G = getGroebnerBasis([f - var for f, var in zip(F.values(), coordinates)], parameters + variables, lexOrder, algorithm='walk')
     H = Ideal.eliminationIdeal(G, variables)
     return [normalizeCoefficients(h, toIntegers=True) for h in H]
 
@@ -57,7 +57,7 @@ def rationalImplicitization(F: dict[str, RationalFunction]) -> list[RationalFunc
     for f in F.values():
         prod *= f.denominator
     prod = 1 - prod
-    G = getGroebnerBasis([f.numerator - var * f.denominator for f, var in zip(F.values(), coordinates)] + [prod], [Monomial.DUMMY] + parameters + variables, lexOrder)
+    G = getGroebnerBasis([f.numerator - var * f.denominator for f, var in zip(F.values(), coordinates)] + [prod], [Monomial.DUMMY] + parameters + variables, lexOrder, algorithm='walk')
     H = Ideal.eliminationIdeal(G, variables)
     return [normalizeCoefficients(h, toIntegers=True) for h in H]
 
@@ -0,0 +1,52 @@
+import random
+import tracemalloc
+from Algebra import Monomial, PackedMonomial, VariableLayout, Polynomial, rational, GaloisField
+
+
+VARIABLES = ['x', 'y', 'z', 'u', 'v', 'w']
+TERMS = 100000
+
+
+def randomExponents() -> tuple[int]:
+    return tuple(random.randint(0, 9) for _ in VARIABLES)
+
+
+def genericTerms(coefficient):
+    for _ in range(TERMS):
+        yield Monomial(dict(zip(VARIABLES, randomExponents()))), coefficient()
+
+
+def packedTerms(coefficient):
+    layout = VariableLayout(VARIABLES)
+    for _ in range(TERMS):
+        yield PackedMonomial(randomExponents(), layout), coefficient()
+
+
+def rationalCoefficient() -> rational:
+    return rational(random.randint(-1000, 1000) or 1, random.randint(1, 1000))
+
+
+def galoisFieldCoefficient() -> GaloisField:
+    return GaloisField(random.randint(1, 996), 997)
+
+
+def bytesPerTerm(terms) -> float:
+    """
+    Returns
+    -------
+    Memory allocated per term by the polynomial built from given terms, including its monomials and coefficients.
+    """
+    random.seed(0)
+    tracemalloc.start()
+    polynomial = Polynomial(dict(terms))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(polynomial.coefficients)
+
+
+if __name__ == "__main__":
+    for name, terms, coefficient in [('Monomial, rational', genericTerms, rationalCoefficient),
+                                     ('Monomial, GaloisField', genericTerms, galoisFieldCoefficient),
+                                     ('PackedMonomial, rational', packedTerms, rationalCoefficient),
+                                     ('PackedMonomial, GaloisField', packedTerms, galoisFieldCoefficient)]:
+        print(f"{name:30} {bytesPerTerm(terms(coefficient)):8.1f} bytes per term")
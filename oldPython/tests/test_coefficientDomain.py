@@ -0,0 +1,22 @@
+from Algebra import *
+
+
+def test_integerCoefficientsAreRational():
+    x = defineVariable("x")
+    y = defineVariable("y")
+    f = Polynomial({Monomial({'x': 2}): 2, Monomial({'y': 1}): 3})
+    g = Polynomial({Monomial({'x': 1}): 2, Monomial({}): -1})
+    assert f.field == rational
+    assert f * rational(1, 2) == x**2 + rational(3, 2) * y
+    assert polynomialReduce(f, [g], ['x', 'y'])[1] == 3 * y + rational(1, 2)
+    assert getGroebnerBasis([f, g], ['x', 'y']) == [x - rational(1, 2), y + rational(1, 6)]
+
+
+def test_floatsConvertExactly():
+    x = defineVariable("x")
+    assert (x * 0.12345).coefficients[Monomial({'x': 1})] == rational(*(0.12345).as_integer_ratio())
+
+
+def test_integerDomainOnlyWhenExplicit():
+    assert coefficientDomain(int) == RationalDomain()
+    assert Polynomial({Monomial({'x': 1}): 2}, IntegerDomain()).domain == IntegerDomain()